@@ -0,0 +1,84 @@
+"""
+Import-time benchmark for the core simulation path.
+
+Every core module is imported in a fresh interpreter, as a short-lived pool worker
+would. The benchmark reports the median import time and fails if an optional
+heavy dependency was loaded or the time budget was exceeded.
+
+    python benchmarks/import_time.py --budget-ms 1000 --repeats 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import List, Optional
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules a rollout worker needs, which must import with only Box2D and NumPy
+CORE_MODULES = (
+    "interphyre.engine",
+    "interphyre.level",
+    "interphyre.levels",
+    "interphyre.evaluate",
+    "interphyre.parallel",
+    "interphyre.trajectory",
+    "interphyre.render",
+)
+
+# Dependencies that may only be loaded when their feature is used
+OPTIONAL_MODULES = ("gymnasium", "pygame", "cv2", "torch", "matplotlib")
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+loaded = [name for name in {optional!r} if name in sys.modules]
+print(json.dumps({{"elapsed": elapsed, "loaded": loaded}}))
+"""
+
+
+def measure(module: str) -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [REPO_ROOT] + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else [])
+    )
+    code = PROBE.format(module=module, optional=OPTIONAL_MODULES)
+    output = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Core import-time benchmark")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument(
+        "--budget-ms", type=float, default=1000.0, help="Maximum median import time"
+    )
+    args = parser.parse_args(argv)
+
+    failures = []
+    for module in CORE_MODULES:
+        runs = [measure(module) for _ in range(args.repeats)]
+        median_ms = 1000 * statistics.median(run["elapsed"] for run in runs)
+        loaded = sorted({name for run in runs for name in run["loaded"]})
+        print(f"{module:28s} {median_ms:8.1f} ms  optional loaded: {loaded or '-'}")
+        if loaded:
+            failures.append(f"{module} loads optional dependencies {loaded}")
+        if median_ms > args.budget_ms:
+            failures.append(
+                f"{module} takes {median_ms:.0f} ms, over the {args.budget_ms:.0f} ms budget"
+            )
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
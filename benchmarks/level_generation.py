@@ -0,0 +1,167 @@
+"""
+Level generation profiler.
+
+Builds a range of seeds of every registered level and reports, per level, the
+builder wall time, the rejection loop attempts recorded by the builder in
+metadata["generation_attempts"], the seeds that failed to build, the seeds whose
+layout fails validation (see Level.validate), and the spread of every generated
+parameter that varies between seeds.
+
+    python benchmarks/level_generation.py --seeds 200
+    python benchmarks/level_generation.py --levels seesaw two_body_problem --params
+    python benchmarks/level_generation.py --json report.json --max-ms 50 --strict
+
+Exits with status 1 if a seed failed to build, the slowest seed of a level
+took longer than --max-ms, or with --strict, a seed failed validation.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from interphyre.levels import list_levels, load_level  # noqa: E402
+from interphyre.objects import SIZE_FIELDS, ObjectTable  # noqa: E402
+from interphyre.validation import validate_table  # noqa: E402
+
+# Numeric ObjectTable columns included in the parameter report
+PARAMETER_COLUMNS = ("x", "y", "angle") + SIZE_FIELDS
+
+
+def profile_level(name: str, seeds: range) -> dict:
+    times: List[float] = []
+    attempts: List[int] = []
+    tables: List[ObjectTable] = []
+    errors: Dict[int, str] = {}
+    for seed in seeds:
+        start = time.perf_counter()
+        try:
+            level = load_level(name, seed)
+        except Exception as e:
+            errors[seed] = f"{type(e).__name__}: {e}"
+            continue
+        times.append(time.perf_counter() - start)
+        attempts.append((level.metadata or {}).get("generation_attempts", 1))
+        tables.append(level.to_table())
+
+    built = [seed for seed in seeds if seed not in errors]
+    times_ms = 1000 * np.array(times)
+    attempts_arr = np.array(attempts)
+    table = ObjectTable.concatenate(tables) if built else None
+    valid = validate_table(table) if built else np.ones(0, dtype=bool)
+    report = {
+        "level": name,
+        "seeds": len(seeds),
+        "errors": errors,
+        "total_ms": float(times_ms.sum()),
+        "mean_ms": float(times_ms.mean()) if built else None,
+        "max_ms": float(times_ms.max()) if built else None,
+        "slowest_seed": built[int(times_ms.argmax())] if built else None,
+        "mean_attempts": float(attempts_arr.mean()) if built else None,
+        "max_attempts": int(attempts_arr.max()) if built else None,
+        "rejection_rate": (
+            float(1 - len(attempts_arr) / attempts_arr.sum()) if built else None
+        ),
+        "invalid_seeds": [seed for seed, ok in zip(built, valid) if not ok],
+        "parameters": parameter_stats(table) if built else {},
+    }
+    return report
+
+
+def parameter_stats(table: ObjectTable) -> Dict[str, dict]:
+    """Min, mean and max of every parameter that is not the same for all seeds."""
+    stats = {}
+    for obj_name in dict.fromkeys(table.names.tolist()):
+        rows = table.names == obj_name
+        for column in PARAMETER_COLUMNS:
+            values = getattr(table, column)[rows]
+            if np.ptp(values) == 0:
+                continue
+            stats[f"{obj_name}.{column}"] = {
+                "min": float(values.min()),
+                "mean": float(values.mean()),
+                "max": float(values.max()),
+            }
+    return stats
+
+
+def print_report(reports: List[dict], show_params: bool):
+    print(
+        f"{'level':24s} {'mean ms':>8s} {'max ms':>8s} {'slowest':>8s} "
+        f"{'attempts':>9s} {'max att':>8s} {'reject':>7s} {'errors':>7s} {'invalid':>8s}"
+    )
+    for r in reports:
+        if r["mean_ms"] is None:
+            print(f"{r['level']:24s} {'-':>8s} {'-':>8s} {'-':>8s} {'-':>9s} "
+                  f"{'-':>8s} {'-':>7s} {len(r['errors']):7d} {'-':>8s}")
+            continue
+        print(
+            f"{r['level']:24s} {r['mean_ms']:8.2f} {r['max_ms']:8.2f} "
+            f"{r['slowest_seed']:8d} {r['mean_attempts']:9.2f} "
+            f"{r['max_attempts']:8d} {r['rejection_rate']:7.1%} {len(r['errors']):7d} "
+            f"{len(r['invalid_seeds']):8d}"
+        )
+    for r in reports:
+        for seed, error in r["errors"].items():
+            print(f"  {r['level']} seed {seed}: {error}")
+    if show_params:
+        for r in reports:
+            print(f"\n{r['level']}")
+            for param, s in r["parameters"].items():
+                print(
+                    f"  {param:32s} min {s['min']:8.3f}  mean {s['mean']:8.3f}  "
+                    f"max {s['max']:8.3f}"
+                )
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Level generation profiler")
+    parser.add_argument("--levels", nargs="*", help="Levels to profile (default: all)")
+    parser.add_argument("--seeds", type=int, default=100, help="Number of seeds")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument(
+        "--params", action="store_true", help="Print the parameter distributions"
+    )
+    parser.add_argument("--json", help="Write the full report to this file")
+    parser.add_argument(
+        "--max-ms", type=float, help="Fail if any seed takes longer to build"
+    )
+    parser.add_argument(
+        "--strict", action="store_true", help="Fail if any seed fails validation"
+    )
+    args = parser.parse_args(argv)
+
+    seeds = range(args.first_seed, args.first_seed + args.seeds)
+    reports = [profile_level(name, seeds) for name in args.levels or list_levels()]
+    print_report(reports, args.params)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(reports, f, indent=2)
+
+    failures = []
+    for r in reports:
+        if r["errors"]:
+            failures.append(f"{r['level']} failed to build {len(r['errors'])} seeds")
+        if args.strict and r["invalid_seeds"]:
+            failures.append(
+                f"{r['level']} has {len(r['invalid_seeds'])} invalid seeds, "
+                f"e.g. {r['invalid_seeds'][:5]}"
+            )
+        if args.max_ms is not None and r["max_ms"] is not None and r["max_ms"] > args.max_ms:
+            failures.append(
+                f"{r['level']} seed {r['slowest_seed']} takes {r['max_ms']:.1f} ms, "
+                f"over the {args.max_ms:.0f} ms budget"
+            )
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
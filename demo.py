@@ -39,9 +39,9 @@ def main():
         obs, reward, done, truncated, info = env.step(action)
 
         # Run additional simulation steps (if needed).
-        trace = env.simulate(steps=500, return_trace=True)
+        env.simulate(steps=500)
 
-        if trace[-1][1]:
+        if env.engine.is_success():
             print(f"Success!")
             break
 
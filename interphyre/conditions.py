@@ -0,0 +1,102 @@
+"""
+Declarative success conditions.
+
+A level's success_condition can be any function(engine) -> bool. The conditions
+in this module are also callable that way, but they additionally declare the
+contact pairs they depend on and compile to a check bound to one engine. This
+lets the engine track only those pairs without probing the condition, and
+evaluate success without going through the generic contact query API.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Optional, Tuple, Type
+
+
+class SuccessCondition(ABC):
+    """Base class of declarative success conditions."""
+
+    @abstractmethod
+    def contact_pairs(self) -> Tuple[Tuple[str, str], ...]:
+        """Pairs of body names whose contacts the condition depends on."""
+        pass
+
+    def compile(self, engine) -> Callable[[], bool]:
+        """Return a check of the condition bound to the current world of engine."""
+        return lambda: self(engine)
+
+    @abstractmethod
+    def __call__(self, engine) -> bool:
+        """Evaluate the condition on the current state of engine."""
+        pass
+
+    def to_dict(self) -> dict:
+        return {"type": type(self).__name__, **asdict(self)}
+
+
+@dataclass(frozen=True)
+class ContactFor(SuccessCondition):
+    """
+    Bodies a and b have been in contact for a total of duration seconds.
+
+    A duration of None uses the engine's default_success_time.
+    """
+
+    a: str
+    b: str
+    duration: Optional[float] = None
+
+    def contact_pairs(self) -> Tuple[Tuple[str, str], ...]:
+        return ((self.a, self.b),)
+
+    def compile(self, engine) -> Callable[[], bool]:
+        listener = engine.contact_listener
+        pair_id = listener.Track(self.a, self.b)
+        duration = self.duration
+
+        # Same arithmetic as GoalContactListener.IsInContactForDuration
+        def check() -> bool:
+            steps = listener.contact_steps[pair_id]
+            if listener.touching[pair_id]:
+                steps += listener.step_count - listener.start_step[pair_id]
+            required = engine.default_success_time if duration is None else duration
+            return steps * listener.time_step >= required
+
+        return check
+
+    def __call__(self, engine) -> bool:
+        return engine.is_in_contact_for_duration(self.a, self.b, self.duration)
+
+
+@dataclass(frozen=True)
+class InBasket(SuccessCondition):
+    """The ball target is inside the basket, as detected by its sensor fixture."""
+
+    basket: str
+    target: str
+
+    def contact_pairs(self) -> Tuple[Tuple[str, str], ...]:
+        # Sensor overlaps are always counted, no contact pair is needed
+        return ()
+
+    def compile(self, engine) -> Callable[[], bool]:
+        listener = engine.contact_listener
+        key = (self.basket, self.target)
+        return lambda: key in listener.overlaps
+
+    def __call__(self, engine) -> bool:
+        return engine.is_in_basket_sensor(self.basket, self.target)
+
+
+CONDITION_TYPES: Dict[str, Type[SuccessCondition]] = {
+    cls.__name__: cls for cls in (ContactFor, InBasket)
+}
+
+
+def condition_from_dict(data: dict) -> SuccessCondition:
+    """Build a condition from a dict written by SuccessCondition.to_dict()."""
+    data = dict(data)
+    type_name = data.pop("type")
+    if type_name not in CONDITION_TYPES:
+        raise ValueError(f"Unknown success condition type '{type_name}'.")
+    return CONDITION_TYPES[type_name](**data)
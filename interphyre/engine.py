@@ -1,5 +1,14 @@
-from Box2D import b2World, b2ContactListener, b2Contact, b2_pi
-from typing import Any, Dict, List, Tuple, Optional, Union
+from Box2D import (
+    b2World,
+    b2ContactListener,
+    b2Contact,
+    b2_dynamicBody,
+    b2_staticBody,
+)
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, List, Tuple, Optional, Union
+from interphyre.conditions import SuccessCondition
+from interphyre.geometry import points_in_basket, points_in_polygon
 from interphyre.level import Level
 from interphyre.objects import (
     Ball,
@@ -11,96 +20,318 @@ from interphyre.objects import (
     create_bar,
     create_walls,
 )
+import copy
+import itertools
 import math
+import numpy as np
+
+WALL_NAMES = ("left_wall", "right_wall", "top_wall", "bottom_wall")
+
+# Source of Box2DEngine.static_version values, unique across engines
+_static_versions = itertools.count()
 
 
 class GoalContactListener(b2ContactListener):
+    """
+    Accumulates contact durations for pairs of named bodies.
+
+    Each tracked pair gets an integer id. Contact events only touch the counters of
+    tracked pairs, and Update() only advances the step counter, so the cost per step
+    does not depend on how many other bodies are touching. Durations are counted in
+    steps and converted with the latest time step, which assumes a fixed time step.
+
+    Contacts with sensor fixtures are not contacts between the bodies. They are
+    counted separately as overlaps of the sensor's body with the other body.
+    """
+
     def __init__(self):
         super().__init__()
-        self.contacts = set()
-        self.contact_duration = {}
-        self.contact_start_time = {}
-        self.current_time = 0
+        self.ClearContacts()
+
+    def TrackAll(self):
+        """Track every pair of named bodies that comes into contact."""
+        self.track_all = True
+
+    def TrackOnly(self, pairs=()):
+        """Only track the given (a, b) pairs. Pairs queried later are added then."""
+        self.track_all = False
+        for a, b in pairs:
+            self._pair_id(a, b)
+
+    def Track(self, a, b) -> int:
+        """Track a pair and return its id, an index into the counter lists."""
+        return self._pair_id(a, b)
+
+    def _pair_id(self, a, b) -> int:
+        pair_id = self.pair_ids.get((a, b))
+        if pair_id is None:
+            pair_id = len(self.pairs)
+            self.pair_ids[(a, b)] = pair_id
+            self.pair_ids[(b, a)] = pair_id
+            self.pairs.append((a, b))
+            self.touching.append(0)
+            self.start_step.append(0)
+            self.contact_steps.append(0)
+        return pair_id
 
     def BeginContact(self, contact: b2Contact):
-        a = contact.fixtureA.body.userData
-        b = contact.fixtureB.body.userData
-        if a and b:
-            contact_pair = frozenset((a, b))
-            self.contacts.add(contact_pair)
-            # Record start time of contact
-            self.contact_start_time[contact_pair] = self.current_time
-            # Initialize duration
-            if contact_pair not in self.contact_duration:
-                self.contact_duration[contact_pair] = 0
+        fixture_a, fixture_b = contact.fixtureA, contact.fixtureB
+        a = fixture_a.body.userData
+        b = fixture_b.body.userData
+        if fixture_a.sensor or fixture_b.sensor:
+            key = (a, b) if fixture_a.sensor else (b, a)
+            self.overlaps[key] = self.overlaps.get(key, 0) + 1
+            return
+        pair_id = self.pair_ids.get((a, b))
+        if pair_id is None:
+            if not (self.track_all and a and b):
+                return
+            pair_id = self._pair_id(a, b)
+        # Bodies with several fixtures can touch through more than one contact
+        if self.touching[pair_id] == 0:
+            self.start_step[pair_id] = self.step_count
+        self.touching[pair_id] += 1
 
     def EndContact(self, contact: b2Contact):
-        a = contact.fixtureA.body.userData
-        b = contact.fixtureB.body.userData
-        if a and b:
-            contact_pair = frozenset((a, b))
-            self.contacts.discard(contact_pair)
-            # When contact ends, update total duration
-            if contact_pair in self.contact_start_time:
-                duration = self.current_time - self.contact_start_time[contact_pair]
-                self.contact_duration[contact_pair] += duration
-                del self.contact_start_time[contact_pair]
+        fixture_a, fixture_b = contact.fixtureA, contact.fixtureB
+        a = fixture_a.body.userData
+        b = fixture_b.body.userData
+        if fixture_a.sensor or fixture_b.sensor:
+            key = (a, b) if fixture_a.sensor else (b, a)
+            count = self.overlaps.get(key, 0) - 1
+            if count > 0:
+                self.overlaps[key] = count
+            else:
+                self.overlaps.pop(key, None)
+            return
+        pair_id = self.pair_ids.get((a, b))
+        if pair_id is None or self.touching[pair_id] == 0:
+            return
+        self.touching[pair_id] -= 1
+        if self.touching[pair_id] == 0:
+            self.contact_steps[pair_id] += self.step_count - self.start_step[pair_id]
 
     def Update(self, dt):
-        """Update the current time and ongoing contact durations."""
+        """Advance the clock by one step."""
+        self.step_count += 1
         self.current_time += dt
-
-        # Update durations for ongoing contacts
-        for contact_pair in self.contacts:
-            if contact_pair in self.contact_start_time:
-                # Calculate current duration but don't reset start time
-                current_duration = (
-                    self.current_time - self.contact_start_time[contact_pair]
-                )
-                # Store the ongoing total duration
-                self.contact_duration[contact_pair] = (
-                    self.contact_duration.get(contact_pair, 0) + current_duration
-                )
-                # Reset start time to current time to avoid double counting
-                self.contact_start_time[contact_pair] = self.current_time
+        self.time_step = dt
+
+    def AnyTouching(self) -> bool:
+        """Check if any tracked pair is currently in contact."""
+        return any(self.touching)
+
+    def IsTouching(self, a, b) -> bool:
+        """Check if a tracked pair is currently in contact."""
+        pair_id = self.pair_ids.get((a, b))
+        return pair_id is not None and self.touching[pair_id] > 0
+
+    def IsOverlapping(self, sensor_body, other) -> bool:
+        """Check if a body overlaps a sensor fixture of the body named sensor_body."""
+        return (sensor_body, other) in self.overlaps
+
+    def GetContactSteps(self, a, b) -> int:
+        """Get the number of steps objects a and b have been in contact."""
+        pair_id = self.pair_ids.get((a, b))
+        if pair_id is None:
+            if not self.track_all:
+                # Start tracking pairs the first time they are queried
+                self._pair_id(a, b)
+            return 0
+        steps = self.contact_steps[pair_id]
+        if self.touching[pair_id]:
+            steps += self.step_count - self.start_step[pair_id]
+        return steps
 
     def GetContactDuration(self, a, b):
         """Get the total duration of contact between objects a and b."""
-        contact_pair = frozenset((a, b))
-        # Return total accumulated time
-        return self.contact_duration.get(contact_pair, 0)
+        return self.GetContactSteps(a, b) * self.time_step
 
     def IsInContactForDuration(self, a, b, required_duration):
         """Check if objects a and b have been in contact for at least the required duration."""
         return self.GetContactDuration(a, b) >= required_duration
 
+    def Snapshot(self) -> dict:
+        """
+        Copy the contact counters so they can be restored later.
+
+        Ongoing contacts are folded into the totals, since Box2D reports them
+        again with BeginContact on the first step after a restore.
+        """
+        contact_steps = [
+            steps + (self.step_count - start if touching else 0)
+            for steps, start, touching in zip(
+                self.contact_steps, self.start_step, self.touching
+            )
+        ]
+        return {
+            "pairs": list(self.pairs),
+            "contact_steps": contact_steps,
+            "step_count": self.step_count,
+            "current_time": self.current_time,
+            "time_step": self.time_step,
+            "track_all": self.track_all,
+        }
+
+    def Restore(self, state: dict):
+        """Restore contact counters copied by Snapshot()."""
+        self.ClearContacts()
+        self.track_all = state["track_all"]
+        for a, b in state["pairs"]:
+            self._pair_id(a, b)
+        self.contact_steps = list(state["contact_steps"])
+        self.step_count = state["step_count"]
+        self.current_time = state["current_time"]
+        self.time_step = state["time_step"]
+
     def ClearContacts(self):
-        """Clear all contacts and durations."""
-        self.contacts = set()
-        self.contact_duration = {}
-        self.contact_start_time = {}
+        """Clear all tracked pairs and counters."""
+        self.track_all = True
+        self.pair_ids = {}
+        self.pairs = []
+        self.touching = []
+        self.start_step = []
+        self.contact_steps = []
+        # Number of contacts between a sensor fixture of the first body and the second
+        self.overlaps = {}
+        self.step_count = 0
+        self.current_time = 0
+        self.time_step = 0.0
+
+
+@dataclass(frozen=True)
+class BodyState:
+    position: Tuple[float, float]
+    angle: float  # in radians
+    linear_velocity: Tuple[float, float]
+    angular_velocity: float
+    awake: bool
+
+
+@dataclass(frozen=True)
+class EngineSnapshot:
+    bodies: Dict[str, BodyState]
+    contacts: dict
 
 
 class Box2DEngine:
     def __init__(self, level: Optional[Level] = None):
 
-        self.world = b2World(gravity=(0, -10), doSleep=True)
+        self.gravity: Tuple[float, float] = (0, -10)
         self.contact_listener = GoalContactListener()
-        self.world.contactListener = self.contact_listener
-        self.stationary_world_tolerance: float = 0.0001
+        self.world = self._new_world()
+        # Number of consecutive steps without awake dynamic bodies before the
+        # world counts as stationary. Box2D already puts a body to sleep after
+        # it has been at rest for half a second.
+        self.stationary_steps: int = 10
+        self.quiet_steps: int = 0
+        self._dynamic_bodies: list = []
         self.default_success_time: float = 2.0
+        # Track every contact pair instead of only those the success condition uses
+        self.track_all_contacts: bool = False
+        # (width, height) of the images returned by get_state()
+        self.state_size: Tuple[int, int] = (600, 600)
+        self.state_renderer: Optional[Any] = None
+        self.level: Optional[Level] = None
+        # Check of the level's success condition, set up by reset()
+        self._success_check: Optional[Callable[[], bool]] = None
+        self._static_snapshot: Optional[Dict[str, PhyreObject]] = None
+        # Initial state of the walls and static bodies kept by a fast reset
+        self._static_states: Dict[str, BodyState] = {}
         self.reset(level)
 
-    def reset(self, level: Optional[Level] = None):
-        """Reset the engine with a new level."""
-        self.world.ClearForces()
-        for body in self.world.bodies:
-            self.world.DestroyBody(body)
+    def _new_world(self) -> b2World:
+        world = b2World(gravity=self.gravity, doSleep=True)
+        world.contactListener = self.contact_listener
+        return world
+
+    def reset(self, level: Optional[Level] = None, keep_static: bool = True):
+        """
+        Reset the engine with a new level.
+
+        If the same level is passed again and its static objects are unchanged,
+        the walls and static bodies are kept and only the dynamic bodies are rebuilt.
+        Box2D's broadphase then carries over state from the previous rollout and the
+        bodies are created in a different order than by a full build, so pass
+        keep_static=False when rollouts must be bitwise reproducible.
+        """
+        if keep_static and level is not None and level is self.level:
+            static_objects = self._static_objects(level)
+            if static_objects == self._static_snapshot:
+                self._reset_dynamic_bodies(level, static_objects)
+                return
+
+        # A fresh world is cheaper than destroying every body, and unlike a reused
+        # world its broadphase does not depend on previous rollouts, so the same
+        # level and actions always produce the same trajectory.
+        self.world = self._new_world()
         self.level = level
         self.contact_listener.ClearContacts()
         self.bodies = {}
+        # Sensor fixture of each body that has one, e.g. the interior of a basket
+        self.sensor_fixtures = {}
+        self.placed_objects: Dict[str, PhyreObject] = {}
+        # Objects changed by live edits, None for destroyed ones (see set_transform)
+        self.edited_objects: Dict[str, Optional[PhyreObject]] = {}
+        self._static_snapshot = None
+        # Changes whenever the static bodies change, so renderers can cache them
+        self.static_version = next(_static_versions)
+        self._success_check = None
         if level is not None:
             self._create_world(level)
+            self._track_success_pairs(level)
+        self._update_dynamic_bodies()
+
+    def _static_objects(self, level: Level) -> Dict[str, PhyreObject]:
+        return {
+            name: obj
+            for name, obj in level.objects.items()
+            if not obj.dynamic and name not in level.action_objects
+        }
+
+    def _reset_dynamic_bodies(
+        self, level: Level, static_objects: Dict[str, PhyreObject]
+    ):
+        self.world.ClearForces()
+        for name in list(self.bodies):
+            if name not in static_objects and name not in WALL_NAMES:
+                self._destroy_body(name)
+        self.placed_objects = {}
+        self.edited_objects = {}
+        self.contact_listener.ClearContacts()
+        # Box2D nudges static bodies while it resolves contacts, so they are put
+        # back where a full build creates them
+        for name, state in self._static_states.items():
+            self._set_body_state(self.bodies[name], state)
+        for name, obj in level.objects.items():
+            if name not in static_objects and name not in level.action_objects:
+                self.bodies[name] = self._create_body(name, obj)
+        self._track_success_pairs(level)
+        self._update_dynamic_bodies()
+
+    def _track_success_pairs(self, level: Level):
+        """
+        Restrict contact tracking to the pairs the success condition queries.
+
+        Declarative conditions list their pairs. Other conditions are probed once
+        before the rollout starts: every contact query registers its pair with the
+        listener, so only those pairs are tracked.
+        """
+        condition = level.success_condition
+        if isinstance(condition, SuccessCondition):
+            if not self.track_all_contacts:
+                self.contact_listener.TrackOnly(condition.contact_pairs())
+            self._success_check = condition.compile(self)
+            return
+        self._success_check = lambda: condition(self)
+        if self.track_all_contacts:
+            return
+        self.contact_listener.TrackOnly()
+        try:
+            level.success_condition(self)
+        except Exception:
+            # Conditions that cannot be evaluated before the action is placed
+            self.contact_listener.TrackAll()
 
     def _create_world(self, level):
 
@@ -113,27 +344,53 @@ class Box2DEngine:
         self.bodies["top_wall"] = top_wall
         self.bodies["bottom_wall"] = bottom_wall
 
+        # Bodies are created in level order, which Box2D's solver order and so the
+        # outcome of a rollout depend on. A fast reset only recreates the dynamic
+        # bodies, after the static ones, so its order can differ from this one.
+        static_objects = self._static_objects(level)
         for name, obj in level.objects.items():
             # Skip placement of the action object
             if name in level.action_objects:
                 continue
-            if isinstance(obj, Ball):
-                assert (
-                    self.world is not None
-                ), "World is not initialized. Call reset() before placing objects."
-                body = create_ball(self.world, obj, name)
-            elif isinstance(obj, Bar):
-                body = create_bar(self.world, obj, name)
-            elif isinstance(obj, Basket):
-                body = create_basket(self.world, obj, name)
-            else:
-                raise ValueError(f"Unknown object type for '{name}': {type(obj)}")
-            self.bodies[name] = body
+            self.bodies[name] = self._create_body(name, obj)
+        # Copies of the static objects, to detect edits made between resets
+        self._static_snapshot = {
+            name: copy.copy(obj) for name, obj in static_objects.items()
+        }
+        self._static_states = {
+            name: self._body_state(self.bodies[name])
+            for name in (*WALL_NAMES, *static_objects)
+        }
+
+    def _create_body(self, name: str, obj: PhyreObject):
+        assert (
+            self.world is not None
+        ), "World is not initialized. Call reset() before placing objects."
+        if isinstance(obj, Ball):
+            body = create_ball(self.world, obj, name)
+        elif isinstance(obj, Bar):
+            body = create_bar(self.world, obj, name)
+        elif isinstance(obj, Basket):
+            body = create_basket(self.world, obj, name)
+        else:
+            raise ValueError(f"Unknown object type for '{name}': {type(obj)}")
+        for fixture in body.fixtures:
+            if fixture.sensor:
+                self.sensor_fixtures[name] = fixture
+        return body
+
+    def _destroy_body(self, name: str):
+        self.world.DestroyBody(self.bodies.pop(name))
+        self.sensor_fixtures.pop(name, None)
 
     def place_action_objects(
         self, positions: List[Tuple[Union[int, float], Union[int, float]]]
     ):
-        """Place the action objects once, at the start of the simulation."""
+        """
+        Place the action objects once, at the start of the simulation.
+
+        The level is left untouched, the placed copies are kept in placed_objects.
+        """
         if self.level is None:
             raise ValueError(
                 "The level is not set. Please call reset() with a valid level before placing action objects."
@@ -142,79 +399,375 @@ class Box2DEngine:
             self.world is not None
         ), "World is not initialized. Call reset() before placing objects."
         for name, pos in zip(self.level.action_objects, positions):
-            obj = self.level.objects[name]
-            # Update object's position with the provided tuple
-            obj.x, obj.y = pos
-            if isinstance(obj, Ball):
-                body = create_ball(self.world, obj, name)
-            elif isinstance(obj, Bar):
-                body = create_bar(self.world, obj, name)
-            elif isinstance(obj, Basket):
-                body = create_basket(self.world, obj, name)
-            else:
-                raise ValueError(f"Unknown object type for '{name}': {type(obj)}")
-            self.bodies[name] = body
+            # Place a copy at the provided position, the level may be shared
+            x, y = pos
+            obj = replace(self.level.objects[name], x=x, y=y)
+            self.placed_objects[name] = obj
+            self.edited_objects.pop(name, None)
+            self.bodies[name] = self._create_body(name, obj)
+        self._update_dynamic_bodies()
+
+    def _edit_object(self, name: str, **changes):
+        """
+        Record a live edit in the description of an object and return the old one.
+
+        The level may be shared with other engines and caches, so edits are kept
+        in edited_objects and only show in objects() and get_object().
+        """
+        old = self.get_object(name)
+        if old is None or name not in self.bodies:
+            raise ValueError(f"No object named '{name}' in the world.")
+        new = replace(old, **changes)
+        self.edited_objects[name] = new
+        if not (old.dynamic and new.dynamic):
+            self._static_changed()
+        return old
+
+    def _static_changed(self):
+        # Redraw the static geometry, and rebuild it on the next reset since it no
+        # longer matches the level
+        self.static_version = next(_static_versions)
+        self._static_snapshot = None
+
+    def set_transform(
+        self, name: str, x: float, y: float, angle: Optional[float] = None
+    ):
+        """
+        Teleport a body to (x, y) and optionally rotate it to angle in degrees.
+
+        The velocities of the body are kept and it is woken up.
+        """
+        self._edit_object(name, x=x, y=y, **({} if angle is None else {"angle": angle}))
+        body = self.bodies[name]
+        radians = body.angle if angle is None else math.radians(angle)
+        body.transform = ((x, y), radians)
+        body.awake = True
+        self.quiet_steps = 0
+
+    def set_dynamic(self, name: str, dynamic: bool):
+        """Turn a body dynamic or static. Static bodies lose their velocity."""
+        self._edit_object(name, dynamic=dynamic)
+        # Box2D recomputes the mass and destroys the contacts of the body
+        self.bodies[name].type = b2_dynamicBody if dynamic else b2_staticBody
+        self._update_dynamic_bodies()
+
+    def set_fixture_properties(
+        self,
+        name: str,
+        friction: Optional[float] = None,
+        restitution: Optional[float] = None,
+    ):
+        """Change the friction and/or restitution of a body's fixtures, including ongoing contacts."""
+        changes = {}
+        if friction is not None:
+            changes["friction"] = friction
+        if restitution is not None:
+            changes["restitution"] = restitution
+        self._edit_object(name, **changes)
+        body = self.bodies[name]
+        for fixture in body.fixtures:
+            if fixture.sensor:
+                continue
+            if friction is not None:
+                fixture.friction = friction
+            if restitution is not None:
+                fixture.restitution = restitution
+        # Contacts mix the properties of both fixtures when they are created
+        for edge in body.contacts:
+            if friction is not None:
+                edge.contact.ResetFriction()
+            if restitution is not None:
+                edge.contact.ResetRestitution()
+
+    def set_color(self, name: str, color: str):
+        """Change the color an object is drawn with."""
+        self._edit_object(name, color=color)
+
+    def destroy_body(self, name: str):
+        """Remove an object from the world."""
+        old = self.get_object(name)
+        if old is None or name not in self.bodies:
+            raise ValueError(f"No object named '{name}' in the world.")
+        self._destroy_body(name)
+        self.edited_objects[name] = None
+        if not old.dynamic:
+            self._static_changed()
+        self._update_dynamic_bodies()
+
+    @staticmethod
+    def _body_state(body) -> BodyState:
+        return BodyState(
+            position=tuple(body.position),
+            angle=body.angle,
+            linear_velocity=tuple(body.linearVelocity),
+            angular_velocity=body.angularVelocity,
+            awake=body.awake,
+        )
+
+    @staticmethod
+    def _set_body_state(body, state: BodyState):
+        body.transform = (state.position, state.angle)
+        body.linearVelocity = state.linear_velocity
+        body.angularVelocity = state.angular_velocity
+        body.awake = state.awake
+
+    def snapshot(self) -> EngineSnapshot:
+        """Capture the state of every body and the contact timers."""
+        bodies = {name: self._body_state(body) for name, body in self.bodies.items()}
+        return EngineSnapshot(bodies=bodies, contacts=self.contact_listener.Snapshot())
+
+    def restore(self, snap: EngineSnapshot):
+        """
+        Reapply a snapshot taken with snapshot() on the same level.
+
+        Bodies created after the snapshot (e.g. placed action objects) are destroyed,
+        and bodies destroyed after it are recreated as described by the level. Other
+        live edits (see set_transform) are kept, only the body states are restored.
+        Box2D contacts are rebuilt on the next step, so restored rollouts are
+        physically equivalent to the original but not bitwise identical to it.
+        """
+        missing = [name for name in snap.bodies if name not in self.bodies]
+        originals = {**self.level.objects, **self.placed_objects}
+        unknown = [name for name in missing if name not in originals]
+        if unknown:
+            raise ValueError(f"Cannot restore snapshot, missing bodies: {unknown}")
+        # Bodies removed with destroy_body() since the snapshot are recreated
+        for name in missing:
+            self.edited_objects.pop(name, None)
+            self.bodies[name] = self._create_body(name, originals[name])
+            if not originals[name].dynamic:
+                self._static_changed()
+        for name in [name for name in self.bodies if name not in snap.bodies]:
+            self._destroy_body(name)
+            self.placed_objects.pop(name, None)
+
+        # Deactivating a body destroys its contacts, so no stale manifolds or
+        # warm starting impulses survive the teleport
+        for body in self.bodies.values():
+            body.active = False
+        for name, state in snap.bodies.items():
+            body = self.bodies[name]
+            body.transform = (state.position, state.angle)
+            body.active = True
+            body.linearVelocity = state.linear_velocity
+            body.angularVelocity = state.angular_velocity
+            body.awake = state.awake
+        # Without new fixtures, Box2D creates the contacts of reactivated bodies
+        # only after solving the next step, which would drop resting contacts
+        self.world.contactManager.FindNewContacts()
+        self.contact_listener.Restore(snap.contacts)
+        if isinstance(self.level.success_condition, SuccessCondition):
+            # Pair ids are reassigned by Restore()
+            self._success_check = self.level.success_condition.compile(self)
+        self._update_dynamic_bodies()
+
+    def settle(
+        self,
+        max_steps: int = 60,
+        time_step: float = 1 / 60,
+        velocity_iters: int = 6,
+        position_iters: int = 2,
+        max_displacement: float = 0.05,
+    ) -> EngineSnapshot:
+        """
+        Simulate the level without action objects for a short window to damp jitter.
+
+        Objects generated resting on each other sink into the contact slop and
+        wobble on the first steps. Settling steps the world until it is at rest,
+        or for at most max_steps, and returns a snapshot with the contact timers
+        cleared, so rollouts restored from it start counting contact durations
+        from zero.
+
+        Settling must not play out the level, so it raises ValueError when a
+        dynamic body moves farther than max_displacement (or rotates by more
+        than max_displacement radians) from where the level puts it, when a
+        tracked pair touches, or when the success condition holds.
+        """
+        if self.level is None:
+            raise ValueError("Level is not set. Please call reset() before settling.")
+        if self.placed_objects:
+            raise ValueError("Settle the level before placing the action objects.")
+        start = {
+            name: (np.array(body.position), body.angle)
+            for name, body in self.bodies.items()
+            if body.type == b2_dynamicBody
+        }
+        for _ in range(max_steps):
+            self.step(time_step, velocity_iters, position_iters)
+            if self.is_success():
+                raise ValueError("The level is solved without action objects.")
+            if self.contact_listener.AnyTouching() or self.contact_listener.overlaps:
+                raise ValueError("A tracked pair touches without action objects.")
+            for name, (position, angle) in start.items():
+                body = self.bodies[name]
+                if (
+                    np.linalg.norm(np.array(body.position) - position) > max_displacement
+                    or abs(body.angle - angle) > max_displacement
+                ):
+                    raise ValueError(f"{name} does not rest where the level puts it.")
+            if self.world_is_stationary():
+                break
+        snap = self.snapshot()
+        contacts = {
+            **snap.contacts,
+            "contact_steps": [0] * len(snap.contacts["pairs"]),
+            "step_count": 0,
+            "current_time": 0,
+        }
+        return replace(snap, contacts=contacts)
+
+    def settled_state(
+        self,
+        level: Level,
+        max_steps: int = 60,
+        time_step: float = 1 / 60,
+        velocity_iters: int = 6,
+        position_iters: int = 2,
+        max_displacement: float = 0.05,
+    ) -> Optional[EngineSnapshot]:
+        """
+        Settled state of a level (see settle()), computed once per level.
+
+        None if the level does not settle, so rollouts start from the level as
+        generated. The state is cached on the level until one of its objects
+        changes. This resets the engine with the level when the state is not
+        cached yet.
+        """
+
+        def build() -> Optional[EngineSnapshot]:
+            self.reset(level, keep_static=False)
+            try:
+                return self.settle(
+                    max_steps, time_step, velocity_iters, position_iters, max_displacement
+                )
+            except ValueError:
+                return None
+
+        return level.cached(
+            "settled_state",
+            (
+                max_steps,
+                time_step,
+                velocity_iters,
+                position_iters,
+                max_displacement,
+                self.gravity,
+            ),
+            build,
+        )
 
     def get_state(self):
         """
-        Return the current simulation state.
-        This is a stub – in practice you might render the scene to an image,
-        return raw physics data, or process the state as needed.
+        Return the current simulation state as an RGB image.
+
+        The image is rasterized headlessly by an ArrayRenderer of size state_size,
+        which is created on first use.
         """
-        return {}
+        if self.state_renderer is None:
+            from interphyre.render.array import ArrayRenderer
+
+            width, height = self.state_size
+            self.state_renderer = ArrayRenderer(width=width, height=height)
+        return self.state_renderer.render(self)
 
     def objects(self) -> Dict[str, PhyreObject]:
+        """Description of the objects in the world, including placements and live edits."""
         if self.level is None:
             raise ValueError(
                 "The level is not set. Please call reset() with a valid level before accessing objects."
             )
-        return self.level.objects
+        if not self.placed_objects and not self.edited_objects:
+            return self.level.objects
+        objects = {**self.level.objects, **self.placed_objects, **self.edited_objects}
+        return {name: obj for name, obj in objects.items() if obj is not None}
+
+    def get_object(self, name: str) -> Optional[PhyreObject]:
+        """Description of one object, see objects(). None if there is no such object."""
+        if name in self.edited_objects:
+            return self.edited_objects[name]
+        if name in self.placed_objects:
+            return self.placed_objects[name]
+        return self.level.objects.get(name) if self.level is not None else None
 
     def has_contact(self, name1: str, name2: str) -> bool:
         """
-        Check if the two object names have come into contact.
+        Check if the two object names are currently in contact.
+
+        Overlaps with sensor fixtures, such as the interior of a basket, are not
+        contacts (see is_in_basket_sensor).
         """
-        return frozenset((name1, name2)) in self.contact_listener.contacts
+        body = self.bodies.get(name1)
+        if body is None:
+            return False
+        for edge in body.contacts:
+            contact = edge.contact
+            if contact.fixtureA.sensor or contact.fixtureB.sensor:
+                continue
+            if contact.touching and edge.other.userData == name2:
+                return True
+        return False
 
-    def world_is_stationary(self) -> bool:
-        # TODO: this logic is buggy, we need a time based check
-        if self.world is None:
+    def _update_dynamic_bodies(self):
+        """Refresh the bodies checked for motion, call whenever bodies change."""
+        self._dynamic_bodies = [
+            body for body in self.bodies.values() if body.type == b2_dynamicBody
+        ]
+        self.quiet_steps = 0
+
+    def _update_stationary(self):
+        for body in self._dynamic_bodies:
+            if body.awake:
+                self.quiet_steps = 0
+                return
+        self.quiet_steps += 1
+
+    def is_success(self) -> bool:
+        """Evaluate the success condition of the level on the current state."""
+        if self._success_check is None:
             raise ValueError(
-                "World is not initialized. Call reset() before checking for stationary bodies."
+                "Level is not set. Please call reset() before checking for success."
             )
+        return self._success_check()
+
+    def world_is_stationary(self) -> bool:
+        """
+        Check if no dynamic body has been awake for the last stationary_steps steps.
+
+        Uses the sleep flags Box2D maintains, which are updated by step().
+        """
         if self.level is None:
             raise ValueError(
                 "Level is not set. Please call reset() before checking for stationary bodies."
             )
-        for body in self.world.bodies:
-            if body.userData in self.level.objects:
-                if (
-                    body.linearVelocity.length > self.stationary_world_tolerance
-                    or body.angularVelocity > self.stationary_world_tolerance
-                ):
-                    return False
-        return True
+        return self.quiet_steps >= self.stationary_steps
+
+    def is_settled(self) -> bool:
+        """
+        Check if the world is stationary and success can no longer happen.
+
+        With the world at rest, contact durations only grow for pairs that are
+        already touching, so success is still possible while a tracked pair is in
+        contact. This assumes the success condition depends only on body states
+        and contact durations, and it is never true when tracking all contacts.
+        """
+        if not self.world_is_stationary():
+            return False
+        listener = self.contact_listener
+        return not listener.track_all and not listener.AnyTouching()
 
     def _is_point_inside_polygon(
         self, x: float, y: float, polygon: List[Tuple[float, float]]
     ) -> bool:
-        n = len(polygon)
-        inside = False
-        p1x, p1y = polygon[0]
-        for i in range(n + 1):
-            p2x, p2y = polygon[i % n]
-            if min(p1y, p2y) < y <= max(p1y, p2y) and x <= max(p1x, p2x):
-                if p1y != p2y:
-                    xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                    if p1x == p2x or x <= xinters:
-                        inside = not inside
-            p1x, p1y = p2x, p2y
-        return inside
+        return bool(points_in_polygon(np.array([x, y]), np.array(polygon)))
 
     def is_in_basket(
         self, basket_name: str, target_name: str, tolerance: float = 0.001
-    ) -> List[Tuple[float, float]]:
-
+    ) -> bool:
+        """
+        Check if a ball lies entirely inside a basket, using the current pose of
+        the basket including its rotation. See interphyre.geometry.points_in_basket
+        for the same test over arrays of recorded states.
+        """
         if self.level is None or self.world is None:
             raise ValueError("Level or world not initialized.")
         if basket_name not in self.level.objects:
@@ -223,11 +776,6 @@ class Box2DEngine:
         if not isinstance(basket, Basket):
             raise ValueError(f"{basket_name} is not a basket.")
 
-        basket_height = 1.67 * basket.scale
-        basket_width = 1.083 * basket.scale
-        thickness = 0.075 * basket.scale
-        angle_shift = math.cos(5 * b2_pi / 180) * 5
-
         if target_name not in self.level.objects:
             raise ValueError(f"{target_name} not found in level objects.")
         target = self.level.objects[target_name]
@@ -236,34 +784,20 @@ class Box2DEngine:
                 f"{target_name} is a {type(target)}, is_in_basket currently only works with Balls."
             )
 
-        bottom_left = (
-            basket.x - basket_width / 2 + thickness / 2 + tolerance + target.radius,
-            basket.y + thickness / 2 + tolerance + target.radius,
-        )
-        bottom_right = (
-            basket.x + basket_width / 2 - thickness / 2 - tolerance - target.radius,
-            basket.y + thickness / 2 + tolerance + target.radius,
-        )
-        top_right = (
-            basket.x
-            + basket_width / 2
-            - thickness / 2
-            + angle_shift
-            - tolerance
-            - target.radius,
-            basket.y + basket_height - thickness / 2 - tolerance - target.radius,
-        )
-        top_left = (
-            basket.x
-            - basket_width / 2
-            + thickness / 2
-            - angle_shift
-            + tolerance
-            + target.radius,
-            basket.y + basket_height - thickness / 2 - tolerance - target.radius,
+        basket_body = self.bodies.get(basket_name)
+        target_body = self.bodies.get(target_name)
+        if basket_body is None or target_body is None:
+            return False
+        return bool(
+            points_in_basket(
+                np.array(tuple(target_body.position)),
+                np.array(tuple(basket_body.position)),
+                basket_body.angle,
+                basket.scale,
+                target.radius,
+                tolerance,
+            )
         )
-        success_bounding_box = [bottom_left, bottom_right, top_right, top_left]
-        return success_bounding_box
 
     def is_in_basket_sensor(self, basket_name: str, target_name: str) -> bool:
         """
@@ -271,6 +805,9 @@ class Box2DEngine:
         This is an alternative to the original is_in_basket method that uses
         point-in-polygon testing.
 
+        Overlaps with sensor fixtures are tracked by the contact listener, so the
+        check does not depend on the number of bodies or contacts in the world.
+
         Args:
             basket_name: Name of the basket object
             target_name: Name of the ball object
@@ -294,33 +831,7 @@ class Box2DEngine:
                 f"{target_name} is a {type(target)}, is_in_basket_sensor currently only works with Balls."
             )
 
-        # Get the basket and target bodies from the world
-        basket_body = None
-        target_body = None
-        for body in self.world.bodies:
-            if body.userData == basket_name:
-                basket_body = body
-            elif body.userData == target_name:
-                target_body = body
-
-        if basket_body is None or target_body is None:
-            return False
-
-        # Check if the target is in contact with the basket's sensor fixture
-        for contact in self.world.contacts:
-            # Check if this contact involves our basket and target
-            if (
-                contact.fixtureA.body == basket_body
-                and contact.fixtureB.body == target_body
-            ) or (
-                contact.fixtureA.body == target_body
-                and contact.fixtureB.body == basket_body
-            ):
-                # Check if one of the fixtures is a sensor (our basket's interior)
-                if contact.fixtureA.sensor or contact.fixtureB.sensor:
-                    return True
-
-        return False
+        return self.contact_listener.IsOverlapping(basket_name, target_name)
 
     def is_in_contact_for_duration(self, a, b, success_time: Optional[float] = None):
         if success_time is None:
@@ -329,6 +840,13 @@ class Box2DEngine:
 
     def time_update(self, dt):
         self.contact_listener.Update(dt)
+        self._update_stationary()
+
+    def step(self, time_step: float, velocity_iters: int, position_iters: int):
+        """Advance the world by one time step and update the contact timers."""
+        self.world.Step(time_step, velocity_iters, position_iters)
+        self.contact_listener.Update(time_step)
+        self._update_stationary()
 
     def get_contact_duration(self, a, b):
         return self.contact_listener.GetContactDuration(a, b)
@@ -3,8 +3,10 @@ import gymnasium as gym
 import numpy as np
 
 from interphyre.engine import Box2DEngine
+from interphyre.evaluate import STATUS_NAMES, EvaluationResults, evaluate_actions
 from interphyre.level import Level
 from interphyre.render import Renderer
+from interphyre.trajectory import TrajectoryRecorder
 
 
 class PhyreEnv(gym.Env):
@@ -22,7 +24,11 @@ class PhyreEnv(gym.Env):
         self.time_step: float = 1 / self.fps
         self.velocity_iters: int = 6
         self.position_iters: int = 2
+        # Start episodes with the jitter of resting objects damped, for levels
+        # that do not move on their own, see Box2DEngine.settled_state
+        self.presettle: bool = False
         self.obs_size: Tuple[int, int] = (600, 600)
+        self.engine.state_size = (self.obs_size[1], self.obs_size[0])
 
         self.action_space = gym.spaces.Box(
             low=-5.0, high=5.0, shape=(len(level.action_objects), 2), dtype=np.float32
@@ -36,7 +42,21 @@ class PhyreEnv(gym.Env):
 
     def reset(self, seed: Optional[int] = None, options: Optional[dict] = None):
         super().reset(seed=seed)
-        self.engine.reset(self.level)
+        settled = (
+            self.engine.settled_state(
+                self.level,
+                time_step=self.time_step,
+                velocity_iters=self.velocity_iters,
+                position_iters=self.position_iters,
+            )
+            if self.presettle
+            else None
+        )
+        # A fresh world every episode, so an action has the same outcome no matter
+        # which episodes ran before (see Box2DEngine.reset)
+        self.engine.reset(self.level, keep_static=False)
+        if settled is not None:
+            self.engine.restore(settled)
         self.action_placed = False
         self.current_state = self.engine.get_state()
         return self.current_state, {}
@@ -48,7 +68,7 @@ class PhyreEnv(gym.Env):
 
         self.current_state = self.engine.get_state()
 
-        done = self.level.success_condition(self.engine)
+        done = self.engine.is_success()
         reward = float(done)
         info = {"status": "running"}
         terminated = False
@@ -59,44 +79,97 @@ class PhyreEnv(gym.Env):
         steps: int = 1000,
         return_trace: bool = False,
         verbose: bool = False,
+        stop_when_settled: bool = False,
+        render_every: Optional[int] = 1,
+        return_trajectory: bool = False,
+        trace_observations: bool = True,
     ):
+        """
+        Run the simulation after the action has been placed with step().
+
+        Args:
+            steps: Maximum number of physics steps.
+            return_trace: Return a list of (obs, reward, done, terminated, info).
+            verbose: Print the status of every step.
+            stop_when_settled: Terminate as soon as the world is at rest and
+                success can no longer happen.
+            render_every: Render every k steps if a renderer is attached. The
+                final state is always rendered, None renders only that frame.
+            return_trajectory: Return a columnar Trajectory of the body states
+                instead of a list of per-step tuples.
+            trace_observations: Rasterize an image observation (see get_state)
+                for every step of the trace. Pass False to store None in place
+                of the observations, which keeps long traces cheap to record.
+        """
         if self.engine.world is None:
             raise ValueError(
                 "World is not initialized. Call reset() before simulating."
             )
+        if return_trace and return_trajectory:
+            raise ValueError("Only one of return_trace and return_trajectory can be set.")
+        recorder = (
+            TrajectoryRecorder(self.engine, steps, self.time_step)
+            if return_trajectory
+            else None
+        )
         trace = []
         status = "running"
         terminated = False
         for i in range(steps):
-            self.engine.world.Step(
-                self.time_step, self.velocity_iters, self.position_iters
-            )
-            self.engine.time_update(self.time_step)
-            done = self.level.success_condition(self.engine)
+            self.engine.step(self.time_step, self.velocity_iters, self.position_iters)
+            done = self.engine.is_success()
             if done:
                 status = "success"
             elif self.engine.world_is_stationary():
                 status = "world_is_stationary"
-                # terminated = True
-            elif i == steps - 1:
+                if stop_when_settled and self.engine.is_settled():
+                    terminated = True
+            if not (done or terminated) and i == steps - 1:
                 status = "timeout"
                 terminated = True
 
             if return_trace:
-                self.current_obs = self.engine.get_state()
+                self.current_obs = (
+                    self.engine.get_state() if trace_observations else None
+                )
                 reward = float(done)
                 info = {"status": status}
                 trace.append((self.current_obs, reward, done, terminated, info))
+            if recorder is not None:
+                recorder.record(STATUS_NAMES.index(status))
 
             # Render the current state if a renderer is provided
-            self.render()
+            last_step = done or terminated or i == steps - 1
+            if last_step or (render_every and (i + 1) % render_every == 0):
+                self.render()
 
             if verbose:
                 print(f"Step {i+1}/{steps}, status: {status}")
             if done or terminated:
                 break
+        if recorder is not None:
+            return recorder.finish()
         return trace
 
+    def evaluate_actions(self, actions, steps: int = 1000) -> EvaluationResults:
+        """
+        Evaluate a batch of actions of shape (N, k, 2) on this level.
+
+        Each action is rolled out from a fresh reset on the environment's engine,
+        so the environment must be reset again before calling step().
+        """
+        self.action_placed = False
+        return evaluate_actions(
+            self.level,
+            actions,
+            steps=steps,
+            time_step=self.time_step,
+            velocity_iters=self.velocity_iters,
+            position_iters=self.position_iters,
+            engine=self.engine,
+            presettle=self.presettle,
+        )
+
     def render(self):
         if self.renderer:
             self.renderer.render(self.engine)
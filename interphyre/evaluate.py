@@ -0,0 +1,263 @@
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple, Union
+import numpy as np
+
+from interphyre.engine import Box2DEngine
+from interphyre.interventions import Intervention
+from interphyre.level import Level
+
+# Integer status codes used in the columnar results
+STATUS_RUNNING = 0
+STATUS_SUCCESS = 1
+STATUS_STATIONARY = 2
+STATUS_TIMEOUT = 3
+STATUS_NAMES = ("running", "success", "world_is_stationary", "timeout")
+
+
+@dataclass
+class EvaluationResults:
+    """
+    Columnar results of a batch of rollouts, one entry per candidate action.
+
+    Attributes:
+        success: (N,) bool, whether the success condition was met.
+        status: (N,) int8, final status code (see STATUS_NAMES).
+        steps: (N,) int32, number of physics steps that were simulated.
+        success_time: (N,) float64, simulated time at success, NaN otherwise.
+    """
+
+    success: np.ndarray
+    status: np.ndarray
+    steps: np.ndarray
+    success_time: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.success)
+
+    def status_names(self) -> List[str]:
+        return [STATUS_NAMES[code] for code in self.status]
+
+    @classmethod
+    def concatenate(cls, results: List["EvaluationResults"]) -> "EvaluationResults":
+        """Join results of consecutive batches, preserving their order."""
+        if not results:
+            return cls(
+                success=np.zeros(0, dtype=bool),
+                status=np.zeros(0, dtype=np.int8),
+                steps=np.zeros(0, dtype=np.int32),
+                success_time=np.zeros(0),
+            )
+        return cls(
+            success=np.concatenate([r.success for r in results]),
+            status=np.concatenate([r.status for r in results]),
+            steps=np.concatenate([r.steps for r in results]),
+            success_time=np.concatenate([r.success_time for r in results]),
+        )
+
+
+def as_action_batch(actions, num_action_objects: int) -> np.ndarray:
+    """Convert actions to a float array of shape (N, k, 2)."""
+    actions = np.asarray(actions, dtype=np.float64)
+    if actions.ndim == 2 and num_action_objects == 1:
+        actions = actions[:, None, :]
+    if actions.ndim != 3 or actions.shape[1:] != (num_action_objects, 2):
+        raise ValueError(
+            f"Expected actions of shape (N, {num_action_objects}, 2), got {actions.shape}."
+        )
+    return actions
+
+
+def _run_rollout(
+    engine: Box2DEngine,
+    start: int,
+    steps: int,
+    time_step: float,
+    velocity_iters: int,
+    position_iters: int,
+    stop_when_settled: bool,
+) -> Tuple[int, int, float]:
+    """
+    Simulate from step start until the rollout ends or steps is reached.
+
+    Returns the status code, the step the rollout ended at and the simulated time
+    at success (NaN otherwise). The success condition is checked before the first
+    step as well.
+    """
+    if engine.is_success():
+        return STATUS_SUCCESS, start, engine.contact_listener.current_time
+    for t in range(start, steps):
+        engine.step(time_step, velocity_iters, position_iters)
+        if engine.is_success():
+            return STATUS_SUCCESS, t + 1, engine.contact_listener.current_time
+        if stop_when_settled and engine.is_settled():
+            return STATUS_STATIONARY, t + 1, np.nan
+    return STATUS_TIMEOUT, steps, np.nan
+
+
+def evaluate_actions(
+    level: Level,
+    actions,
+    steps: int = 1000,
+    time_step: float = 1 / 60,
+    velocity_iters: int = 6,
+    position_iters: int = 2,
+    engine: Optional[Box2DEngine] = None,
+    keep_static: bool = False,
+    stop_when_settled: bool = True,
+    presettle: bool = False,
+) -> EvaluationResults:
+    """
+    Run one rollout per candidate placement of the level's action objects.
+
+    The rollout semantics match PhyreEnv.step() followed by PhyreEnv.simulate(),
+    without building observations, traces or info dicts along the way.
+
+    Args:
+        level: Level to evaluate.
+        actions: Array of shape (N, k, 2) with the (x, y) position of each of the
+            k action objects. (N, 2) is accepted for levels with one action object.
+        steps: Maximum number of physics steps per rollout.
+        time_step: Duration of a physics step.
+        velocity_iters: Box2D velocity iterations per step.
+        position_iters: Box2D position iterations per step.
+        engine: Engine to run the rollouts on, a new one is created if None.
+        keep_static: Keep the static bodies alive between rollouts. This makes
+            resets cheaper, but outcomes then depend on the order of the actions.
+        stop_when_settled: End a rollout with STATUS_STATIONARY as soon as the
+            world is at rest and success can no longer happen (see
+            Box2DEngine.is_settled).
+        presettle: Start every rollout from the level with the jitter of its
+            resting objects damped (see Box2DEngine.settled_state). Levels that
+            move on their own start as generated.
+
+    Returns:
+        EvaluationResults: Columnar results in the order of the actions.
+    """
+    actions = as_action_batch(actions, len(level.action_objects))
+    n = len(actions)
+    status = np.full(n, STATUS_TIMEOUT, dtype=np.int8)
+    steps_taken = np.full(n, steps, dtype=np.int32)
+    success_time = np.full(n, np.nan)
+
+    if engine is None:
+        engine = Box2DEngine()
+    settled = (
+        engine.settled_state(
+            level,
+            time_step=time_step,
+            velocity_iters=velocity_iters,
+            position_iters=position_iters,
+        )
+        if presettle
+        else None
+    )
+
+    for i in range(n):
+        engine.reset(level, keep_static=keep_static)
+        if settled is not None:
+            engine.restore(settled)
+        engine.place_action_objects(actions[i].tolist())
+        status[i], steps_taken[i], success_time[i] = _run_rollout(
+            engine, 0, steps, time_step, velocity_iters, position_iters, stop_when_settled
+        )
+    success = status == STATUS_SUCCESS
+
+    return EvaluationResults(
+        success=success, status=status, steps=steps_taken, success_time=success_time
+    )
+
+
+def evaluate_interventions(
+    level: Level,
+    action,
+    interventions: Sequence[Union[None, Intervention, Sequence[Intervention]]],
+    branch_step: int,
+    steps: int = 1000,
+    time_step: float = 1 / 60,
+    velocity_iters: int = 6,
+    position_iters: int = 2,
+    engine: Optional[Box2DEngine] = None,
+    stop_when_settled: bool = True,
+) -> EvaluationResults:
+    """
+    Run one rollout of an action and branch it into counterfactual continuations.
+
+    The rollout is simulated once up to branch_step and snapshotted. Every branch
+    restores the snapshot into a fresh world, applies its interventions and
+    simulates only the remaining steps, so the shared prefix is never recomputed
+    and the outcome of a branch does not depend on the other branches. Restored
+    states are physically equivalent but not bitwise identical to the unbranched
+    rollout (see Box2DEngine.restore), so compare branches against a None branch.
+
+    If the success condition is met before branch_step, the outcome was decided
+    before any intervention and every branch reports it.
+
+    Args:
+        level: Level to evaluate.
+        action: (k, 2) positions of the k action objects, or (2,) when k == 1.
+        interventions: One entry per branch, an Intervention, a sequence of
+            Interventions applied in order, or None for a branch without changes.
+        branch_step: Number of steps simulated before branching.
+        steps: Maximum number of physics steps per rollout, including the prefix.
+        time_step: Duration of a physics step.
+        velocity_iters: Box2D velocity iterations per step.
+        position_iters: Box2D position iterations per step.
+        engine: Engine to run the rollouts on, a new one is created if None.
+        stop_when_settled: End a branch with STATUS_STATIONARY as soon as the world
+            is at rest and success can no longer happen. The prefix always runs to
+            branch_step, since an intervention can set a resting world in motion.
+
+    Returns:
+        EvaluationResults: Columnar results in the order of the branches. Steps
+        and success times are counted from the start of the rollout.
+    """
+    action = as_action_batch(
+        np.asarray(action, dtype=np.float64)[None], len(level.action_objects)
+    )[0]
+    if not 0 <= branch_step <= steps:
+        raise ValueError(f"branch_step must be in [0, {steps}], got {branch_step}.")
+    n = len(interventions)
+
+    if engine is None:
+        engine = Box2DEngine()
+    engine.reset(level, keep_static=False)
+    engine.place_action_objects(action.tolist())
+    prefix = _run_rollout(
+        engine, 0, branch_step, time_step, velocity_iters, position_iters, False
+    )
+    if prefix[0] == STATUS_SUCCESS:
+        return EvaluationResults(
+            success=np.ones(n, dtype=bool),
+            status=np.full(n, STATUS_SUCCESS, dtype=np.int8),
+            steps=np.full(n, prefix[1], dtype=np.int32),
+            success_time=np.full(n, prefix[2]),
+        )
+    snap = engine.snapshot()
+
+    status = np.full(n, STATUS_TIMEOUT, dtype=np.int8)
+    steps_taken = np.full(n, steps, dtype=np.int32)
+    success_time = np.full(n, np.nan)
+    for i, branch in enumerate(interventions):
+        engine.reset(level, keep_static=False)
+        engine.place_action_objects(action.tolist())
+        engine.restore(snap)
+        if isinstance(branch, Intervention):
+            branch = (branch,)
+        for intervention in branch or ():
+            intervention.apply(engine)
+        status[i], steps_taken[i], success_time[i] = _run_rollout(
+            engine,
+            branch_step,
+            steps,
+            time_step,
+            velocity_iters,
+            position_iters,
+            stop_when_settled,
+        )
+
+    return EvaluationResults(
+        success=status == STATUS_SUCCESS,
+        status=status,
+        steps=steps_taken,
+        success_time=success_time,
+    )
@@ -0,0 +1,207 @@
+"""
+Vectorized geometry queries on NumPy arrays.
+
+These functions work on recorded states as well as on the live engine, and
+evaluate whole batches of points or trajectory steps in one call.
+"""
+
+import math
+from typing import Dict, Tuple
+import numpy as np
+from interphyre.objects import Ball, Bar, Basket, PhyreObject
+
+# Outward tilt of the basket side walls, see interphyre.objects.create_basket
+BASKET_WALL_ANGLE = 5 * math.pi / 180
+
+
+def basket_dimensions(scale: float) -> Tuple[float, float, float]:
+    """Return the (width, height, thickness) of a basket, as built by create_basket."""
+    width = round(1.083 * scale, 2)
+    height = round(1.67 * scale, 2)
+    thickness = round(0.05 + 0.1 * math.sqrt(scale), 2)
+    return width, height, thickness
+
+
+def basket_interior(scale: float) -> np.ndarray:
+    """
+    Polygon of the basket interior in basket coordinates.
+
+    Returns the (4, 2) corners bottom left, bottom right, top right, top left.
+    The interior is bounded by the top of the bottom bar, the inner faces of the
+    tilted side walls and the height of the basket.
+    """
+    width, height, thickness = basket_dimensions(scale)
+    bottom = thickness / 2
+    half_width = _inner_half_width(width, height, thickness)
+    tan = math.tan(BASKET_WALL_ANGLE)
+    top_half_width = half_width + tan * (height - bottom)
+    return np.array(
+        [
+            (-half_width, bottom),
+            (half_width, bottom),
+            (top_half_width, height),
+            (-top_half_width, height),
+        ]
+    )
+
+
+def _inner_half_width(width: float, height: float, thickness: float) -> float:
+    # Distance from the center line to the inner face of a side wall at the top of
+    # the bottom bar. The wall is a box of half extents (thickness / 2,
+    # (height + thickness) / 2) centered at (width / 2 - thickness / 2 + shift,
+    # height / 2) and rotated outwards by BASKET_WALL_ANGLE.
+    theta = BASKET_WALL_ANGLE
+    shift = math.cos(theta) * thickness
+    center_x = width / 2 - thickness / 2 + shift
+    # Position along the wall axis of the point of the inner face at height y
+    y = thickness / 2
+    s = (y - height / 2 - thickness / 2 * math.sin(theta)) / math.cos(theta)
+    return center_x - thickness / 2 * math.cos(theta) + s * math.sin(theta)
+
+
+def basket_boxes(scale: float) -> np.ndarray:
+    """
+    Boxes of the basket fixtures in basket coordinates, as built by create_basket.
+
+    Returns a (3, 5) array of (x, y, half width, half height, angle) rows for the
+    bottom bar and the left and right walls.
+    """
+    width, height, thickness = basket_dimensions(scale)
+    theta = BASKET_WALL_ANGLE
+    wall_x = width / 2 - thickness / 2 + math.cos(theta) * thickness
+    wall_half_height = height / 2 + thickness / 2
+    return np.array(
+        [
+            (0.0, 0.0, width / 2, thickness / 2, 0.0),
+            (-wall_x, height / 2, thickness / 2, wall_half_height, theta),
+            (wall_x, height / 2, thickness / 2, wall_half_height, -theta),
+        ]
+    )
+
+
+def object_shapes(objects: Dict[str, PhyreObject]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Decompose objects into primitive shapes in world coordinates.
+
+    Returns:
+        circles: (M, 3) array of (x, y, radius).
+        boxes: (K, 5) array of (x, y, half width, half height, angle in radians).
+    """
+    circles = []
+    boxes = []
+    for obj in objects.values():
+        angle = math.radians(obj.angle)
+        if isinstance(obj, Ball):
+            circles.append((obj.x, obj.y, obj.radius))
+        elif isinstance(obj, Bar):
+            boxes.append((obj.x, obj.y, obj.length / 2, obj.thickness / 2, angle))
+        elif isinstance(obj, Basket):
+            local = basket_boxes(obj.scale)
+            c, s = math.cos(angle), math.sin(angle)
+            for x, y, hx, hy, a in local:
+                boxes.append(
+                    (obj.x + c * x - s * y, obj.y + s * x + c * y, hx, hy, a + angle)
+                )
+        else:
+            raise ValueError(f"Unknown object type: {type(obj)}")
+    return np.array(circles).reshape(-1, 3), np.array(boxes).reshape(-1, 5)
+
+
+def circle_distance(points: np.ndarray, circles: np.ndarray) -> np.ndarray:
+    """Signed distance from (..., 2) points to each of (M, 3) circles, shape (..., M)."""
+    points = np.asarray(points, dtype=float)[..., None, :]
+    return np.hypot(*np.moveaxis(points - circles[:, :2], -1, 0)) - circles[:, 2]
+
+
+def box_distance(points: np.ndarray, boxes: np.ndarray) -> np.ndarray:
+    """Signed distance from (..., 2) points to each of (K, 5) boxes, shape (..., K)."""
+    points = np.asarray(points, dtype=float)[..., None, :]
+    local = to_local(points, boxes[:, :2], boxes[:, 4])
+    q = np.abs(local) - boxes[:, 2:4]
+    outside = np.hypot(np.maximum(q[..., 0], 0), np.maximum(q[..., 1], 0))
+    return outside + np.minimum(np.maximum(q[..., 0], q[..., 1]), 0)
+
+
+def signed_distance(
+    points: np.ndarray, circles: np.ndarray, boxes: np.ndarray
+) -> np.ndarray:
+    """
+    Signed distance from (..., 2) points to the union of the shapes.
+
+    Negative inside a shape. Points far from every shape (or no shapes) give inf.
+    """
+    points = np.asarray(points, dtype=float)
+    distance = np.full(points.shape[:-1], np.inf)
+    if len(circles):
+        distance = np.minimum(distance, circle_distance(points, circles).min(-1))
+    if len(boxes):
+        distance = np.minimum(distance, box_distance(points, boxes).min(-1))
+    return distance
+
+
+def to_local(points: np.ndarray, position: np.ndarray, angle: np.ndarray) -> np.ndarray:
+    """
+    Transform world points into the frame of a body.
+
+    points is (..., 2); position (..., 2) and angle (...) in radians broadcast
+    against it, so one pose per point (e.g. per trajectory step) is supported.
+    """
+    points = np.asarray(points, dtype=float)
+    d = points - np.asarray(position, dtype=float)
+    c, s = np.cos(angle), np.sin(angle)
+    return np.stack([c * d[..., 0] + s * d[..., 1], -s * d[..., 0] + c * d[..., 1]], -1)
+
+
+def points_in_basket(
+    centers: np.ndarray,
+    basket_position: np.ndarray,
+    basket_angle: np.ndarray,
+    scale: float,
+    radius: float = 0.0,
+    tolerance: float = 0.001,
+) -> np.ndarray:
+    """
+    Check which balls lie entirely inside a basket.
+
+    Args:
+        centers: (..., 2) ball centers, e.g. (T, 2) from Trajectory.body(name)[:, :2].
+        basket_position: (2,) or (..., 2) basket positions, one per center.
+        basket_angle: Scalar or (...) basket angles in radians.
+        scale: Scale of the basket.
+        radius: Radius of the balls.
+        tolerance: Margin kept between the ball and the basket walls.
+
+    Returns:
+        np.ndarray: (...) bool, whether each ball is inside the basket.
+    """
+    width, height, thickness = basket_dimensions(scale)
+    local = to_local(centers, basket_position, basket_angle)
+    x, y = local[..., 0], local[..., 1]
+    bottom = thickness / 2
+    margin = radius + tolerance
+    tan = math.tan(BASKET_WALL_ANGLE)
+    # Insetting a wall tilted by the wall angle moves it by margin / cos horizontally
+    half_width = (
+        _inner_half_width(width, height, thickness)
+        + tan * (y - bottom)
+        - margin / math.cos(BASKET_WALL_ANGLE)
+    )
+    return (y >= bottom + margin) & (y <= height - margin) & (np.abs(x) <= half_width)
+
+
+def points_in_polygon(points: np.ndarray, polygon: np.ndarray) -> np.ndarray:
+    """
+    Even-odd rule test of (..., 2) points against a simple (M, 2) polygon.
+
+    Returns a (...) bool array.
+    """
+    points = np.asarray(points, dtype=float)
+    polygon = np.asarray(polygon, dtype=float)
+    x = points[..., 0, None]
+    y = points[..., 1, None]
+    x1, y1 = polygon[:, 0], polygon[:, 1]
+    x2, y2 = np.roll(x1, -1), np.roll(y1, -1)
+    crosses = (y1 > y) != (y2 > y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_intersect = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+    return np.count_nonzero(crosses & (x < x_intersect), axis=-1) % 2 == 1
@@ -0,0 +1,81 @@
+"""
+Interventions on a running simulation.
+
+An intervention changes the live Box2D bodies of an engine in place with the
+engine's edit operations (e.g. Box2DEngine.set_transform), for example at the
+branch point of a counterfactual rollout (see
+interphyre.evaluate.evaluate_interventions). The level is never modified, the
+engine keeps the edited object descriptions in Box2DEngine.objects().
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+
+
+class Intervention(ABC):
+    """Base class of interventions."""
+
+    @abstractmethod
+    def apply(self, engine):
+        """Change the bodies of engine in place."""
+        pass
+
+
+@dataclass(frozen=True)
+class RemoveObject(Intervention):
+    """Destroy the body of an object."""
+
+    name: str
+
+    def apply(self, engine):
+        engine.destroy_body(self.name)
+
+
+@dataclass(frozen=True)
+class MoveObject(Intervention):
+    """
+    Teleport an object to (x, y), and optionally rotate it to angle in degrees.
+
+    The velocities of the body are kept.
+    """
+
+    name: str
+    x: float
+    y: float
+    angle: Optional[float] = None
+
+    def apply(self, engine):
+        engine.set_transform(self.name, self.x, self.y, self.angle)
+
+
+@dataclass(frozen=True)
+class FreezeObject(Intervention):
+    """Make an object static, so it stops and no longer moves."""
+
+    name: str
+
+    def apply(self, engine):
+        engine.set_dynamic(self.name, False)
+
+
+@dataclass(frozen=True)
+class SetFriction(Intervention):
+    """Change the friction of an object, including its ongoing contacts."""
+
+    name: str
+    friction: float
+
+    def apply(self, engine):
+        engine.set_fixture_properties(self.name, friction=self.friction)
+
+
+@dataclass(frozen=True)
+class SetRestitution(Intervention):
+    """Change the restitution of an object, including its ongoing contacts."""
+
+    name: str
+    restitution: float
+
+    def apply(self, engine):
+        engine.set_fixture_properties(self.name, restitution=self.restitution)
@@ -1,16 +1,72 @@
-from dataclasses import dataclass, field
-from typing import Dict, Callable, List, Optional
-from interphyre.objects import PhyreObject
+from dataclasses import asdict, dataclass, field, replace
+from typing import Any, Dict, Callable, List, Optional, Union
+from interphyre.conditions import SuccessCondition, condition_from_dict
+from interphyre.objects import OBJECT_TYPES, ObjectTable, PhyreObject
+from interphyre.occupancy import OccupancyMap
+from interphyre.validation import find_out_of_bounds, find_overlaps
+import importlib
+import json
+import numpy as np
+
+
+def success_condition_spec(condition: Callable) -> Union[str, dict]:
+    """
+    Describe a success condition in JSON types.
+
+    Declarative conditions are stored as dicts, see SuccessCondition.to_dict().
+    Functions are named by their import path, e.g. "mypackage.levels:success".
+    """
+    if isinstance(condition, SuccessCondition):
+        return condition.to_dict()
+    module = getattr(condition, "__module__", None)
+    qualname = getattr(condition, "__qualname__", "")
+    if module is None or "<" in qualname:
+        raise ValueError(
+            f"Success condition {condition!r} must be a module-level function to be serialized."
+        )
+    return f"{module}:{qualname}"
+
+
+def resolve_success_condition(spec: Union[str, dict]) -> Callable:
+    """Build or import the success condition described by success_condition_spec()."""
+    if isinstance(spec, dict):
+        return condition_from_dict(spec)
+    module_name, _, qualname = spec.partition(":")
+    condition: Any = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        condition = getattr(condition, attr)
+    return condition
+
+
+def _json_default(value):
+    # Builders may leave NumPy scalars in object fields or metadata
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
 
 
 # TODO - goal objects and target objects are not relevant now that we have success conditions
 @dataclass
 class Level:
+    """
+    A level description: its objects, action objects and success condition.
+
+    Objects can be shared between levels created with clone(), with_object() and
+    without_object(), so they are never modified in place. The mutators below
+    replace the edited object in this level's dict instead, which leaves every
+    other level that shares it untouched.
+    """
+
     name: str
     objects: Dict[str, PhyreObject]
     action_objects: List[str]
-    success_condition: Callable  # function(engine) -> bool
+    # function(engine) -> bool, preferably a declarative interphyre.conditions one
+    success_condition: Callable
     metadata: Optional[dict] = field(default_factory=dict)
+    # Values derived from the objects, see cached()
+    _cache: Dict[str, tuple] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         if not callable(self.success_condition):
@@ -18,61 +74,195 @@ class Level:
                 f"Level '{self.name}' must define a success_condition function."
             )
 
-    def move_object(self, obj_name: str, x: float, y: float):
-        if obj_name in self.objects:
-            self.objects[obj_name].x, self.objects[obj_name].y = x, y
-        else:
+    def _replace_object(self, obj_name: str, **changes):
+        if obj_name not in self.objects:
             raise ValueError(f"No object named '{obj_name}' in level.")
+        self.objects[obj_name] = replace(self.objects[obj_name], **changes)
+
+    def move_object(self, obj_name: str, x: float, y: float):
+        self._replace_object(obj_name, x=x, y=y)
 
     def set_angle(self, obj_name: str, angle: float):
-        if obj_name in self.objects:
-            self.objects[obj_name].angle = angle
-        else:
-            raise ValueError(f"No object named '{obj_name}' in level.")
+        self._replace_object(obj_name, angle=angle)
 
     def change_color(self, obj_name: str, color: str):
-        if obj_name in self.objects:
-            self.objects[obj_name].color = color
-        else:
-            raise ValueError(f"No object named '{obj_name}' in level.")
+        self._replace_object(obj_name, color=color)
 
     def remove_object(self, obj_name: str):
         if obj_name in self.objects:
             del self.objects[obj_name]
             if obj_name in self.action_objects:
                 self.action_objects.remove(obj_name)
-            if self.target_object == obj_name:
-                self.target_object = None
-            if self.goal_object == obj_name:
-                self.goal_object = None
         else:
             raise ValueError(f"Cannot remove: No object named '{obj_name}' in level.")
 
     def set_dynamic(self, obj_name: str, dynamic: bool):
-        if obj_name in self.objects:
-            self.objects[obj_name].dynamic = dynamic
-        else:
-            raise ValueError(f"No object named '{obj_name}' in level.")
+        self._replace_object(obj_name, dynamic=dynamic)
 
     def set_restitution(self, obj_name: str, restitution: float):
-        if obj_name in self.objects:
-            self.objects[obj_name].restitution = restitution
-        else:
-            raise ValueError(f"No object named '{obj_name}' in level.")
+        self._replace_object(obj_name, restitution=restitution)
 
     def set_friction(self, obj_name: str, friction: float):
-        if obj_name in self.objects:
-            self.objects[obj_name].friction = friction
-        else:
-            raise ValueError(f"No object named '{obj_name}' in level.")
+        self._replace_object(obj_name, friction=friction)
 
-    def clone(self, new_name: Optional[str] = None):
-        import copy
+    def with_object(self, obj_name: str, **changes) -> "Level":
+        """
+        Return a copy of the level with one object's fields changed.
+
+        Example: level.with_object("green_ball", x=1.0, friction=0.2)
+        The copy shares every other object with this level.
+        """
+        level = self.clone(self.name)
+        level._replace_object(obj_name, **changes)
+        return level
+
+    def without_object(self, obj_name: str) -> "Level":
+        """Return a copy of the level without the given object."""
+        level = self.clone(self.name)
+        level.remove_object(obj_name)
+        return level
+
+    def cached(self, name: str, params: tuple, build: Callable[[], Any]) -> Any:
+        """
+        Return a value derived from the level, built once per set of params.
+
+        The value is rebuilt when an object of the level is replaced or removed.
+        Objects are replaced rather than modified, so their identity tracks changes.
+        """
+        objects = list(self.objects.items())
+        entry = self._cache.get(name)
+        if entry is not None:
+            cached_params, cached_objects, cached_actions, value = entry
+            if (
+                cached_params == params
+                and cached_actions == self.action_objects
+                and len(cached_objects) == len(objects)
+                and all(
+                    a[0] == b[0] and a[1] is b[1]
+                    for a, b in zip(cached_objects, objects)
+                )
+            ):
+                return value
+        value = build()
+        self._cache[name] = (params, objects, list(self.action_objects), value)
+        return value
+
+    def occupancy_map(self, resolution: float = 0.02) -> OccupancyMap:
+        """
+        Signed distance field of the level geometry, excluding the action objects.
+
+        The map is cached until an object of the level is replaced or removed.
+        """
+        return self.cached(
+            "occupancy_map",
+            (resolution,),
+            lambda: OccupancyMap.from_level(self, resolution),
+        )
+
+    def is_valid_action(self, actions, margin: float = 0.0):
+        """
+        Check which actions place the action objects without overlapping the walls,
+        the other objects or each other. See OccupancyMap.is_valid_action.
+        """
+        return self.occupancy_map().is_valid_action(actions, margin)
 
+    def validate(self, tolerance: float = 1e-3) -> List[str]:
+        """
+        Check the layout of the level, ignoring the action objects.
+
+        Reports objects that interpenetrate by more than tolerance (pairs of static
+        objects excepted) and objects outside the world. See interphyre.validation.
+
+        Returns:
+            List[str]: Descriptions of the problems, empty if the level is valid.
+        """
+        table = self.to_table()
+        problems = [
+            f"'{table.names[a]}' overlaps '{table.names[b]}'"
+            for a, b in find_overlaps(table, tolerance)
+        ]
+        problems += [
+            f"'{table.names[i]}' is outside the world"
+            for i in find_out_of_bounds(table)
+        ]
+        return problems
+
+    def to_table(self, level: int = 0) -> ObjectTable:
+        """Convert the objects of the level to an ObjectTable."""
+        return ObjectTable.from_objects(self.objects, self.action_objects, level)
+
+    @classmethod
+    def from_table(
+        cls,
+        table: ObjectTable,
+        name: str,
+        success_condition: Callable,
+        level: int = 0,
+        metadata: Optional[dict] = None,
+    ) -> "Level":
+        """Build a level from one level variant of an ObjectTable."""
+        objects, action_objects = table.to_objects(level)
+        return cls(
+            name=name,
+            objects=objects,
+            action_objects=action_objects,
+            success_condition=success_condition,
+            metadata=metadata or {},
+        )
+
+    def to_dict(self) -> dict:
+        """
+        Convert the level to a dict of JSON types.
+
+        The success condition is stored by name, see success_condition_spec().
+        """
+        return {
+            "name": self.name,
+            "objects": [
+                {"name": name, "type": type(obj).__name__, **asdict(obj)}
+                for name, obj in self.objects.items()
+            ],
+            "action_objects": list(self.action_objects),
+            "success_condition": success_condition_spec(self.success_condition),
+            "metadata": self.metadata or {},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Level":
+        types = {obj_type.__name__: obj_type for obj_type in OBJECT_TYPES}
+        objects = {}
+        for entry in data["objects"]:
+            fields = dict(entry)
+            name = fields.pop("name")
+            type_name = fields.pop("type")
+            if type_name not in types:
+                raise ValueError(f"Unknown object type '{type_name}' for '{name}'.")
+            objects[name] = types[type_name](**fields)
+        return cls(
+            name=data["name"],
+            objects=objects,
+            action_objects=list(data["action_objects"]),
+            success_condition=resolve_success_condition(data["success_condition"]),
+            metadata=dict(data.get("metadata") or {}),
+        )
+
+    def to_json(self, indent: Optional[int] = None) -> str:
+        """Serialize the level to a JSON string."""
+        return json.dumps(self.to_dict(), indent=indent, default=_json_default)
+
+    @classmethod
+    def from_json(cls, text: str) -> "Level":
+        """Build a level from a string written by to_json()."""
+        return cls.from_dict(json.loads(text))
+
+    def clone(self, new_name: Optional[str] = None):
+        """
+        Copy the level. The objects themselves are shared with the copy.
+        """
         return Level(
             name=new_name or self.name + "_clone",
-            objects=copy.deepcopy(self.objects),
+            objects=dict(self.objects),
             action_objects=self.action_objects[:],
             success_condition=self.success_condition,
-            metadata=copy.deepcopy(self.metadata),
+            metadata=dict(self.metadata or {}),
         )
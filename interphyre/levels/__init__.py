@@ -1,33 +1,303 @@
 from interphyre.level import Level
-from typing import Callable
+from interphyre.objects import ObjectTable
+from types import ModuleType
+from typing import Callable, Dict, List, Optional
+import hashlib
 import importlib
+import importlib.util
+import os
+import warnings
+import numpy as np
+
+# Manifest of the built-in levels. Each level is defined by the module of the same
+# name in interphyre.levels, which is only imported when the level is loaded.
+LEVEL_NAMES = (
+    "basket_case",
+    "catapult",
+    "cliffhanger",
+    "down_to_earth",
+    "end_of_line",
+    "falling_into_place",
+    "flagpole_sitta",
+    "just_a_nudge",
+    "keyhole",
+    "off_the_rails",
+    "pass_the_parcel",
+    "pinhole",
+    "seesaw",
+    "staircase",
+    "the_funnel",
+    "tipping_point",
+    "two_body_problem",
+    "wedge_issue",
+    "zebra_gate",
+)
 
 # Registry for level builders
 _level_registry: dict[str, Callable[[int | None], Level]] = {}
+# Module that defines each registered builder
+_level_modules: Dict[str, str] = {}
+
+# Directory of the on-disk level cache, disabled when None
+_cache_dir: Optional[str] = os.environ.get("INTERPHYRE_LEVEL_CACHE") or None
+# Builder version hash per level name, see builder_version()
+_builder_versions: Dict[str, Optional[str]] = {}
+# Modules every level is built from, besides the module of its builder:
+# object construction, success conditions, the JSON format of Level and the
+# world bounds in interphyre.render
+_LEVEL_SOURCES = (
+    "interphyre.objects",
+    "interphyre.conditions",
+    "interphyre.level",
+    "interphyre.render",
+)
+# Bump to invalidate every cached level, e.g. when the cache layout changes
+LEVEL_CACHE_VERSION = 1
+
+
+# Decorator to register a level builder
+def register_level(name: str):
+    """
+    Register a level builder under name.
+
+    Built-in levels are registered by the module of the same name in
+    interphyre.levels and must be listed in LEVEL_NAMES, other builders must not
+    use the name of a built-in level. Registering a name twice raises ValueError.
+    Nothing is built at registration time, the builder only runs in load_level().
+    """
+
+    def decorator(
+        func: Callable[[int | None], Level],
+    ) -> Callable[[int | None], Level]:
+        builtin = func.__module__.startswith("interphyre.levels.")
+        if builtin and func.__module__ != f"interphyre.levels.{name}":
+            raise ValueError(
+                f"Level '{name}' must be registered by interphyre.levels.{name}, "
+                f"not {func.__module__}."
+            )
+        if builtin and name not in LEVEL_NAMES:
+            raise ValueError(f"Built-in level '{name}' is missing from LEVEL_NAMES.")
+        if not builtin and name in LEVEL_NAMES:
+            raise ValueError(f"Level '{name}' is a built-in level.")
+        if name in _level_registry:
+            raise ValueError(
+                f"Level '{name}' is already registered by {_level_modules[name]}."
+            )
 
+        def wrapper(seed: int | None = None) -> Level:
+            return func(seed)
 
-# Decorator to build and register a level
-def register_level(func: Callable[[int | None], Level]):
-    def wrapper(seed: int | None = None) -> Level:
-        return func(seed)
+        _level_registry[name] = wrapper
+        _level_modules[name] = func.__module__
+        _builder_versions.pop(name, None)
 
-    # Get level name by calling the function once with no seed
-    level = func(None)
-    _level_registry[level.name] = wrapper
+        return wrapper
 
-    return wrapper
+    return decorator
 
 
-def load_level(name: str, seed: int | None = None) -> Level:
+def list_levels() -> List[str]:
+    """List the names of all known levels without importing their modules."""
+    return sorted(set(LEVEL_NAMES) | set(_level_registry))
+
+
+def _level_module(name: str) -> ModuleType:
+    module = importlib.import_module(f"interphyre.levels.{name}")
     if name not in _level_registry:
-        # Try to dynamically import it
-        importlib.import_module(f"interphyre.levels.{name}")
+        raise ValueError(f"Level '{name}' could not be registered.")
+    return module
+
+
+def set_level_cache(path: Optional[str]):
+    """
+    Cache the levels built by load_level() as JSON files under path.
+
+    Pass None to disable the cache. The cache can also be enabled by setting the
+    INTERPHYRE_LEVEL_CACHE environment variable before interphyre is imported.
+    """
+    global _cache_dir
+    _cache_dir = path
+
+
+def _module_source(module_name: str) -> Optional[bytes]:
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or spec.origin is None or not os.path.isfile(spec.origin):
+        return None
+    with open(spec.origin, "rb") as f:
+        return f.read()
+
+
+def builder_version(name: str) -> Optional[str]:
+    """
+    Hash of the sources a level is built from.
+
+    This covers the module that registered the builder and the modules in
+    _LEVEL_SOURCES, along with LEVEL_CACHE_VERSION. Cached levels are keyed by
+    this hash, so editing a builder, the object definitions or the level format
+    invalidates them. Returns None if the source of the builder cannot be found
+    (e.g. a builder defined in __main__), such levels are not cached.
+    """
+    if name not in _builder_versions:
         if name not in _level_registry:
-            raise ValueError(f"Level '{name}' could not be registered.")
-    return _level_registry[name](seed)
+            _level_module(name)
+        digest = hashlib.sha256(f"v{LEVEL_CACHE_VERSION}".encode())
+        for module_name in (_level_modules[name],) + _LEVEL_SOURCES:
+            source = _module_source(module_name)
+            if source is None:
+                _builder_versions[name] = None
+                break
+            digest.update(source)
+        else:
+            _builder_versions[name] = digest.hexdigest()[:16]
+    return _builder_versions[name]
+
+
+def _cache_path(name: str, seed: int) -> Optional[str]:
+    assert _cache_dir is not None
+    version = builder_version(name)
+    if version is None:
+        return None
+    return os.path.join(_cache_dir, name, f"{seed}-{version}.json")
+
+
+def load_level(name: str, seed: int | None = None, use_cache: bool = True) -> Level:
+    """
+    Build a level, or read it from the level cache if one is set.
+
+    Levels without a seed are random and never cached, and neither are levels
+    whose builder has no source file (see builder_version).
+    """
+    path = None
+    if use_cache and _cache_dir is not None and seed is not None:
+        path = _cache_path(name, seed)
+        if path is not None and os.path.exists(path):
+            with open(path) as f:
+                return Level.from_json(f.read())
+
+    if name not in _level_registry:
+        # Try to dynamically import it
+        _level_module(name)
+    level = _level_registry[name](seed)
+
+    if path is not None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a private file first so concurrent workers never read a partial file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(level.to_json())
+        os.replace(tmp_path, path)
+    return level
+
+
+# Number of variants per independently seeded block of generate_levels()
+BATCH_BLOCK_SIZE = 1024
+
+
+def is_vectorized(name: str) -> bool:
+    """
+    Check if a level family draws batches as arrays.
+
+    Only families whose module defines build_batch(rng, k) are vectorized, all
+    but cliffhanger and zebra_gate at the moment. Their builders draw some values
+    from ranges that depend on earlier draws and may be empty (cliffhanger), or
+    draw a different number of values per variant (zebra_gate), so they have no
+    batch with the random stream of the scalar builder. generate_levels() builds
+    their variants one at a time with the scalar builder, with a warning.
+    """
+    return hasattr(_level_module(name), "build_batch")
+
+
+def _warn_not_vectorized(name: str):
+    warnings.warn(
+        f"Level '{name}' is not vectorized, its variants are built one at a time.",
+        RuntimeWarning,
+        stacklevel=3,
+    )
+
+
+def variant_seed(seed: int, index: int) -> int:
+    """Seed of load_level() that builds variant index of a family that is not vectorized."""
+    return int(np.random.SeedSequence([seed, index]).generate_state(1)[0])
+
+
+def generate_levels(
+    name: str, k: int, seed: int | None = None, start: int = 0
+) -> ObjectTable:
+    """
+    Generate the variants start, ..., start + k - 1 of a level family as an ObjectTable.
+
+    Variant (seed, index) does not depend on k or start, so load_variant(name,
+    seed, index) rebuilds any row on its own. Vectorized families (see
+    is_vectorized) draw BATCH_BLOCK_SIZE variants at a time from the random stream
+    seeded with (seed, block), and variant index is row index % BATCH_BLOCK_SIZE
+    of block index // BATCH_BLOCK_SIZE. Other families build variant index with
+    load_level(name, variant_seed(seed, index)), and warn with a RuntimeWarning
+    when more than one variant is generated. These variants differ from the
+    level load_level(name, seed) builds.
+    """
+    module = _level_module(name)
+    if seed is None:
+        seed = int(np.random.SeedSequence().generate_state(1)[0])
+    stop = start + k
+    build_batch = getattr(module, "build_batch", None)
+    if build_batch is None:
+        if k > 1:
+            _warn_not_vectorized(name)
+        return ObjectTable.concatenate(
+            [
+                load_level(name, variant_seed(seed, index)).to_table()
+                for index in range(start, stop)
+            ]
+        )
+    tables = []
+    for block in range(start // BATCH_BLOCK_SIZE, -(-stop // BATCH_BLOCK_SIZE)):
+        first = block * BATCH_BLOCK_SIZE
+        table = build_batch(np.random.default_rng([seed, block]), BATCH_BLOCK_SIZE)
+        lo = max(start, first) - first
+        hi = min(stop, first + BATCH_BLOCK_SIZE) - first
+        selected = table.select((table.level >= lo) & (table.level < hi))
+        selected.level = selected.level - lo
+        tables.append(selected)
+    return ObjectTable.concatenate(tables)
+
+
+def levels_from_table(name: str, table: ObjectTable) -> List[Level]:
+    """
+    Build the levels of a family from the variants of an ObjectTable.
+
+    The metadata of the levels is copied from the METADATA dict of the level
+    module, if it has one.
+    """
+    module = _level_module(name)
+    metadata = getattr(module, "METADATA", {})
+    return [
+        Level.from_table(
+            table, name, module.success_condition, level=i, metadata=dict(metadata)
+        )
+        for i in range(table.num_levels)
+    ]
+
+
+def load_levels(
+    name: str, k: int, seed: int | None = None, start: int = 0
+) -> List[Level]:
+    """Generate variants of a level family as levels, see generate_levels."""
+    if not is_vectorized(name):
+        if k > 1:
+            _warn_not_vectorized(name)
+        if seed is None:
+            seed = int(np.random.SeedSequence().generate_state(1)[0])
+        # The scalar builder also fills in the level metadata
+        return [
+            load_level(name, variant_seed(seed, index))
+            for index in range(start, start + k)
+        ]
+    return levels_from_table(name, generate_levels(name, k, seed, start))
 
 
-# TODO - LEVELS NOT IMPLEMENTED
-# 00003 - KnockBarOnWall - has issue where green bar is not sitting within the basket
-# 00004 - BalanceBeam - needs variable ball size, collision retention, infinite balls
-# 00008 - Staircase - change success logic to use interphyre.utils.detect_success_basket
+def load_variant(name: str, seed: int, index: int) -> Level:
+    """Build variant (seed, index) of a level family, row index of generate_levels(name, k, seed)."""
+    return load_levels(name, 1, seed, index)[0]
@@ -1,83 +1,79 @@
 import numpy as np
-from typing import cast
-from interphyre.objects import Ball, Basket, Bar, PhyreObject
+from interphyre.objects import Ball, Basket, Bar, ObjectTable
+from interphyre.conditions import ContactFor
 from interphyre.level import Level
 from interphyre.levels import register_level
 
+METADATA = {
+    "description": "Make sure the green ball hits the purple ground and is not trapped in the basket"
+}
+
 # TODO - increease friction so the jar doesn't slide around with small balls
 # TODO - alternatively, prevent small balls with large baskets
 
 
-def success_condition(engine):
-    success_time = engine.default_success_time
-    return engine.is_in_contact_for_duration(
-        "green_ball", "purple_ground", success_time
-    )
+success_condition = ContactFor("green_ball", "purple_ground")
 
 
-@register_level
+@register_level("basket_case")
 def build_level(seed=None) -> Level:
-    rng = np.random.default_rng(seed)
+    return Level.from_table(
+        build_batch(np.random.default_rng(seed), 1),
+        "basket_case",
+        success_condition,
+        metadata=dict(METADATA),
+    )
 
-    # Set basket starting position based on green_ball.
-    basket_scale = rng.uniform(0.5, 2)
-    basket_x = rng.uniform(-4.5 + basket_scale, 4.5 - basket_scale)
-    basket_y = -4.9 + basket_scale + rng.uniform(0, 1)
 
-    # Randomly set green ball attributes.
-    green_ball_x = basket_x
-    green_ball_y = rng.uniform(1, 4.5)
-    green_ball_radius = rng.uniform(
-        min(0.3, basket_scale * 0.5), max(0.3, basket_scale * 0.5)
-    )
+def build_batch(rng: np.random.Generator, k: int) -> ObjectTable:
+    """
+    Draw k variants of the level at once, see interphyre.levels.generate_levels.
 
-    # Randomly set red ball starting position.
-    red_ball_x = rng.uniform(-4.5, 4.5)
-    red_ball_y = rng.uniform(-2, 4)
+    build_level(seed) is the batch of one drawn from default_rng(seed).
+    """
+    basket_scale = rng.uniform(0.5, 2, k)
+    basket_x = rng.uniform(-4.5 + basket_scale, 4.5 - basket_scale)
+    basket_y = -4.9 + basket_scale + rng.uniform(0, 1, k)
 
-    green_ball = Ball(
-        x=green_ball_x,
-        y=green_ball_y,
-        radius=green_ball_radius,
-        color="green",
-        dynamic=True,
-    )
-    red_ball = Ball(
-        x=red_ball_x,
-        y=red_ball_y,
-        radius=0.4,
-        color="red",
-        dynamic=True,
-    )
-    purple_ground = Bar(
-        x=0.0,
-        y=-4.9,
-        length=10.0,
-        angle=0.0,
-        color="purple",
-        dynamic=False,
-    )
-    basket = Basket(
-        x=basket_x,
-        y=basket_y,
-        scale=basket_scale,
-        color="gray",
-        dynamic=True,
+    green_ball_y = rng.uniform(1, 4.5, k)
+    green_ball_radius = rng.uniform(
+        np.minimum(0.3, basket_scale * 0.5), np.maximum(0.3, basket_scale * 0.5)
     )
 
-    objects = {
-        "green_ball": green_ball,
-        "red_ball": red_ball,
-        "purple_ground": purple_ground,
-        "basket": basket,
-    }
+    red_ball_x = rng.uniform(-4.5, 4.5, k)
+    red_ball_y = rng.uniform(-2, 4, k)
 
-    return Level(
-        name="basket_case",
-        objects=cast(dict[str, PhyreObject], objects),
-        action_objects=["red_ball"],
-        success_condition=success_condition,
-        metadata={
-            "description": "Make sure the green ball hits the purple ground and is not trapped in the basket"
+    return ObjectTable.from_batch(
+        k,
+        {
+            "green_ball": (
+                Ball,
+                dict(
+                    x=basket_x,
+                    y=green_ball_y,
+                    radius=green_ball_radius,
+                    color="green",
+                    dynamic=True,
+                ),
+            ),
+            "red_ball": (
+                Ball,
+                dict(x=red_ball_x, y=red_ball_y, radius=0.4, color="red", dynamic=True),
+            ),
+            "purple_ground": (
+                Bar,
+                dict(x=0.0, y=-4.9, length=10.0, color="purple", dynamic=False),
+            ),
+            "basket": (
+                Basket,
+                dict(
+                    x=basket_x,
+                    y=basket_y,
+                    scale=basket_scale,
+                    color="gray",
+                    dynamic=True,
+                ),
+            ),
         },
+        action_objects=["red_ball"],
     )
@@ -1,16 +1,15 @@
 import numpy as np
 from typing import cast
 from interphyre.objects import Ball, Bar, Basket, PhyreObject
+from interphyre.conditions import ContactFor
 from interphyre.level import Level
 from interphyre.levels import register_level
 
 
-def success_condition(engine):
-    success_time = engine.default_success_time
-    return engine.is_in_contact_for_duration("green_bar", "purple_ground", success_time)
+success_condition = ContactFor("green_bar", "purple_ground")
 
 
-@register_level
+@register_level("cliffhanger")
 def build_level(seed=None) -> Level:
     rng = np.random.default_rng(seed)
 
@@ -1,31 +1,35 @@
 import numpy as np
-from interphyre.objects import Ball, Bar, PhyreObject
+from interphyre.objects import Ball, Bar, ObjectTable
+from interphyre.conditions import ContactFor
 from interphyre.level import Level
-from typing import cast
 from interphyre.levels import register_level
 
+METADATA = {"description": "Knock the green ball off the table to the purple wall"}
 
-def success_condition(engine):
-    success_time = engine.default_success_time
-    return engine.is_in_contact_for_duration("green_ball", "purple_wall", success_time)
 
+success_condition = ContactFor("green_ball", "purple_wall")
 
-@register_level
-def build_level(seed=None):
-    rng = np.random.default_rng(seed)
 
-    purple_wall = Bar(
-        x=rng.choice([-4.9, 4.9]),
-        y=0.0,
-        length=10.0,
-        thickness=0.2,
-        angle=90.0,
-        color="purple",
-        dynamic=False,
+@register_level("end_of_line")
+def build_level(seed=None) -> Level:
+    return Level.from_table(
+        build_batch(np.random.default_rng(seed), 1),
+        "end_of_line",
+        success_condition,
+        metadata=dict(METADATA),
     )
 
-    table_length = rng.uniform(3, 7)
-    table_height = rng.uniform(0.5, 1.5)
+
+def build_batch(rng: np.random.Generator, k: int) -> ObjectTable:
+    """
+    Draw k variants of the level at once, see interphyre.levels.generate_levels.
+
+    build_level(seed) is the batch of one drawn from default_rng(seed).
+    """
+    purple_wall_x = np.array([-4.9, 4.9])[rng.integers(0, 2, k)]
+
+    table_length = rng.uniform(3, 7, k)
+    table_height = rng.uniform(0.5, 1.5, k)
     table_angle = 60.0
     angle_rad = np.radians(table_angle)
     ground_level = -5
@@ -35,75 +39,87 @@ def build_level(seed=None):
     leg_pos_x = table_length / 2 + np.cos(angle_rad) * leg_length / 2
     leg_pos_y = ground_level + (leg_length * np.sin(angle_rad)) / 2
 
-    table_top = Bar(
-        x=0.0,
-        y=ground_level + table_height,
-        length=table_length + buffer * 2,
-        thickness=0.2,
-        angle=0.0,
-        color="black",
-        dynamic=False,
-    )
-
-    table_left_leg = Bar(
-        x=-leg_pos_x - buffer / 2,
-        y=leg_pos_y,
-        length=leg_length + buffer,
-        thickness=0.2,
-        angle=table_angle,
-        color="black",
-        dynamic=False,
-    )
+    green_ball_radius = rng.uniform(0.2, 0.6, k)
+    red_ball_radius = rng.uniform(0.2, 1, k)
 
-    table_right_leg = Bar(
-        x=leg_pos_x + buffer / 2,
-        y=leg_pos_y,
-        length=leg_length + buffer,
-        thickness=0.2,
-        angle=-table_angle,
-        color="black",
-        dynamic=False,
+    green_ball_x = rng.uniform(
+        -table_length / 2 + green_ball_radius + 0.5,
+        table_length / 2 - green_ball_radius - 0.5,
     )
+    green_ball_y = rng.uniform(-1 - table_height, 2 - table_height)
+    red_ball_y = rng.uniform(-1 - table_height, 2 - table_height)
 
-    green_ball_radius = rng.uniform(0.2, 0.6)
-    red_ball_radius = rng.uniform(0.2, 1)
-
-    green_ball = Ball(
-        x=rng.uniform(
-            -table_length / 2 + green_ball_radius + 0.5,
-            table_length / 2 - green_ball_radius - 0.5,
-        ),
-        y=rng.uniform(-1 - table_height, 2 - table_height),
-        radius=green_ball_radius,
-        color="green",
-        dynamic=True,
-    )
-
-    red_ball = Ball(
-        x=-3,
-        y=rng.uniform(-1 - table_height, 2 - table_height),
-        radius=red_ball_radius,
-        color="red",
-        dynamic=True,
-    )
-
-    # Avoid trivial solutions
-
-    objects = {
-        "green_ball": green_ball,
-        "red_ball": red_ball,
-        "purple_wall": purple_wall,
-        "table_top": table_top,
-        "table_left_leg": table_left_leg,
-        "table_right_leg": table_right_leg,
-    }
-
-    return Level(
-        name="end_of_line",
-        objects=cast(dict[str, PhyreObject], objects),
-        action_objects=["red_ball"],
-        success_condition=success_condition,
-        metadata={
-            "description": "Knock the green ball off the table to the purple wall"
+    return ObjectTable.from_batch(
+        k,
+        {
+            "green_ball": (
+                Ball,
+                dict(
+                    x=green_ball_x,
+                    y=green_ball_y,
+                    radius=green_ball_radius,
+                    color="green",
+                    dynamic=True,
+                ),
+            ),
+            "red_ball": (
+                Ball,
+                dict(
+                    x=-3,
+                    y=red_ball_y,
+                    radius=red_ball_radius,
+                    color="red",
+                    dynamic=True,
+                ),
+            ),
+            "purple_wall": (
+                Bar,
+                dict(
+                    x=purple_wall_x,
+                    y=0.0,
+                    length=10.0,
+                    thickness=0.2,
+                    angle=90.0,
+                    color="purple",
+                    dynamic=False,
+                ),
+            ),
+            "table_top": (
+                Bar,
+                dict(
+                    x=0.0,
+                    y=ground_level + table_height,
+                    length=table_length + buffer * 2,
+                    thickness=0.2,
+                    angle=0.0,
+                    color="black",
+                    dynamic=False,
+                ),
+            ),
+            "table_left_leg": (
+                Bar,
+                dict(
+                    x=-leg_pos_x - buffer / 2,
+                    y=leg_pos_y,
+                    length=leg_length + buffer,
+                    thickness=0.2,
+                    angle=table_angle,
+                    color="black",
+                    dynamic=False,
+                ),
+            ),
+            "table_right_leg": (
+                Bar,
+                dict(
+                    x=leg_pos_x + buffer / 2,
+                    y=leg_pos_y,
+                    length=leg_length + buffer,
+                    thickness=0.2,
+                    angle=-table_angle,
+                    color="black",
+                    dynamic=False,
+                ),
+            ),
         },
+        action_objects=["red_ball"],
     )
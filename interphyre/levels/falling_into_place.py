@@ -1,88 +1,90 @@
 import numpy as np
-from interphyre.objects import Ball, PhyreObject, Bar, Basket
+from interphyre.objects import Ball, Bar, Basket, ObjectTable
+from interphyre.conditions import ContactFor
 from interphyre.level import Level
-from typing import cast
 from interphyre.levels import register_level
 
+METADATA = {"description": "Make the green ball touch the blue jar"}
 
-def success_condition(engine):
-    success_time = engine.default_success_time
-    return engine.is_in_contact_for_duration("green_ball", "blue_jar", success_time)
 
+success_condition = ContactFor("green_ball", "blue_jar")
 
-@register_level
-def build_level(seed=None):
-    rng = np.random.default_rng(seed)
 
-    bar_height = rng.uniform(-1, 3.5)
-
-    left_bar = Bar(
-        x=-3,
-        y=bar_height,
-        length=4,
-        angle=0,
-        color="black",
-        dynamic=False,
-    )
-    right_bar = Bar(
-        x=3,
-        y=bar_height,
-        length=4,
-        angle=0,
-        color="black",
-        dynamic=False,
+@register_level("falling_into_place")
+def build_level(seed=None) -> Level:
+    return Level.from_table(
+        build_batch(np.random.default_rng(seed), 1),
+        "falling_into_place",
+        success_condition,
+        metadata=dict(METADATA),
     )
 
-    bottom_ramp = Bar(
-        x=0,
-        y=-4,
-        length=11,
-        angle=11,
-        color="black",
-        dynamic=False,
-    )
+
+def build_batch(rng: np.random.Generator, k: int) -> ObjectTable:
+    """
+    Draw k variants of the level at once, see interphyre.levels.generate_levels.
+
+    build_level(seed) is the batch of one drawn from default_rng(seed).
+    """
+    bar_height = rng.uniform(-1, 3.5, k)
 
     blue_jar_y = rng.uniform(bar_height + 1, 4.5)
-    blue_jar = Basket(
-        x=rng.uniform(-0.5, 0.5),
-        y=blue_jar_y,
-        scale=0.8,
-        color="blue",
-        angle=180,
-        dynamic=True,
-    )
+    blue_jar_x = rng.uniform(-0.5, 0.5, k)
 
     green_ball_radius = 0.5
-    green_ball = Ball(
-        x=rng.choice([rng.uniform(-3, -1.5), rng.uniform(1.5, 3)]),
-        y=bar_height + green_ball_radius,
-        radius=green_ball_radius,
-        color="green",
-        dynamic=True,
-    )
-
-    red_ball_radius = rng.uniform(0.4, min(1, (5 - bar_height) / 2))
-    red_ball = Ball(
-        x=-3,
-        y=2.5,
-        radius=red_ball_radius,
-        color="red",
-        dynamic=True,
+    # The green ball rests on the left or the right bar
+    green_ball_left_x = rng.uniform(-3, -1.5, k)
+    green_ball_right_x = rng.uniform(1.5, 3, k)
+    green_ball_x = np.where(
+        rng.integers(0, 2, k) == 0, green_ball_left_x, green_ball_right_x
     )
 
-    objects = {
-        "green_ball": green_ball,
-        "blue_jar": blue_jar,
-        "red_ball": red_ball,
-        "left_bar": left_bar,
-        "right_bar": right_bar,
-        "bottom_ramp": bottom_ramp,
-    }
+    red_ball_radius = rng.uniform(0.4, np.minimum(1, (5 - bar_height) / 2))
 
-    return Level(
-        name="falling_into_place",
-        objects=cast(dict[str, PhyreObject], objects),
+    return ObjectTable.from_batch(
+        k,
+        {
+            "green_ball": (
+                Ball,
+                dict(
+                    x=green_ball_x,
+                    y=bar_height + green_ball_radius,
+                    radius=green_ball_radius,
+                    color="green",
+                    dynamic=True,
+                ),
+            ),
+            "blue_jar": (
+                Basket,
+                dict(
+                    x=blue_jar_x,
+                    y=blue_jar_y,
+                    scale=0.8,
+                    color="blue",
+                    angle=180,
+                    dynamic=True,
+                ),
+            ),
+            "red_ball": (
+                Ball,
+                dict(x=-3, y=2.5, radius=red_ball_radius, color="red", dynamic=True),
+            ),
+            "left_bar": (
+                Bar,
+                dict(
+                    x=-3, y=bar_height, length=4, angle=0, color="black", dynamic=False
+                ),
+            ),
+            "right_bar": (
+                Bar,
+                dict(
+                    x=3, y=bar_height, length=4, angle=0, color="black", dynamic=False
+                ),
+            ),
+            "bottom_ramp": (
+                Bar,
+                dict(x=0, y=-4, length=11, angle=11, color="black", dynamic=False),
+            ),
+        },
         action_objects=["red_ball"],
-        success_condition=success_condition,
-        metadata={"description": "Make the green ball touch the blue jar"},
     )
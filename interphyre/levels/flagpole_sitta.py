@@ -1,135 +1,150 @@
 import numpy as np
-from interphyre.objects import Ball, Bar, PhyreObject
+from interphyre.objects import Ball, Bar, ObjectTable
+from interphyre.conditions import ContactFor
 from interphyre.level import Level
-from typing import cast
 from interphyre.levels import register_level
 
+METADATA = {"description": "Knock the green ball off of the pole and onto the ground"}
 
-def success_condition(engine):
-    success_time = engine.default_success_time
-    return engine.is_in_contact_for_duration(
-        "green_ball", "purple_ground", success_time
-    )
 
+success_condition = ContactFor("green_ball", "purple_ground")
 
-@register_level
-def build_level(seed=None):
-    rng = np.random.default_rng(seed)
 
-    purple_ground = Bar(
-        x=0.0,
-        y=-4.9,
-        length=10.0,
-        thickness=0.2,
-        angle=0.0,
-        color="purple",
-        dynamic=False,
+@register_level("flagpole_sitta")
+def build_level(seed=None) -> Level:
+    return Level.from_table(
+        build_batch(np.random.default_rng(seed), 1),
+        "flagpole_sitta",
+        success_condition,
+        metadata=dict(METADATA),
     )
 
-    flagpole_x = rng.uniform(-4, 4)
-    flagpole_length = rng.uniform(3, 7)
-    flagpole_y = purple_ground.y + purple_ground.thickness / 2 + flagpole_length / 2
-    flagpole = Bar(
-        x=flagpole_x,
-        y=flagpole_y,
-        length=flagpole_length,
-        thickness=0.2,
-        angle=90.0,
-        color="gray",
-        friction=0.8,
-        dynamic=True,
-    )
 
-    green_ball_radius = rng.uniform(0.5, 1.0)
-    green_ball_x = flagpole_x
-    green_ball_y = flagpole_y + flagpole_length / 2 + green_ball_radius
-    green_ball = Ball(
-        x=green_ball_x,
-        y=green_ball_y,
-        radius=green_ball_radius,
-        color="green",
-        friction=0.8,
-        dynamic=True,
-    )
+def build_batch(rng: np.random.Generator, k: int) -> ObjectTable:
+    """
+    Draw k variants of the level at once, see interphyre.levels.generate_levels.
 
-    red_ball_radius = rng.uniform(0.2, 0.7)
-    red_ball_x = flagpole_x
-    red_ball_y = flagpole_y + flagpole_length / 2 + red_ball_radius
-    red_ball = Ball(
-        x=red_ball_x,
-        y=red_ball_y,
-        radius=red_ball_radius,
-        color="red",
-        dynamic=True,
-    )
+    build_level(seed) is the batch of one drawn from default_rng(seed).
+    """
+    ground_y = -4.9
+    ground_thickness = 0.2
+
+    flagpole_x = rng.uniform(-4, 4, k)
+    flagpole_length = rng.uniform(3, 7, k)
+    flagpole_y = ground_y + ground_thickness / 2 + flagpole_length / 2
+    flagpole_top = flagpole_y + flagpole_length / 2
+
+    green_ball_radius = rng.uniform(0.5, 1.0, k)
+    green_ball_y = flagpole_top + green_ball_radius
+
+    red_ball_radius = rng.uniform(0.2, 0.7, k)
+    red_ball_y = flagpole_top + red_ball_radius
 
     ceiling_clearance = 0.2
-    ceiling = Bar(
-        x=0.0,
-        y=green_ball_y + green_ball_radius + ceiling_clearance,
-        length=10.0,
-        thickness=0.2,
-        angle=0.0,
-        color="black",
-        dynamic=False,
-    )
+    ceiling_y = green_ball_y + green_ball_radius + ceiling_clearance
 
-    ramp_offset = rng.uniform(1, 2)
+    ramp_offset = rng.uniform(1, 2, k)
     ramp_angle = 45  # 45 degrees angle
 
     # Wall thickness
     wall_thickness = 0.2
 
     # Calculate ramp length using trigonometry
-    ramp_length = round(ramp_offset / np.cos(np.radians(ramp_angle)), 2)
+    ramp_length = np.round(ramp_offset / np.cos(np.radians(ramp_angle)), 2)
 
-    # Left ramp
     # Position calculations accounting for wall thickness
     left_ramp_x = -5 + ramp_offset / 2 + wall_thickness / 2
     left_ramp_y = -5 + ramp_offset / 2 + wall_thickness + 0.1
-
-    left_ramp = Bar(
-        x=left_ramp_x,
-        y=left_ramp_y,
-        length=ramp_length,
-        thickness=wall_thickness,
-        angle=-ramp_angle,  # Negative angle for left ramp (pointing up and right)
-        color="black",
-        dynamic=False,
-    )
-
-    # Right ramp
-    # Position calculations accounting for wall thickness
     right_ramp_x = 5 - ramp_offset / 2 - wall_thickness / 2
     right_ramp_y = -5 + ramp_offset / 2 + wall_thickness / 2 + 0.1
 
-    right_ramp = Bar(
-        x=right_ramp_x,
-        y=right_ramp_y,
-        length=ramp_length,
-        thickness=wall_thickness,
-        angle=ramp_angle,  # Positive angle for right ramp (pointing up and left)
-        color="black",
-        dynamic=False,
-    )
-
-    # Assemble objects dictionary.
-    objects = {
-        "purple_ground": purple_ground,
-        "flagpole": flagpole,
-        "green_ball": green_ball,
-        "red_ball": red_ball,
-        "ceiling": ceiling,
-        "left_ramp": left_ramp,
-        "right_ramp": right_ramp,
-    }
-
-    return Level(
-        name="flagpole_sitta",
-        objects=cast(dict[str, PhyreObject], objects),
-        action_objects=["red_ball"],
-        success_condition=success_condition,
-        metadata={
-            "description": "Knock the green ball off of the pole and onto the ground"
+    return ObjectTable.from_batch(
+        k,
+        {
+            "purple_ground": (
+                Bar,
+                dict(
+                    x=0.0,
+                    y=ground_y,
+                    length=10.0,
+                    thickness=ground_thickness,
+                    angle=0.0,
+                    color="purple",
+                    dynamic=False,
+                ),
+            ),
+            "flagpole": (
+                Bar,
+                dict(
+                    x=flagpole_x,
+                    y=flagpole_y,
+                    length=flagpole_length,
+                    thickness=0.2,
+                    angle=90.0,
+                    color="gray",
+                    friction=0.8,
+                    dynamic=True,
+                ),
+            ),
+            "green_ball": (
+                Ball,
+                dict(
+                    x=flagpole_x,
+                    y=green_ball_y,
+                    radius=green_ball_radius,
+                    color="green",
+                    friction=0.8,
+                    dynamic=True,
+                ),
+            ),
+            "red_ball": (
+                Ball,
+                dict(
+                    x=flagpole_x,
+                    y=red_ball_y,
+                    radius=red_ball_radius,
+                    color="red",
+                    dynamic=True,
+                ),
+            ),
+            "ceiling": (
+                Bar,
+                dict(
+                    x=0.0,
+                    y=ceiling_y,
+                    length=10.0,
+                    thickness=0.2,
+                    angle=0.0,
+                    color="black",
+                    dynamic=False,
+                ),
+            ),
+            # Negative angle for left ramp (pointing up and right)
+            "left_ramp": (
+                Bar,
+                dict(
+                    x=left_ramp_x,
+                    y=left_ramp_y,
+                    length=ramp_length,
+                    thickness=wall_thickness,
+                    angle=-ramp_angle,
+                    color="black",
+                    dynamic=False,
+                ),
+            ),
+            # Positive angle for right ramp (pointing up and left)
+            "right_ramp": (
+                Bar,
+                dict(
+                    x=right_ramp_x,
+                    y=right_ramp_y,
+                    length=ramp_length,
+                    thickness=wall_thickness,
+                    angle=ramp_angle,
+                    color="black",
+                    dynamic=False,
+                ),
+            ),
         },
+        action_objects=["red_ball"],
     )
@@ -1,47 +1,42 @@
 import numpy as np
-from typing import cast
-from interphyre.objects import Ball, Bar, Basket, PhyreObject
+from interphyre.objects import Ball, Bar, ObjectTable
+from interphyre.conditions import ContactFor
 from interphyre.level import Level
 from interphyre.levels import register_level
 
+METADATA = {"description": "Make the green ball hit the ground"}
 
-def success_condition(engine):
 
-    success_time = engine.default_success_time
-    return engine.is_in_contact_for_duration(
-        "green_ball", "purple_ground", success_time
-    )
+success_condition = ContactFor("green_ball", "purple_ground")
 
 
-@register_level
+@register_level("pinhole")
 def build_level(seed=None) -> Level:
-    rng = np.random.default_rng(seed)
-
-    purple_ground = Bar(
-        x=0.0,
-        y=-4.9,
-        length=10.0,
-        thickness=0.2,
-        angle=0.0,
-        color="purple",
-        dynamic=False,
+    return Level.from_table(
+        build_batch(np.random.default_rng(seed), 1),
+        "pinhole",
+        success_condition,
+        metadata=dict(METADATA),
     )
 
-    pinhole_x = rng.choice([rng.uniform(-3, -0.25), rng.uniform(0.25, 3)])
+
+def build_batch(rng: np.random.Generator, k: int) -> ObjectTable:
+    """
+    Draw k variants of the level at once, see interphyre.levels.generate_levels.
+
+    build_level(seed) is the batch of one drawn from default_rng(seed).
+    """
+    # The pinhole is left or right of the center
+    pinhole_left_x = rng.uniform(-3, -0.25, k)
+    pinhole_right_x = rng.uniform(0.25, 3, k)
+    pinhole_x = np.where(rng.integers(0, 2, k) == 0, pinhole_left_x, pinhole_right_x)
 
     green_ball_radius = 0.4
-    green_ball_x = np.clip(pinhole_x + rng.uniform(-2, 2), -4, 4)
-    green_ball_y = rng.uniform(3, 5 - green_ball_radius)
-    green_ball = Ball(
-        x=green_ball_x,
-        y=green_ball_y,
-        radius=green_ball_radius,
-        color="green",
-        dynamic=True,
-    )
+    green_ball_x = np.clip(pinhole_x + rng.uniform(-2, 2, k), -4, 4)
+    green_ball_y = rng.uniform(3, 5 - green_ball_radius, k)
 
     pinhole_width = 2 * green_ball_radius + 0.1
-    platform_y = rng.uniform(-2, 2)
+    platform_y = rng.uniform(-2, 2, k)
 
     left_gap_edge = pinhole_x - pinhole_width / 2
     left_platform_length = left_gap_edge - (-5)
@@ -51,63 +46,86 @@ def build_level(seed=None) -> Level:
     right_platform_length = 5 - right_gap_edge
     right_platform_x = 5 - right_platform_length / 2
 
-    left_platform = Bar(
-        x=left_platform_x,
-        y=platform_y,
-        length=left_platform_length,
-        thickness=0.2,
-        angle=0.0,
-        color="black",
-        dynamic=False,
-    )
-
-    right_platform = Bar(
-        x=right_platform_x,
-        y=platform_y,
-        length=right_platform_length,
-        thickness=0.2,
-        angle=0.0,
-        color="black",
-        dynamic=False,
-    )
-
     gray_ball_radius = 0.5
-    gray_ball_x = pinhole_x + rng.uniform(-1, 1)
+    gray_ball_x = pinhole_x + rng.uniform(-1, 1, k)
     gray_ball_y = rng.uniform(
         platform_y + gray_ball_radius, green_ball_y - gray_ball_radius
     )
-    gray_ball = Ball(
-        x=gray_ball_x,
-        y=gray_ball_y,
-        radius=gray_ball_radius,
-        color="gray",
-        dynamic=True,
-    )
-    # Create the red ball (action object).
-    red_ball_x = rng.uniform(-4.5, 4.5)
-    red_ball_y = rng.uniform(-2, 4)
-    red_ball_radius = rng.uniform(0.3, 0.7)
-    red_ball = Ball(
-        x=red_ball_x,
-        y=red_ball_y,
-        radius=red_ball_radius,
-        color="red",
-        dynamic=True,
-    )
-
-    objects = {
-        "green_ball": green_ball,
-        "red_ball": red_ball,
-        "gray_ball": gray_ball,
-        "purple_ground": purple_ground,
-        "left_platform": left_platform,
-        "right_platform": right_platform,
-    }
 
-    return Level(
-        name="pinhole",
-        objects=cast(dict[str, PhyreObject], objects),
+    # Create the red ball (action object).
+    red_ball_x = rng.uniform(-4.5, 4.5, k)
+    red_ball_y = rng.uniform(-2, 4, k)
+    red_ball_radius = rng.uniform(0.3, 0.7, k)
+
+    return ObjectTable.from_batch(
+        k,
+        {
+            "green_ball": (
+                Ball,
+                dict(
+                    x=green_ball_x,
+                    y=green_ball_y,
+                    radius=green_ball_radius,
+                    color="green",
+                    dynamic=True,
+                ),
+            ),
+            "red_ball": (
+                Ball,
+                dict(
+                    x=red_ball_x,
+                    y=red_ball_y,
+                    radius=red_ball_radius,
+                    color="red",
+                    dynamic=True,
+                ),
+            ),
+            "gray_ball": (
+                Ball,
+                dict(
+                    x=gray_ball_x,
+                    y=gray_ball_y,
+                    radius=gray_ball_radius,
+                    color="gray",
+                    dynamic=True,
+                ),
+            ),
+            "purple_ground": (
+                Bar,
+                dict(
+                    x=0.0,
+                    y=-4.9,
+                    length=10.0,
+                    thickness=0.2,
+                    angle=0.0,
+                    color="purple",
+                    dynamic=False,
+                ),
+            ),
+            "left_platform": (
+                Bar,
+                dict(
+                    x=left_platform_x,
+                    y=platform_y,
+                    length=left_platform_length,
+                    thickness=0.2,
+                    angle=0.0,
+                    color="black",
+                    dynamic=False,
+                ),
+            ),
+            "right_platform": (
+                Bar,
+                dict(
+                    x=right_platform_x,
+                    y=platform_y,
+                    length=right_platform_length,
+                    thickness=0.2,
+                    angle=0.0,
+                    color="black",
+                    dynamic=False,
+                ),
+            ),
+        },
         action_objects=["red_ball"],
-        success_condition=success_condition,
-        metadata={"description": "Make the green ball hit the ground"},
     )
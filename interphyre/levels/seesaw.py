@@ -1,230 +1,244 @@
 import numpy as np
-from interphyre.objects import Ball, Bar, PhyreObject
+from interphyre.objects import Ball, Bar, ObjectTable
+from interphyre.conditions import ContactFor
 from interphyre.level import Level
-from typing import cast
+from typing import Tuple
 from interphyre.levels import register_level
 
+METADATA = {"description": "Make sure the green ball is touching the blue bar"}
+
+# Layouts drawn before build_level gives up on a seed
+MAX_ATTEMPTS = 1000
+
 
 # TODO - some levels are unsolvable because the barriers are too high for the green ball to make it in
-def success_condition(engine):
-    success_time = engine.default_success_time
-    return engine.is_in_contact_for_duration(
-        "green_ball", "blue_platform", success_time
-    )
+success_condition = ContactFor("green_ball", "blue_platform")
 
 
-@register_level
+@register_level("seesaw")
 def build_level(seed=None):
-    rng = np.random.default_rng(seed)
+    table, attempts = _draw_batch(np.random.default_rng(seed), 1)
+    return Level.from_table(
+        table,
+        "seesaw",
+        success_condition,
+        metadata={**METADATA, "generation_attempts": int(attempts[0])},
+    )
+
+
+def build_batch(rng: np.random.Generator, k: int) -> ObjectTable:
+    """Draw k variants of the level at once, see interphyre.levels.generate_levels."""
+    return _draw_batch(rng, k)[0]
+
+
+def _draw_batch(rng: np.random.Generator, k: int) -> Tuple[ObjectTable, np.ndarray]:
+    """
+    Draw k variants and the number of layouts drawn for each.
 
-    valid_level_found = False
+    Layouts without room for the green ball are redrawn, only for the variants
+    that need it. Every round draws its arrays in a fixed order, so with k == 1
+    the random stream is consumed exactly like one scalar draw per parameter.
+    """
     black_ball_radius = 0.4
+    platform_thickness = 0.2  # Default thickness
+    min_clearance = 0.2
+    green_ball_radius = 0.4
+    barrier_thickness = 0.2
+
+    floor_y = np.empty(k)
+    blue_platform_x = np.empty(k)
+    blue_platform_length = np.empty(k)
+    left_barrier_x = np.empty(k)
+    right_barrier_x = np.empty(k)
+    barrier_length = np.empty(k)
+    barrier_y = np.empty(k)
+    green_ball_x = np.empty(k)
+    attempts = np.zeros(k, dtype=int)
+
+    pending = np.arange(k)
+    rounds = 0
+    while pending.size:
+        if rounds == MAX_ATTEMPTS:
+            raise ValueError(
+                f"No valid seesaw layout found after {MAX_ATTEMPTS} attempts."
+            )
+        rounds += 1
+        attempts[pending] += 1
+        n = pending.size
 
-    while not valid_level_found:
         # Floor placement (keeping within bounds)
-        floor_y = rng.uniform(-4.7, 2.5)
+        floor_y_n = rng.uniform(-4.7, 2.5, n)
 
-        # Blue platform placement
-        blue_platform_length = rng.uniform(
-            3, min(5.5, 10 - 2 * black_ball_radius)
+        # Blue platform placement, centered directly above the black ball
+        length_n = rng.uniform(
+            3, min(5.5, 10 - 2 * black_ball_radius), n
         )  # Ensure it fits
-        platform_thickness = 0.2  # Default thickness
-
-        # Black ball placement
-        black_ball_x = rng.uniform(
-            -5 + blue_platform_length / 2 + black_ball_radius,
-            5 - blue_platform_length / 2 - black_ball_radius,
-        )
-
-        # Position blue platform centered directly above the black ball
-        blue_platform_y = (floor_y + 2 * black_ball_radius + 0.1) + (
-            platform_thickness / 2
+        platform_x_n = rng.uniform(
+            -5 + length_n / 2 + black_ball_radius,
+            5 - length_n / 2 - black_ball_radius,
         )
-        blue_platform_x = black_ball_x
-
-        # Calculate platform edges
-        platform_left = blue_platform_x - blue_platform_length / 2
-        platform_right = blue_platform_x + blue_platform_length / 2
+        platform_left = platform_x_n - length_n / 2
+        platform_right = platform_x_n + length_n / 2
 
-        # Calculate barrier positions that respect minimum clearance from blue platform
-        min_clearance = 0.2
+        # Barrier positions that respect minimum clearance from blue platform
         barrier_offset_x = rng.uniform(
-            min(blue_platform_length / 2 + min_clearance, 5 - blue_platform_x),
-            max(blue_platform_length / 2 + min_clearance, blue_platform_x - 5),
+            np.minimum(length_n / 2 + min_clearance, 5 - platform_x_n),
+            np.maximum(length_n / 2 + min_clearance, platform_x_n - 5),
         )
-
-        # Ensure these positions are within bounds
-        left_barrier_x = blue_platform_x - barrier_offset_x
-        right_barrier_x = blue_platform_x + barrier_offset_x
+        left_x_n = platform_x_n - barrier_offset_x
+        right_x_n = platform_x_n + barrier_offset_x
 
         # Push the barrier out of bounds if they are too close to the edge, effectively leaving one barrier in the scene
-        left_barrier_x = -5.1 if left_barrier_x < -4.9 else left_barrier_x
-        right_barrier_x = 5.1 if right_barrier_x > 4.9 else right_barrier_x
+        left_x_n = np.where(left_x_n < -4.9, -5.1, left_x_n)
+        right_x_n = np.where(right_x_n > 4.9, 5.1, right_x_n)
 
         # Ensure barrier height and length are valid
-        barrier_length = rng.uniform(1, 4.5 - floor_y)
-        barrier_y = rng.uniform(floor_y + barrier_length / 2, 5 - barrier_length / 2)
-
-        # Green ball placement - accounting for clearance from barriers
-        green_ball_radius = 0.4
-        barrier_thickness = 0.2
-
-        # Calculate zones where green ball can be placed, accounting for barriers and blue platform
-        # Zone to the left of left barrier
-        left_zone_max = (
-            left_barrier_x - (barrier_thickness / 2) - green_ball_radius - min_clearance
+        barrier_length_n = rng.uniform(1, 4.5 - floor_y_n)
+        barrier_y_n = rng.uniform(
+            floor_y_n + barrier_length_n / 2, 5 - barrier_length_n / 2
         )
-        left_zone_min = -5 + green_ball_radius + 0.1
-        valid_left_zone = left_zone_min < left_zone_max
 
-        # Zone between left barrier and blue platform
-        mid_left_zone_max = platform_left - green_ball_radius - min_clearance
-        mid_left_zone_min = (
-            left_barrier_x + (barrier_thickness / 2) + green_ball_radius + min_clearance
+        # Zones where the green ball can be placed, accounting for barriers and
+        # blue platform: left of the left barrier, between the left barrier and
+        # the platform, between the platform and the right barrier, and right of
+        # the right barrier
+        zone_min = np.stack(
+            [
+                np.full(n, -5 + green_ball_radius + 0.1),
+                left_x_n + (barrier_thickness / 2) + green_ball_radius + min_clearance,
+                platform_right + green_ball_radius + min_clearance,
+                right_x_n + (barrier_thickness / 2) + green_ball_radius + min_clearance,
+            ],
+            axis=1,
         )
-        valid_mid_left_zone = mid_left_zone_min < mid_left_zone_max
-
-        # Zone between blue platform and right barrier
-        mid_right_zone_max = (
-            right_barrier_x
-            - (barrier_thickness / 2)
-            - green_ball_radius
-            - min_clearance
+        zone_max = np.stack(
+            [
+                left_x_n - (barrier_thickness / 2) - green_ball_radius - min_clearance,
+                platform_left - green_ball_radius - min_clearance,
+                right_x_n - (barrier_thickness / 2) - green_ball_radius - min_clearance,
+                np.full(n, 5 - green_ball_radius - 0.1),
+            ],
+            axis=1,
         )
-        mid_right_zone_min = platform_right + green_ball_radius + min_clearance
-        valid_mid_right_zone = mid_right_zone_min < mid_right_zone_max
-
-        # Zone to the right of right barrier
-        right_zone_max = 5 - green_ball_radius - 0.1
-        right_zone_min = (
-            right_barrier_x
-            + (barrier_thickness / 2)
-            + green_ball_radius
-            + min_clearance
-        )
-        valid_right_zone = right_zone_min < right_zone_max
-
-        # Collect all valid zones
-        valid_zones = []
-        if valid_left_zone:
-            valid_zones.append((left_zone_min, left_zone_max))
-        if valid_mid_left_zone:
-            valid_zones.append((mid_left_zone_min, mid_left_zone_max))
-        if valid_mid_right_zone:
-            valid_zones.append((mid_right_zone_min, mid_right_zone_max))
-        if valid_right_zone:
-            valid_zones.append((right_zone_min, right_zone_max))
-
-        # Choose a zone and position green ball
-        if valid_zones:
-            chosen_zone = rng.choice(valid_zones)
-            green_ball_x = rng.uniform(chosen_zone[0], chosen_zone[1])
-            valid_level_found = True
-        else:
-            print("No valid zones found, trying again")
-
-    # Always place green ball at the top of the environment
-    green_ball_y = 5 - green_ball_radius - 0.1  # Just below the top boundary
-
-    floor = Bar(
-        x=0.0,
-        y=floor_y,
-        length=10.0,
-        angle=0.0,
-        color="black",
-        dynamic=False,
-    )
-
-    black_ball = Ball(
-        x=black_ball_x,
-        y=floor_y + black_ball_radius + 0.1,
-        radius=black_ball_radius,
-        color="black",
-        dynamic=False,
-    )
-
-    blue_platform = Bar(
-        x=blue_platform_x,
-        y=blue_platform_y,
-        length=blue_platform_length,
-        angle=0.0,
-        color="blue",
-        dynamic=True,
-    )
-
-    # Create barriers and green ball
-    left_barrier = Bar(
-        x=left_barrier_x,
-        y=barrier_y,
-        length=barrier_length,
-        angle=90.0,
-        color="black",
-        dynamic=False,
-    )
-
-    right_barrier = Bar(
-        x=right_barrier_x,
-        y=barrier_y,
-        length=barrier_length,
-        angle=-90.0,
-        color="black",
-        dynamic=False,
-    )
-
-    green_ball = Ball(
-        x=green_ball_x,
-        y=green_ball_y,
-        radius=green_ball_radius,
-        color="green",
-        dynamic=True,
-    )
+        valid_zones = zone_min < zone_max
+        ok = valid_zones.any(axis=1)
+
+        # Choose one of the valid zones uniformly and place the green ball in it
+        rows = np.flatnonzero(ok)
+        choice = rng.integers(0, valid_zones[rows].sum(axis=1))
+        zone = np.argmax(np.cumsum(valid_zones[rows], axis=1) > choice[:, None], axis=1)
+        done = pending[rows]
+        green_ball_x[done] = rng.uniform(zone_min[rows, zone], zone_max[rows, zone])
+        floor_y[done] = floor_y_n[rows]
+        blue_platform_x[done] = platform_x_n[rows]
+        blue_platform_length[done] = length_n[rows]
+        left_barrier_x[done] = left_x_n[rows]
+        right_barrier_x[done] = right_x_n[rows]
+        barrier_length[done] = barrier_length_n[rows]
+        barrier_y[done] = barrier_y_n[rows]
+        pending = pending[~ok]
 
     # Red ball placement - ensure it's above the floor
-    red_ball_radius = rng.uniform(0.2, 0.8)  # Reduced max size to avoid issues
-    red_ball_y = max(-4.9, floor_y + red_ball_radius + 0.1)  # Ensure above floor
-
-    # Find a clear spot for the red ball
-    red_ball_x_candidates = []
-    for x in np.linspace(-4.5 + red_ball_radius, 4.5 - red_ball_radius, 20):
-        # Check for overlaps with other objects (simplified)
-        if (
-            abs(x - black_ball_x) > (black_ball_radius + red_ball_radius + 0.1)
-            and abs(x - green_ball_x) > (green_ball_radius + red_ball_radius + 0.1)
-            and abs(x - left_barrier_x)
-            > (barrier_thickness / 2 + red_ball_radius + 0.1)
-            and abs(x - right_barrier_x)
-            > (barrier_thickness / 2 + red_ball_radius + 0.1)
-        ):
-            red_ball_x_candidates.append(x)
-
-    if red_ball_x_candidates:
-        red_ball_x = rng.choice(red_ball_x_candidates)
-    else:
-        # Fallback position
-        red_ball_x = rng.uniform(-4.5 + red_ball_radius, 4.5 - red_ball_radius)
-
-    red_ball = Ball(
-        x=red_ball_x,
-        y=red_ball_y,
-        radius=red_ball_radius,
-        color="red",
-        dynamic=True,
+    red_ball_radius = rng.uniform(0.2, 0.8, k)  # Reduced max size to avoid issues
+    red_ball_y = np.maximum(-4.9, floor_y + red_ball_radius + 0.1)
+
+    # Find a clear spot for the red ball among 20 candidate positions
+    candidates = np.linspace(-4.5 + red_ball_radius, 4.5 - red_ball_radius, 20, axis=1)
+    r = red_ball_radius[:, None]
+    clear = (
+        (np.abs(candidates - blue_platform_x[:, None]) > (black_ball_radius + r + 0.1))
+        & (np.abs(candidates - green_ball_x[:, None]) > (green_ball_radius + r + 0.1))
+        & (
+            np.abs(candidates - left_barrier_x[:, None])
+            > (barrier_thickness / 2 + r + 0.1)
+        )
+        & (
+            np.abs(candidates - right_barrier_x[:, None])
+            > (barrier_thickness / 2 + r + 0.1)
+        )
+    )
+    red_ball_x = np.empty(k)
+    has_clear = clear.any(axis=1)
+    rows = np.flatnonzero(has_clear)
+    choice = rng.integers(0, clear[rows].sum(axis=1))
+    column = np.argmax(np.cumsum(clear[rows], axis=1) > choice[:, None], axis=1)
+    red_ball_x[rows] = candidates[rows, column]
+    # Fallback position
+    fallback = ~has_clear
+    red_ball_x[fallback] = rng.uniform(
+        -4.5 + red_ball_radius[fallback], 4.5 - red_ball_radius[fallback]
     )
 
-    objects = {
-        "floor": floor,
-        "green_ball": green_ball,
-        "red_ball": red_ball,
-        "black_ball": black_ball,
-        "blue_platform": blue_platform,
-        "left_barrier": left_barrier,
-        "right_barrier": right_barrier,
-    }
-
-    return Level(
-        name="seesaw",
-        objects=cast(dict[str, PhyreObject], objects),
+    table = ObjectTable.from_batch(
+        k,
+        {
+            "floor": (
+                Bar,
+                dict(x=0.0, y=floor_y, length=10.0, color="black", dynamic=False),
+            ),
+            "green_ball": (
+                Ball,
+                dict(
+                    x=green_ball_x,
+                    y=5 - green_ball_radius - 0.1,
+                    radius=green_ball_radius,
+                    color="green",
+                    dynamic=True,
+                ),
+            ),
+            "red_ball": (
+                Ball,
+                dict(
+                    x=red_ball_x,
+                    y=red_ball_y,
+                    radius=red_ball_radius,
+                    color="red",
+                    dynamic=True,
+                ),
+            ),
+            "black_ball": (
+                Ball,
+                dict(
+                    x=blue_platform_x,
+                    y=floor_y + black_ball_radius + 0.1,
+                    radius=black_ball_radius,
+                    color="black",
+                    dynamic=False,
+                ),
+            ),
+            "blue_platform": (
+                Bar,
+                dict(
+                    x=blue_platform_x,
+                    y=floor_y + 2 * black_ball_radius + 0.1 + platform_thickness / 2,
+                    length=blue_platform_length,
+                    color="blue",
+                    dynamic=True,
+                ),
+            ),
+            "left_barrier": (
+                Bar,
+                dict(
+                    x=left_barrier_x,
+                    y=barrier_y,
+                    length=barrier_length,
+                    angle=90.0,
+                    color="black",
+                    dynamic=False,
+                ),
+            ),
+            "right_barrier": (
+                Bar,
+                dict(
+                    x=right_barrier_x,
+                    y=barrier_y,
+                    length=barrier_length,
+                    angle=-90.0,
+                    color="black",
+                    dynamic=False,
+                ),
+            ),
+        },
         action_objects=["red_ball"],
-        success_condition=success_condition,
-        metadata={"description": "Make sure the green ball is touching the blue bar"},
     )
+    return table, attempts
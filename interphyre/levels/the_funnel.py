@@ -1,108 +1,122 @@
 import numpy as np
-from typing import cast
-from interphyre.objects import Ball, Bar, PhyreObject
+from interphyre.objects import Ball, Bar, ObjectTable
+from interphyre.conditions import ContactFor
 from interphyre.level import Level
 from interphyre.levels import register_level
 
+METADATA = {
+    "description": "Make sure the green ball goes through the funnel and hits the purple pad"
+}
 
-def success_condition(engine):
-    success_time = engine.default_success_time
-    return engine.is_in_contact_for_duration("green_ball", "purple_pad", success_time)
 
+success_condition = ContactFor("green_ball", "purple_pad")
 
-@register_level
+
+@register_level("the_funnel")
 def build_level(seed=None) -> Level:
-    rng = np.random.default_rng(seed)
+    return Level.from_table(
+        build_batch(np.random.default_rng(seed), 1),
+        "the_funnel",
+        success_condition,
+        metadata=dict(METADATA),
+    )
+
+
+def build_batch(rng: np.random.Generator, k: int) -> ObjectTable:
+    """
+    Draw k variants of the level at once, see interphyre.levels.generate_levels.
 
+    build_level(seed) is the batch of one drawn from default_rng(seed).
+    """
     green_ball_radius = 0.3
-    green_ball = Ball(
-        x=rng.uniform(-1.0, 1.0),
-        y=(5 - green_ball_radius),
-        radius=green_ball_radius,
-        color="green",
-        dynamic=True,
-    )
-    red_ball = Ball(
-        x=0.0,
-        y=0.0,
-        radius=0.4,
-        color="red",
-        dynamic=True,
-    )
-    # Generate random angle between 15 and 35 degrees
-    funnel_angle = rng.uniform(10.0, 35.0)
+    green_ball_x = rng.uniform(-1.0, 1.0, k)
 
-    # Safety margin to prevent ceiling clipping
-    safety_margin = 0.5
+    # Generate random angle between 10 and 35 degrees
+    funnel_angle = rng.uniform(10.0, 35.0, k)
 
-    height_offset = rng.uniform(-1.0, 1.0)
+    height_offset = rng.uniform(-1.0, 1.0, k)
     funnel_y = 2 + height_offset
-    funnel_x = 3 + rng.uniform(0, 0.25)
-    # Calculate required length to reach walls (-5 to 5) while maintaining minimum gap
-    # The gap at the bottom of the funnel should be at least 0.5
-    # Using trigonometry: length = (wall_distance - gap/2) / cos(angle)
+    funnel_x = 3 + rng.uniform(0, 0.25, k)
+    # Calculate required length to reach walls (-5 to 5)
+    # Using trigonometry: length = wall_distance / cos(angle)
     wall_distance = 5.0  # Distance from center to wall
     funnel_length = wall_distance / np.cos(np.radians(funnel_angle))
 
-    left_funnel = Bar(
-        x=-funnel_x,
-        y=funnel_y,
-        length=funnel_length,
-        angle=-funnel_angle,
-        color="black",
-        dynamic=False,
-    )
-    right_funnel = Bar(
-        x=funnel_x,
-        y=funnel_y,
-        length=funnel_length,
-        angle=funnel_angle,
-        color="black",
-        dynamic=False,
-    )
+    # The purple pad is in the left or right corner
+    corner_pos = np.array([-1.0, 1.0])[rng.integers(0, 2, k)]
 
-    corner_pos = rng.choice([-1.0, 1.0])
-    purple_pad = Bar(
-        x=corner_pos * 4.0,
-        y=-4.9,
-        length=2.0,
-        angle=0.0,
-        color="purple",
-        dynamic=False,
-    )
-    ground = Bar(
-        x=-corner_pos,
-        y=-4.9,
-        length=8.0,
-        angle=0.0,
-        color="black",
-        dynamic=False,
-    )
-    black_pad = Bar(
-        x=corner_pos * 2.0,
-        y=-4.7,
-        length=2.0,
-        angle=0.0,
-        color="black",
-        dynamic=False,
-    )
-
-    objects = {
-        "green_ball": green_ball,
-        "red_ball": red_ball,
-        "left_funnel": left_funnel,
-        "right_funnel": right_funnel,
-        "black_pad": black_pad,
-        "purple_pad": purple_pad,
-        "ground": ground,
-    }
-
-    return Level(
-        name="the_funnel",
-        objects=cast(dict[str, PhyreObject], objects),
-        action_objects=["red_ball"],
-        success_condition=success_condition,
-        metadata={
-            "description": "Make sure the green ball goes through the funnel and hits the purple pad"
+    return ObjectTable.from_batch(
+        k,
+        {
+            "green_ball": (
+                Ball,
+                dict(
+                    x=green_ball_x,
+                    y=5 - green_ball_radius,
+                    radius=green_ball_radius,
+                    color="green",
+                    dynamic=True,
+                ),
+            ),
+            "red_ball": (
+                Ball,
+                dict(x=0.0, y=0.0, radius=0.4, color="red", dynamic=True),
+            ),
+            "left_funnel": (
+                Bar,
+                dict(
+                    x=-funnel_x,
+                    y=funnel_y,
+                    length=funnel_length,
+                    angle=-funnel_angle,
+                    color="black",
+                    dynamic=False,
+                ),
+            ),
+            "right_funnel": (
+                Bar,
+                dict(
+                    x=funnel_x,
+                    y=funnel_y,
+                    length=funnel_length,
+                    angle=funnel_angle,
+                    color="black",
+                    dynamic=False,
+                ),
+            ),
+            "black_pad": (
+                Bar,
+                dict(
+                    x=corner_pos * 2.0,
+                    y=-4.7,
+                    length=2.0,
+                    angle=0.0,
+                    color="black",
+                    dynamic=False,
+                ),
+            ),
+            "purple_pad": (
+                Bar,
+                dict(
+                    x=corner_pos * 4.0,
+                    y=-4.9,
+                    length=2.0,
+                    angle=0.0,
+                    color="purple",
+                    dynamic=False,
+                ),
+            ),
+            "ground": (
+                Bar,
+                dict(
+                    x=-corner_pos,
+                    y=-4.9,
+                    length=8.0,
+                    angle=0.0,
+                    color="black",
+                    dynamic=False,
+                ),
+            ),
         },
+        action_objects=["red_ball"],
     )
@@ -1,71 +1,88 @@
 import numpy as np
-from typing import cast
-from interphyre.objects import Ball, Basket, Bar, PhyreObject
+from interphyre.objects import Ball, Basket, Bar, ObjectTable
+from interphyre.conditions import ContactFor
 from interphyre.level import Level
 from interphyre.levels import register_level
 
+METADATA = {"description": "Make the green ball hit the left or right wall"}
 
-def success_condition(engine):
-    success_time = engine.default_success_time
-    return engine.is_in_contact_for_duration(
-        "green_platform", "purple_wall", success_time
-    )
 
+success_condition = ContactFor("green_platform", "purple_wall")
 
-@register_level
-def build_level(seed=None) -> Level:
-    rng = np.random.default_rng(seed)
 
-    # Randomly adjust green_platform's attributes.
-    green_platform_x = rng.uniform(-4, 4)
-    green_platform_length = rng.uniform(2, 7)
-    green_platform_y = -4.9 + green_platform_length / 2
-    green_platform = Bar(
-        x=green_platform_x,
-        y=green_platform_y,
-        length=green_platform_length,
-        angle=90.0,
-        thickness=0.15,
-        color="green",
-        dynamic=True,
+@register_level("tipping_point")
+def build_level(seed=None) -> Level:
+    return Level.from_table(
+        build_batch(np.random.default_rng(seed), 1),
+        "tipping_point",
+        success_condition,
+        metadata=dict(METADATA),
     )
 
-    basket = Basket(
-        x=green_platform_x,
-        y=-4.9,
-        scale=0.5,
-        color="gray",
-        dynamic=True,
-    )
 
-    purple_wall = Bar(
-        x=rng.choice([-4.9, 4.9]),
-        y=0.0,
-        length=10.0,
-        angle=90.0,
-        color="purple",
-        dynamic=False,
-    )
+def build_batch(rng: np.random.Generator, k: int) -> ObjectTable:
+    """
+    Draw k variants of the level at once, see interphyre.levels.generate_levels.
 
-    red_ball = Ball(
-        x=rng.uniform(-4.5, 4.5),
-        y=rng.uniform(-2, 4),
-        radius=rng.uniform(0.4, 0.9),
-        color="red",
-        dynamic=True,
-    )
+    build_level(seed) is the batch of one drawn from default_rng(seed).
+    """
+    # Randomly adjust green_platform's attributes.
+    green_platform_x = rng.uniform(-4, 4, k)
+    green_platform_length = rng.uniform(2, 7, k)
+    green_platform_y = -4.9 + green_platform_length / 2
+
+    purple_wall_x = np.array([-4.9, 4.9])[rng.integers(0, 2, k)]
 
-    objects = {
-        "green_platform": green_platform,
-        "red_ball": red_ball,
-        "purple_wall": purple_wall,
-        "basket": basket,
-    }
+    red_ball_x = rng.uniform(-4.5, 4.5, k)
+    red_ball_y = rng.uniform(-2, 4, k)
+    red_ball_radius = rng.uniform(0.4, 0.9, k)
 
-    return Level(
-        name="tipping_point",
-        objects=cast(dict[str, PhyreObject], objects),
+    return ObjectTable.from_batch(
+        k,
+        {
+            "green_platform": (
+                Bar,
+                dict(
+                    x=green_platform_x,
+                    y=green_platform_y,
+                    length=green_platform_length,
+                    angle=90.0,
+                    thickness=0.15,
+                    color="green",
+                    dynamic=True,
+                ),
+            ),
+            "red_ball": (
+                Ball,
+                dict(
+                    x=red_ball_x,
+                    y=red_ball_y,
+                    radius=red_ball_radius,
+                    color="red",
+                    dynamic=True,
+                ),
+            ),
+            "purple_wall": (
+                Bar,
+                dict(
+                    x=purple_wall_x,
+                    y=0.0,
+                    length=10.0,
+                    angle=90.0,
+                    color="purple",
+                    dynamic=False,
+                ),
+            ),
+            "basket": (
+                Basket,
+                dict(
+                    x=green_platform_x,
+                    y=-4.9,
+                    scale=0.5,
+                    color="gray",
+                    dynamic=True,
+                ),
+            ),
+        },
         action_objects=["red_ball"],
-        success_condition=success_condition,
-        metadata={"description": "Make the green ball hit the left or right wall"},
     )
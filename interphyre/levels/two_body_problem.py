@@ -1,59 +1,87 @@
 import numpy as np
-from interphyre.objects import Ball, PhyreObject
+from interphyre.objects import Ball, ObjectTable
+from interphyre.conditions import ContactFor
 from interphyre.level import Level
-from typing import cast
+from typing import Tuple
 from interphyre.levels import register_level
 
+METADATA = {"description": "Make the green ball touch the blue ball"}
 
-def success_condition(engine):
-    success_time = engine.default_success_time
-    return engine.is_in_contact_for_duration("green_ball", "blue_ball", success_time)
 
+success_condition = ContactFor("green_ball", "blue_ball")
 
-@register_level
+
+@register_level("two_body_problem")
 def build_level(seed=None):
-    rng = np.random.default_rng(seed)
-
-    green_ball_radius = rng.uniform(0.2, 0.7)
-    blue_ball_radius = rng.uniform(0.2, 0.8)
-    red_ball_radius = rng.uniform(0.4, 1)
-    green_ball = Ball(
-        x=rng.uniform(-5 + green_ball_radius, 5 - green_ball_radius),
-        y=rng.uniform(-3, 4.5),
-        radius=green_ball_radius,
-        color="green",
-        dynamic=True,
-    )
-    blue_ball = Ball(
-        x=rng.uniform(-5 + blue_ball_radius, 5 - blue_ball_radius),
-        y=rng.uniform(0.5, 4.5),
-        radius=blue_ball_radius,
-        color="blue",
-        dynamic=True,
-    )
-    red_ball = Ball(
-        x=-3,
-        y=2.5,
-        radius=red_ball_radius,
-        color="red",
-        dynamic=True,
+    table, attempts = _draw_batch(np.random.default_rng(seed), 1)
+    return Level.from_table(
+        table,
+        "two_body_problem",
+        success_condition,
+        metadata={**METADATA, "generation_attempts": int(attempts[0])},
     )
 
-    # Avoid trivial solutions
-    while abs(green_ball.x - blue_ball.x) < (green_ball.radius + blue_ball.radius):
-        green_ball.x = rng.uniform(-4.5, 4.5)
-        blue_ball.x = rng.uniform(-4.5, 4.5)
 
-    objects = {
-        "green_ball": green_ball,
-        "blue_ball": blue_ball,
-        "red_ball": red_ball,
-    }
+def build_batch(rng: np.random.Generator, k: int) -> ObjectTable:
+    """Draw k variants of the level at once, see interphyre.levels.generate_levels."""
+    return _draw_batch(rng, k)[0]
+
+
+def _draw_batch(rng: np.random.Generator, k: int) -> Tuple[ObjectTable, np.ndarray]:
+    """
+    Draw k variants and the number of layouts drawn for each.
+
+    Parameters are drawn in the same order for any k, so a batch of one draws
+    the same level from a seed as drawing the parameters one at a time.
+    """
+    green_ball_radius = rng.uniform(0.2, 0.7, k)
+    blue_ball_radius = rng.uniform(0.2, 0.8, k)
+    red_ball_radius = rng.uniform(0.4, 1, k)
+    green_ball_x = rng.uniform(-5 + green_ball_radius, 5 - green_ball_radius)
+    green_ball_y = rng.uniform(-3, 4.5, k)
+    blue_ball_x = rng.uniform(-5 + blue_ball_radius, 5 - blue_ball_radius)
+    blue_ball_y = rng.uniform(0.5, 4.5, k)
+
+    # Avoid trivial solutions, redrawing only the overlapping variants
+    attempts = np.ones(k, dtype=int)
+    overlap = np.abs(green_ball_x - blue_ball_x) < green_ball_radius + blue_ball_radius
+    while overlap.any():
+        n = np.count_nonzero(overlap)
+        attempts[overlap] += 1
+        green_ball_x[overlap] = rng.uniform(-4.5, 4.5, n)
+        blue_ball_x[overlap] = rng.uniform(-4.5, 4.5, n)
+        overlap = (
+            np.abs(green_ball_x - blue_ball_x) < green_ball_radius + blue_ball_radius
+        )
 
-    return Level(
-        name="two_body_problem",
-        objects=cast(dict[str, PhyreObject], objects),
+    table = ObjectTable.from_batch(
+        k,
+        {
+            "green_ball": (
+                Ball,
+                dict(
+                    x=green_ball_x,
+                    y=green_ball_y,
+                    radius=green_ball_radius,
+                    color="green",
+                    dynamic=True,
+                ),
+            ),
+            "blue_ball": (
+                Ball,
+                dict(
+                    x=blue_ball_x,
+                    y=blue_ball_y,
+                    radius=blue_ball_radius,
+                    color="blue",
+                    dynamic=True,
+                ),
+            ),
+            "red_ball": (
+                Ball,
+                dict(x=-3, y=2.5, radius=red_ball_radius, color="red", dynamic=True),
+            ),
+        },
         action_objects=["red_ball"],
-        success_condition=success_condition,
-        metadata={"description": "Make the green ball touch the blue ball"},
     )
+    return table, attempts
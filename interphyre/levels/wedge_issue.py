@@ -1,46 +1,44 @@
 import numpy as np
-from typing import cast
-from interphyre.objects import Ball, Basket, Bar, PhyreObject
+from interphyre.objects import Ball, Bar, ObjectTable
+from interphyre.conditions import ContactFor
 from interphyre.level import Level
 from interphyre.levels import register_level
 
+METADATA = {"description": "Get the green ball wedged onto the purple platform"}
 
-def success_condition(engine):
 
-    success_time = engine.default_success_time
-    return engine.is_in_contact_for_duration(
-        "green_ball", "purple_platform", success_time
-    )
+success_condition = ContactFor("green_ball", "purple_platform")
 
 
-@register_level
+@register_level("wedge_issue")
 def build_level(seed=None) -> Level:
-    rng = np.random.default_rng(seed)
+    return Level.from_table(
+        build_batch(np.random.default_rng(seed), 1),
+        "wedge_issue",
+        success_condition,
+        metadata=dict(METADATA),
+    )
+
 
+def build_batch(rng: np.random.Generator, k: int) -> ObjectTable:
+    """
+    Draw k variants of the level at once, see interphyre.levels.generate_levels.
+
+    build_level(seed) is the batch of one drawn from default_rng(seed).
+    """
     green_ball_radius = 0.4
-    green_ball = Ball(
-        x=rng.uniform(-2.25, 2.25),
-        y=5 - green_ball_radius,
-        radius=green_ball_radius,
-        color="green",
-        dynamic=True,
-    )
+    green_ball_x = rng.uniform(-2.25, 2.25, k)
 
-    red_ball_radius = rng.uniform(0.5, 1.0)
-    red_ball = Ball(
-        x=rng.uniform(-2.25, 2.25),
-        y=rng.uniform(0, 4),
-        radius=red_ball_radius,
-        color="red",
-        dynamic=True,
-    )
+    red_ball_radius = rng.uniform(0.5, 1.0, k)
+    red_ball_x = rng.uniform(-2.25, 2.25, k)
+    red_ball_y = rng.uniform(0, 4, k)
 
-    corner_point_x = rng.uniform(-3, 3)
-    corner_point_y = rng.uniform(-2, 2)
+    corner_point_x = rng.uniform(-3, 3, k)
+    corner_point_y = rng.uniform(-2, 2, k)
     height_gap = red_ball_radius - 0.1
     width_gap = 2 * rng.uniform(green_ball_radius, red_ball_radius)
 
-    purple_platform_angle = rng.uniform(5, 20)
+    purple_platform_angle = rng.uniform(5, 20, k)
     purple_platform_length = (
         np.abs(5 - corner_point_x) / np.cos(np.radians(purple_platform_angle))
         - width_gap / 2
@@ -55,16 +53,7 @@ def build_level(seed=None) -> Level:
         + np.sin(np.radians(purple_platform_angle)) * purple_platform_length / 2
     ) - height_gap / 2
 
-    purple_platform = Bar(
-        x=purple_platform_x,
-        y=purple_platform_y,
-        length=purple_platform_length,
-        angle=purple_platform_angle,
-        color="purple",
-        dynamic=False,
-    )
-
-    black_platform_angle = rng.uniform(5, 20)
+    black_platform_angle = rng.uniform(5, 20, k)
     black_platform_horiz_dist = np.abs(corner_point_x - (-5))
     black_platform_length = (
         black_platform_horiz_dist / np.cos(np.radians(black_platform_angle))
@@ -75,27 +64,52 @@ def build_level(seed=None) -> Level:
         corner_point_y
         + np.sin(np.radians(black_platform_angle)) * black_platform_length / 2
     ) + height_gap / 2
-    black_platform = Bar(
-        x=black_platform_x,
-        y=black_platform_y,
-        length=black_platform_length,
-        angle=180 - black_platform_angle,
-        color="black",
-        dynamic=False,
-    )
-
-    # Assemble objects dictionary.
-    objects = {
-        "green_ball": green_ball,
-        "red_ball": red_ball,
-        "purple_platform": purple_platform,
-        "black_platform": black_platform,
-    }
 
-    return Level(
-        name="wedge_issue",
-        objects=cast(dict[str, PhyreObject], objects),
+    return ObjectTable.from_batch(
+        k,
+        {
+            "green_ball": (
+                Ball,
+                dict(
+                    x=green_ball_x,
+                    y=5 - green_ball_radius,
+                    radius=green_ball_radius,
+                    color="green",
+                    dynamic=True,
+                ),
+            ),
+            "red_ball": (
+                Ball,
+                dict(
+                    x=red_ball_x,
+                    y=red_ball_y,
+                    radius=red_ball_radius,
+                    color="red",
+                    dynamic=True,
+                ),
+            ),
+            "purple_platform": (
+                Bar,
+                dict(
+                    x=purple_platform_x,
+                    y=purple_platform_y,
+                    length=purple_platform_length,
+                    angle=purple_platform_angle,
+                    color="purple",
+                    dynamic=False,
+                ),
+            ),
+            "black_platform": (
+                Bar,
+                dict(
+                    x=black_platform_x,
+                    y=black_platform_y,
+                    length=black_platform_length,
+                    angle=180 - black_platform_angle,
+                    color="black",
+                    dynamic=False,
+                ),
+            ),
+        },
         action_objects=["red_ball"],
-        success_condition=success_condition,
-        metadata={"description": "Get the green ball wedged onto the purple platform"},
     )
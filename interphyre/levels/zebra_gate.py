@@ -1,17 +1,16 @@
 import numpy as np
 from typing import cast
 from interphyre.objects import Ball, Bar, PhyreObject
+from interphyre.conditions import ContactFor
 from interphyre.level import Level
 from interphyre.levels import register_level
 from interphyre.render import MAX_X, MAX_Y, MIN_X, MIN_Y
 
 
-def success_condition(engine):
-    success_time = engine.default_success_time
-    return engine.is_in_contact_for_duration("green_ball", "purple_pad", success_time)
+success_condition = ContactFor("green_ball", "purple_pad")
 
 
-@register_level
+@register_level("zebra_gate")
 def build_level(seed=None) -> Level:
     rng = np.random.default_rng(seed)
 
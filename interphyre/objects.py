@@ -1,10 +1,11 @@
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Dict, List, Sequence, Tuple
 from Box2D import b2PolygonShape, b2World, b2_pi
 import math
+import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class PhyreObject:
     x: float
     y: float
@@ -15,22 +16,227 @@ class PhyreObject:
     friction: float = 0.5
 
 
-@dataclass
+@dataclass(slots=True)
 class Ball(PhyreObject):
     radius: float = 0.5
 
 
-@dataclass
+@dataclass(slots=True)
 class Bar(PhyreObject):
     length: float = 2.0
     thickness: float = 0.2
 
 
-@dataclass
+@dataclass(slots=True)
 class Basket(PhyreObject):
     scale: float = 1.0
 
 
+# RGB value of every color an object can have, used by the renderers
+COLORS = {
+    "green": (32, 201, 162),
+    "red": (235, 82, 52),
+    "blue": (32, 93, 214),
+    "black": (0, 0, 0),
+    "gray": (200, 200, 200),
+    "purple": (81, 56, 150),
+    "yellow": (255, 211, 67),
+    "white": (255, 255, 255),
+}
+
+# Type codes and color ids used by ObjectTable
+OBJECT_TYPES = (Ball, Bar, Basket)
+COLOR_NAMES = tuple(COLORS)
+# Size fields of each object type, stored in ObjectTable columns of the same name
+SIZE_FIELDS = ("radius", "length", "thickness", "scale")
+
+
+def color_id(color: str) -> int:
+    """Index of a color in COLOR_NAMES, as stored in ObjectTable.color."""
+    try:
+        return COLOR_NAMES.index(color.lower())
+    except ValueError:
+        raise ValueError(
+            f"Unknown color '{color}', expected one of {', '.join(COLOR_NAMES)}."
+        ) from None
+
+
+@dataclass
+class ObjectTable:
+    """
+    Struct-of-arrays representation of the objects of one or more levels.
+
+    Row i describes object names[i] of the level variant level[i]. Rows are grouped
+    by level variant in ascending order. Size fields that do not apply to an object
+    type (e.g. radius for a Bar) are 0.
+    """
+
+    names: np.ndarray  # str
+    level: np.ndarray  # int32, index of the level variant
+    type: np.ndarray  # int8, index into OBJECT_TYPES
+    x: np.ndarray
+    y: np.ndarray
+    angle: np.ndarray  # in degrees
+    radius: np.ndarray
+    length: np.ndarray
+    thickness: np.ndarray
+    scale: np.ndarray
+    dynamic: np.ndarray  # bool
+    action: np.ndarray  # bool, whether the object is an action object
+    restitution: np.ndarray
+    friction: np.ndarray
+    color: np.ndarray  # int8, index into COLOR_NAMES
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def num_levels(self) -> int:
+        return int(self.level.max()) + 1 if len(self) else 0
+
+    @classmethod
+    def from_objects(
+        cls,
+        objects: Dict[str, PhyreObject],
+        action_objects: Sequence[str] = (),
+        level: int = 0,
+    ) -> "ObjectTable":
+        """Build a table from the objects dict of a level."""
+        n = len(objects)
+        sizes = {name: np.zeros(n) for name in SIZE_FIELDS}
+        for i, obj in enumerate(objects.values()):
+            for name in SIZE_FIELDS:
+                if hasattr(obj, name):
+                    sizes[name][i] = getattr(obj, name)
+        values = list(objects.values())
+        return cls(
+            names=np.array(list(objects), dtype=str),
+            level=np.full(n, level, dtype=np.int32),
+            type=np.array(
+                [OBJECT_TYPES.index(type(obj)) for obj in values], dtype=np.int8
+            ),
+            x=np.array([obj.x for obj in values], dtype=np.float64),
+            y=np.array([obj.y for obj in values], dtype=np.float64),
+            angle=np.array([obj.angle for obj in values], dtype=np.float64),
+            dynamic=np.array([obj.dynamic for obj in values], dtype=bool),
+            action=np.array([name in action_objects for name in objects], dtype=bool),
+            restitution=np.array([obj.restitution for obj in values], dtype=np.float64),
+            friction=np.array([obj.friction for obj in values], dtype=np.float64),
+            color=np.array(
+                [color_id(obj.color) for obj in values], dtype=np.int8
+            ),
+            **sizes,
+        )
+
+    @classmethod
+    def from_batch(
+        cls,
+        k: int,
+        objects: Dict[str, Tuple[type, dict]],
+        action_objects: Sequence[str] = (),
+    ) -> "ObjectTable":
+        """
+        Build a table of k level variants that share the same object names.
+
+        objects maps each name to (object type, fields), where each field is either
+        a scalar or an array with one value per variant. Fields that are left out
+        take the dataclass defaults of the object type.
+        """
+        names = list(objects)
+        n = len(names)
+        columns: Dict[str, np.ndarray] = {}
+        specs = {
+            "x": np.float64,
+            "y": np.float64,
+            "angle": np.float64,
+            "dynamic": bool,
+            "restitution": np.float64,
+            "friction": np.float64,
+            **{name: np.float64 for name in SIZE_FIELDS},
+        }
+        for column, dtype in specs.items():
+            values = np.zeros((k, n), dtype=dtype)
+            for j, (obj_type, fields) in enumerate(objects.values()):
+                if column in fields:
+                    values[:, j] = fields[column]
+                elif column in obj_type.__dataclass_fields__:
+                    values[:, j] = obj_type.__dataclass_fields__[column].default
+            columns[column] = values.ravel()
+        colors = [
+            fields.get("color", obj_type.__dataclass_fields__["color"].default)
+            for obj_type, fields in objects.values()
+        ]
+        return cls(
+            names=np.tile(np.array(names, dtype=str), k),
+            level=np.repeat(np.arange(k, dtype=np.int32), n),
+            type=np.tile(
+                np.array(
+                    [OBJECT_TYPES.index(obj_type) for obj_type, _ in objects.values()],
+                    dtype=np.int8,
+                ),
+                k,
+            ),
+            action=np.tile(np.array([name in action_objects for name in names]), k),
+            color=np.tile(
+                np.array([color_id(c) for c in colors], dtype=np.int8), k
+            ),
+            **columns,
+        )
+
+    @classmethod
+    def concatenate(cls, tables: List["ObjectTable"]) -> "ObjectTable":
+        """
+        Stack tables, renumbering their level indices to follow each other.
+        """
+        offset = 0
+        columns: Dict[str, list] = {name: [] for name in cls.__dataclass_fields__}
+        for table in tables:
+            for name in columns:
+                column = getattr(table, name)
+                columns[name].append(column + offset if name == "level" else column)
+            offset += table.num_levels
+        return cls(**{name: np.concatenate(parts) for name, parts in columns.items()})
+
+    def select(self, mask: np.ndarray) -> "ObjectTable":
+        """Return the rows selected by a boolean mask or index array."""
+        return ObjectTable(
+            **{name: getattr(self, name)[mask] for name in self.__dataclass_fields__}
+        )
+
+    def rows(self, level: int) -> range:
+        """Indices of the rows of one level variant."""
+        start, stop = np.searchsorted(self.level, [level, level + 1])
+        return range(start, stop)
+
+    def to_objects(self, level: int = 0) -> Tuple[Dict[str, PhyreObject], List[str]]:
+        """
+        Rebuild the objects dict and action object names of one level variant.
+        """
+        objects: Dict[str, PhyreObject] = {}
+        action_objects = []
+        for i in self.rows(level):
+            obj_type = OBJECT_TYPES[self.type[i]]
+            sizes = {
+                name: float(getattr(self, name)[i])
+                for name in SIZE_FIELDS
+                if name in obj_type.__dataclass_fields__
+            }
+            name = str(self.names[i])
+            objects[name] = obj_type(
+                x=float(self.x[i]),
+                y=float(self.y[i]),
+                angle=float(self.angle[i]),
+                color=COLOR_NAMES[self.color[i]],
+                dynamic=bool(self.dynamic[i]),
+                restitution=float(self.restitution[i]),
+                friction=float(self.friction[i]),
+                **sizes,
+            )
+            if self.action[i]:
+                action_objects.append(name)
+        return objects, action_objects
+
+
 def create_basket(world: b2World, basket: Basket, name: str):
 
     angle_rad = basket.angle * b2_pi / 180
@@ -86,6 +292,20 @@ def create_basket(world: b2World, basket: Basket, name: str):
         -theta,
     )
 
+    # Sensor fixture over the lower half of the interior, used to detect objects
+    # that dropped into the basket. It has no density, so the mass of the basket
+    # is unchanged.
+    body.CreatePolygonFixture(
+        box=(width / 2 - thickness, height / 4 - thickness / 4),
+        density=0,
+        isSensor=True,
+    ).shape.SetAsBox(
+        width / 2 - thickness,
+        height / 4 - thickness / 4,
+        (0, height / 4 + thickness / 4),
+        0,
+    )
+
     body.userData = name
     return body
 
@@ -0,0 +1,131 @@
+"""
+Rasterized signed distance fields of level geometry, used to reject invalid
+action placements before any Box2D world is built.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import List
+import numpy as np
+
+from interphyre.geometry import basket_boxes, object_shapes, signed_distance
+from interphyre.objects import Ball, Bar, Basket, PhyreObject
+
+# Half extent of the room and thickness of its walls, see Box2DEngine._create_world
+WORLD_HALF_SIZE = 5.0
+WALL_THICKNESS = 0.01
+
+
+def bounding_radius(obj: PhyreObject) -> float:
+    """Radius of a circle around the object's position that contains the object."""
+    if isinstance(obj, Ball):
+        return obj.radius
+    if isinstance(obj, Bar):
+        return math.hypot(obj.length / 2, obj.thickness / 2)
+    if isinstance(obj, Basket):
+        # The basket origin is at the center of its bottom bar, the farthest points
+        # are corners of the fixture boxes
+        boxes = basket_boxes(obj.scale)
+        signs = np.array([(1, 1), (1, -1), (-1, 1), (-1, -1)])
+        radius = 0.0
+        for x, y, hx, hy, angle in boxes:
+            c, s = math.cos(angle), math.sin(angle)
+            corners = signs * (hx, hy) @ np.array([[c, s], [-s, c]]) + (x, y)
+            radius = max(radius, float(np.hypot(*corners.T).max()))
+        return radius
+    raise ValueError(f"Unknown object type: {type(obj)}")
+
+
+@dataclass
+class OccupancyMap:
+    """
+    Signed distance field of the non-action geometry of a level on a regular grid.
+
+    sdf[i, j] is the distance from the point (x0 + j * resolution, y0 + i *
+    resolution) to the nearest wall or non-action object, negative inside one.
+    Distances between grid points are interpolated bilinearly, which is accurate
+    to about the resolution.
+    """
+
+    sdf: np.ndarray  # (rows, cols) float32
+    origin: tuple  # (x0, y0) of sdf[0, 0]
+    resolution: float
+    action_objects: List[str]
+    action_radii: np.ndarray  # bounding radius of each action object
+
+    @classmethod
+    def from_level(cls, level, resolution: float = 0.02) -> "OccupancyMap":
+        """Rasterize the walls and every object of the level except the action objects."""
+        objects = {
+            name: obj
+            for name, obj in level.objects.items()
+            if name not in level.action_objects
+        }
+        circles, boxes = object_shapes(objects)
+        n = int(round(2 * WORLD_HALF_SIZE / resolution)) + 1
+        axis = np.linspace(-WORLD_HALF_SIZE, WORLD_HALF_SIZE, n)
+        xx, yy = np.meshgrid(axis, axis)
+        points = np.stack([xx, yy], -1)
+        # Distance to the inner faces of the walls, positive inside the room
+        inner = WORLD_HALF_SIZE - 1.5 * WALL_THICKNESS
+        room = inner - np.maximum(np.abs(xx), np.abs(yy))
+        sdf = np.minimum(room, signed_distance(points, circles, boxes))
+        return cls(
+            sdf=sdf.astype(np.float32),
+            origin=(-WORLD_HALF_SIZE, -WORLD_HALF_SIZE),
+            resolution=resolution,
+            action_objects=list(level.action_objects),
+            action_radii=np.array(
+                [bounding_radius(level.objects[name]) for name in level.action_objects]
+            ),
+        )
+
+    def distance(self, points: np.ndarray) -> np.ndarray:
+        """Interpolate the signed distance at (..., 2) points. Points off the grid are outside."""
+        points = np.asarray(points, dtype=float)
+        rows, cols = self.sdf.shape
+        u = (points[..., 0] - self.origin[0]) / self.resolution
+        v = (points[..., 1] - self.origin[1]) / self.resolution
+        on_grid = (u >= 0) & (u <= cols - 1) & (v >= 0) & (v <= rows - 1)
+        u = np.clip(u, 0, cols - 1)
+        v = np.clip(v, 0, rows - 1)
+        j = np.minimum(u.astype(np.intp), cols - 2)
+        i = np.minimum(v.astype(np.intp), rows - 2)
+        fu = u - j
+        fv = v - i
+        sdf = self.sdf
+        top = sdf[i, j] * (1 - fu) + sdf[i, j + 1] * fu
+        bottom = sdf[i + 1, j] * (1 - fu) + sdf[i + 1, j + 1] * fu
+        return np.where(on_grid, top * (1 - fv) + bottom * fv, -np.inf)
+
+    def is_valid_action(self, actions, margin: float = 0.0) -> np.ndarray:
+        """
+        Check which actions place their objects without overlaps.
+
+        An action is valid if every action object keeps a distance of at least
+        margin from the walls, the other objects and the other action objects.
+        Action objects that are not balls are approximated by their bounding circle.
+
+        Args:
+            actions: (N, k, 2) positions of the k action objects, or (N, 2) when k == 1.
+            margin: Minimum clearance.
+
+        Returns:
+            np.ndarray: (N,) bool.
+        """
+        k = len(self.action_objects)
+        actions = np.asarray(actions, dtype=float)
+        if actions.ndim == 2 and k == 1:
+            actions = actions[:, None, :]
+        if actions.ndim != 3 or actions.shape[1:] != (k, 2):
+            raise ValueError(
+                f"Expected actions of shape (N, {k}, 2), got {actions.shape}."
+            )
+        clearance = self.distance(actions) - self.action_radii - margin
+        valid = np.all(clearance >= 0, axis=1)
+        # Action objects must not overlap each other either
+        for a in range(k):
+            for b in range(a + 1, k):
+                gap = np.hypot(*(actions[:, a] - actions[:, b]).T)
+                valid &= gap >= self.action_radii[a] + self.action_radii[b] + margin
+        return valid
@@ -0,0 +1,122 @@
+import multiprocessing
+from typing import Optional
+import numpy as np
+
+from interphyre.engine import Box2DEngine
+from interphyre.evaluate import EvaluationResults, evaluate_actions
+from interphyre.level import Level
+from interphyre.levels import load_level
+
+# Per-process state, populated once by the pool initializer
+_worker_level: Optional[Level] = None
+_worker_engine: Optional[Box2DEngine] = None
+_worker_settings: dict = {}
+
+
+def _init_worker(level_name: str, seed: int, settings: dict):
+    global _worker_level, _worker_engine, _worker_settings
+    _worker_level = load_level(level_name, seed)
+    _worker_engine = Box2DEngine()
+    _worker_settings = settings
+
+
+def _evaluate_chunk(actions: np.ndarray) -> EvaluationResults:
+    assert _worker_level is not None, "Worker was not initialized."
+    return evaluate_actions(
+        _worker_level, actions, engine=_worker_engine, **_worker_settings
+    )
+
+
+class ParallelEvaluator:
+    """
+    Evaluate action batches for one level on a pool of worker processes.
+
+    Every worker builds the level with load_level(level_name, seed) once and keeps
+    its own Box2DEngine, so only action arrays and columnar results are sent
+    between processes. Unless keep_static is set, each rollout starts from a fresh
+    world, so the results are identical to evaluate_actions() regardless of the
+    number of processes.
+    """
+
+    def __init__(
+        self,
+        level_name: str,
+        seed: Optional[int] = None,
+        processes: Optional[int] = None,
+        chunk_size: int = 64,
+        steps: int = 1000,
+        time_step: float = 1 / 60,
+        velocity_iters: int = 6,
+        position_iters: int = 2,
+        keep_static: bool = False,
+        stop_when_settled: bool = True,
+        presettle: bool = False,
+        start_method: Optional[str] = None,
+    ):
+        """
+        Parameters:
+            level_name (str): Name of the registered level.
+            seed (Optional[int]): Level seed. If None, a seed is drawn here so
+                that all workers build the same level.
+            processes (Optional[int]): Number of workers, defaults to the CPU count.
+            chunk_size (int): Number of actions sent to a worker at a time.
+            steps (int): Maximum number of physics steps per rollout.
+            time_step (float): Duration of a physics step.
+            velocity_iters (int): Box2D velocity iterations per step.
+            position_iters (int): Box2D position iterations per step.
+            keep_static (bool): Keep static bodies alive between rollouts. Faster,
+                but results then depend on chunk_size.
+            stop_when_settled (bool): End rollouts once the world has settled
+                and success can no longer happen.
+            presettle (bool): Start rollouts from the settled state of the level,
+                if it has one, which every worker computes once (see evaluate_actions).
+            start_method (Optional[str]): multiprocessing start method, e.g. "spawn".
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1.")
+        if seed is None:
+            seed = int(np.random.default_rng().integers(2**31))
+        self.level_name = level_name
+        self.seed = seed
+        self.chunk_size = chunk_size
+        settings = {
+            "steps": steps,
+            "time_step": time_step,
+            "velocity_iters": velocity_iters,
+            "position_iters": position_iters,
+            "keep_static": keep_static,
+            "stop_when_settled": stop_when_settled,
+            "presettle": presettle,
+        }
+        context = multiprocessing.get_context(start_method)
+        self.pool = context.Pool(
+            processes, initializer=_init_worker, initargs=(level_name, seed, settings)
+        )
+
+    def evaluate(self, actions) -> EvaluationResults:
+        """
+        Evaluate actions of shape (N, k, 2), or (N, 2) for single action levels.
+
+        Returns:
+            EvaluationResults: Columnar results in the order of the actions.
+        """
+        actions = np.asarray(actions, dtype=np.float64)
+        chunks = [
+            actions[i : i + self.chunk_size]
+            for i in range(0, len(actions), self.chunk_size)
+        ]
+        # Pool.map returns results in submission order
+        return EvaluationResults.concatenate(self.pool.map(_evaluate_chunk, chunks))
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.pool.terminate()
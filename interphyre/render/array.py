@@ -0,0 +1,110 @@
+import cv2
+import numpy as np
+from typing import Optional
+from interphyre.render.base import (
+    Renderer,
+    COLORS,
+    BodySnapshot,
+    FrameSnapshot,
+    transform_points,
+)
+
+WORLD_WIDTH = 10
+WORLD_HEIGHT = 10
+
+# Fractional bits used for sub-pixel coordinates in OpenCV drawing calls
+SHIFT = 4
+
+
+class ArrayRenderer(Renderer):
+    """
+    Headless renderer that rasterizes the world into an RGB NumPy array.
+
+    Needs no display and runs at simulation speed, which makes it suitable for
+    producing image observations.
+    """
+
+    def __init__(self, width: int = 600, height: int = 600, ppm: Optional[float] = None):
+        """
+        Initialize the array renderer.
+
+        Parameters:
+            width (int): Width of the image in pixels.
+            height (int): Height of the image in pixels.
+            ppm (Optional[float]): Pixels per Box2D unit. Defaults to fitting the
+                whole world into the image.
+        """
+        super().__init__()
+        self.width = width
+        self.height = height
+        self.ppm = ppm or min(width / WORLD_WIDTH, height / WORLD_HEIGHT)
+        self.frame = np.zeros((height, width, 3), dtype=np.uint8)
+        self.background: Optional[np.ndarray] = None
+        self.background_key: Optional[int] = None
+
+    def world_to_screen(self, points: np.ndarray) -> np.ndarray:
+        """
+        Convert an (N, 2) array of world coordinates to fixed point pixel coordinates.
+
+        The origin is placed in the center of the image and y points up.
+        """
+        screen = np.empty_like(points)
+        screen[:, 0] = points[:, 0] * self.ppm + self.width / 2
+        screen[:, 1] = -points[:, 1] * self.ppm + self.height / 2
+        return np.round(screen * (1 << SHIFT)).astype(np.int32)
+
+    def _draw_body(self, canvas: np.ndarray, body: BodySnapshot):
+        for shape in body.shapes:
+            # Sensor fixtures are only used for detection and are not drawn
+            if shape.sensor:
+                continue
+            pts = self.world_to_screen(
+                transform_points(shape.points, body.position, body.angle)
+            )
+            if shape.kind == "circle":
+                radius = int(round(shape.radius * self.ppm * (1 << SHIFT)))
+                center = (int(pts[0, 0]), int(pts[0, 1]))
+                cv2.circle(canvas, center, radius, body.color, -1, cv2.LINE_8, SHIFT)
+            else:
+                cv2.fillPoly(canvas, [pts], body.color, cv2.LINE_8, SHIFT)
+
+    def _get_background(self, frame: FrameSnapshot) -> np.ndarray:
+        """Return an image of the static bodies, drawn once per static geometry."""
+        if self.background is None or self.background_key != frame.static_version:
+            background = np.empty((self.height, self.width, 3), dtype=np.uint8)
+            background[:] = COLORS["white"]
+            for body in frame.bodies:
+                if body.static:
+                    self._draw_body(background, body)
+            self.background = background
+            self.background_key = frame.static_version
+        return self.background
+
+    def render_snapshot(self, frame: FrameSnapshot) -> np.ndarray:
+        """
+        Draw a captured frame.
+
+        Each frame starts from a copy of the cached static background and only the
+        dynamic bodies are drawn on top of it.
+
+        Returns:
+            np.ndarray: (height, width, 3) uint8 RGB image.
+        """
+        canvas = self._get_background(frame).copy()
+        for body in frame.bodies:
+            if not body.static:
+                self._draw_body(canvas, body)
+        self.frame = canvas
+        return canvas
+
+    def render(self, engine) -> np.ndarray:
+        """
+        Render the current state of the simulation.
+
+        Returns:
+            np.ndarray: (height, width, 3) uint8 RGB image.
+        """
+        return self.render_snapshot(self.capture(engine))
+
+    def close(self) -> None:
+        pass
@@ -1,18 +1,134 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+import numpy as np
+from Box2D import b2PolygonShape, b2CircleShape, b2_staticBody
 
-COLORS = {
-    "green": (32, 201, 162),
-    "red": (235, 82, 52),
-    "blue": (32, 93, 214),
-    "black": (0, 0, 0),
-    "gray": (200, 200, 200),
-    "purple": (81, 56, 150),
-    "yellow": (255, 211, 67),
-    "white": (255, 255, 255),
-}
+# The palette is defined with the objects, so object colors and ObjectTable color
+# ids share one list of names
+from interphyre.objects import COLORS
+
+
+@dataclass(frozen=True)
+class ShapeGeometry:
+    """
+    Geometry of a fixture in body coordinates.
+
+    Circles store their center as a (1, 2) array in points, polygons their (N, 2)
+    vertices.
+    """
+
+    kind: str  # "circle" or "polygon"
+    points: np.ndarray
+    radius: float
+    sensor: bool
+
+
+@dataclass(frozen=True)
+class BodySnapshot:
+    name: str
+    color: Tuple[int, int, int]
+    static: bool
+    position: Tuple[float, float]
+    angle: float  # in radians
+    shapes: List[ShapeGeometry]
+
+
+@dataclass(frozen=True)
+class FrameSnapshot:
+    """State needed to draw one frame, detached from the Box2D world."""
+
+    static_version: int
+    bodies: List[BodySnapshot]
+
+
+def extract_shapes(body) -> List[ShapeGeometry]:
+    """Copy the fixture shapes of a body in body coordinates."""
+    shapes = []
+    for fixture in body.fixtures:
+        shape = fixture.shape
+        if isinstance(shape, b2CircleShape):
+            shapes.append(
+                ShapeGeometry(
+                    "circle", np.array([tuple(shape.pos)]), shape.radius, fixture.sensor
+                )
+            )
+        elif isinstance(shape, b2PolygonShape):
+            shapes.append(
+                ShapeGeometry(
+                    "polygon", np.array(shape.vertices), 0.0, fixture.sensor
+                )
+            )
+        else:
+            raise ValueError(f"Unsupported shape type: {type(shape)}")
+    return shapes
+
+
+def transform_points(points: np.ndarray, position, angle: float) -> np.ndarray:
+    """Transform an (N, 2) array of body coordinates to world coordinates."""
+    c, s = np.cos(angle), np.sin(angle)
+    return points @ np.array([[c, s], [-s, c]]) + position
 
 
 class Renderer(ABC):
+    # Fixture shapes per body name, along with the body they were copied from
+    _shape_cache: Dict[str, Tuple[Any, List[ShapeGeometry]]]
+
+    def __init__(self):
+        self._shape_cache = {}
+
+    def _get_object_color(self, body, engine) -> Tuple[int, int, int]:
+        """
+        Retrieve the drawing color for a given body from the level file.
+
+        Assumes:
+          - body.userData stores the object's name.
+          - engine.get_object(name) returns the object with a 'color' attribute,
+            including live edits made with engine.set_color().
+        If the name is not found (e.g. walls), a default color is returned.
+        """
+        if engine.level is None:
+            return COLORS["black"]
+        name = body.userData
+        if name not in engine.level.objects:
+            if "wall" in str(name).lower():
+                return (255, 0, 0)  # render walls in red
+            return COLORS["black"]
+        obj = engine.get_object(name)
+        if obj is None or not hasattr(obj, "color"):
+            return COLORS["black"]
+        return COLORS.get(obj.color.lower(), COLORS["black"])
+
+    def capture(self, engine) -> FrameSnapshot:
+        """
+        Copy everything needed to draw the current state of the engine.
+
+        Fixture shapes never change during a rollout, so they are copied once per body.
+        """
+        bodies = []
+        for name, body in engine.bodies.items():
+            cached = self._shape_cache.get(name)
+            if cached is None or cached[0] is not body:
+                cached = self._shape_cache[name] = (body, extract_shapes(body))
+            bodies.append(
+                BodySnapshot(
+                    name=name,
+                    color=self._get_object_color(body, engine),
+                    static=body.type == b2_staticBody,
+                    position=tuple(body.position),
+                    angle=body.angle,
+                    shapes=cached[1],
+                )
+            )
+        return FrameSnapshot(static_version=engine.static_version, bodies=bodies)
+
+    @abstractmethod
+    def render_snapshot(self, frame: FrameSnapshot):
+        """
+        Render a frame captured with capture(), possibly on another thread.
+        """
+        pass
+
     @abstractmethod
     def render(self, engine) -> None:
         """
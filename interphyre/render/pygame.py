@@ -1,11 +1,22 @@
 import pygame
-from typing import Tuple
-from interphyre.render.base import Renderer, COLORS
-from Box2D import b2PolygonShape, b2CircleShape
+from typing import Optional, Tuple
+from interphyre.render.base import (
+    Renderer,
+    COLORS,
+    BodySnapshot,
+    FrameSnapshot,
+    transform_points,
+)
 
 
 class PygameRenderer(Renderer):
-    def __init__(self, width: int = 600, height: int = 600, ppm: float = 60):
+    def __init__(
+        self,
+        width: int = 600,
+        height: int = 600,
+        ppm: float = 60,
+        fps: Optional[int] = 60,
+    ):
         """
         Initialize the Pygame renderer.
 
@@ -13,7 +24,9 @@ class PygameRenderer(Renderer):
             width (int): Width of the window in pixels.
             height (int): Height of the window in pixels.
             ppm (float): Pixels per Box2D unit (scaling factor).
+            fps (Optional[int]): Frame rate cap. None renders at maximum speed.
         """
+        super().__init__()
         pygame.init()
         self.width = width
         self.height = height
@@ -21,7 +34,9 @@ class PygameRenderer(Renderer):
         self.screen = pygame.display.set_mode((width, height))
         pygame.display.set_caption("Interphyre Simulation")
         self.clock = pygame.time.Clock()
-        self.fps = 60  # Frames per second for rendering
+        self.fps = fps  # Frames per second for rendering, None for no cap
+        self.background = None
+        self.background_key = None
 
         # TODO - support different sizes using the screen_size / self.ppm * 0.5 conversion
 
@@ -44,68 +59,69 @@ class PygameRenderer(Renderer):
         screen_y = int(-y * self.ppm + self.height / 2)
         return screen_x, screen_y
 
-    def _get_object_color(self, body, engine) -> Tuple[int, int, int]:
+    def _draw_body(self, surface, body: BodySnapshot) -> None:
         """
-        Retrieve the drawing color for a given body from the level file.
-
-        Assumes:
-          - body.userData stores the object's name.
-          - engine.level.objects maps names to level objects with a 'color' attribute.
-        If the name is not found (e.g. walls), a default color is returned.
+        Draw every fixture of a body after applying the body transform to its local coordinates.
+        """
+        color = body.color
+        for shape in body.shapes:
+
+            # Do not render sensor fixtures, they are only used for detection and measurement purposes
+            if shape.sensor:
+                continue
+
+            points = transform_points(shape.points, body.position, body.angle)
+            if shape.kind == "circle":
+                # For circle shapes: transform the center and draw
+                radius = shape.radius * self.ppm
+                screen_pos = self.world_to_screen(points[0])
+                pygame.draw.circle(
+                    surface,
+                    color,
+                    screen_pos,
+                    radius,
+                )
+            else:
+                # For polygon shapes: transform each vertex
+                pts = [self.world_to_screen(v) for v in points]
+                pygame.draw.polygon(surface, color, pts)
+
+    def _get_background(self, frame: FrameSnapshot):
+        """
+        Return a surface with the static bodies of the level, drawn once per static geometry.
         """
-        if engine.level is None:
-            return COLORS["black"]
-        name = body.userData
-        if name not in engine.level.objects:
-            if "wall" in str(name).lower():
-                return (255, 0, 0)  # render walls in red
-            return COLORS["black"]
-        obj = engine.level.objects.get(name)
-        if obj is None or not hasattr(obj, "color"):
-            return COLORS["black"]
-        return COLORS.get(obj.color.lower(), COLORS["black"])
+        if self.background is None or self.background_key != frame.static_version:
+            self.background = pygame.Surface((self.width, self.height))
+            self.background.fill(COLORS["white"])
+            for body in frame.bodies:
+                if body.static:
+                    self._draw_body(self.background, body)
+            self.background_key = frame.static_version
+        return self.background
 
     def render(self, engine) -> None:
         """
         Render the current state of the simulation.
+        """
+        self.render_snapshot(self.capture(engine))
+
+    def render_snapshot(self, frame: FrameSnapshot) -> None:
+        """
+        Draw a captured frame.
 
-        Each fixture is rendered after applying the body transform to its local coordinates.
+        Static bodies come from a cached background, only dynamic bodies are drawn every frame.
         """
-        # Clear screen using white
-        self.screen.fill(COLORS["white"])
+        self.screen.blit(self._get_background(frame), (0, 0))
 
         # Iterate over bodies
-        for name, body in engine.bodies.items():
-            color = self._get_object_color(body, engine)
-            for fixture in body.fixtures:
-
-                # Do not render sensor fixtures, they are only used for detection and measurement purposes
-                if fixture.sensor:
-                    color = (255, 0, 0)
-
-                shape = fixture.shape
-                if isinstance(shape, b2CircleShape):
-                    # For circle shapes: transform the center and draw
-                    position = body.transform * shape.pos
-                    radius = shape.radius * self.ppm
-                    screen_pos = self.world_to_screen((position[0], position[1]))
-                    pygame.draw.circle(
-                        self.screen,
-                        color,
-                        screen_pos,
-                        radius,
-                    )
-                elif isinstance(shape, b2PolygonShape):
-                    # For polygon shapes: transform each vertex
-                    vertices = [body.transform * v for v in shape.vertices]
-                    pts = [self.world_to_screen((v[0], v[1])) for v in vertices]
-                    pygame.draw.polygon(self.screen, color, pts)
-                else:
-                    raise ValueError(f"Unsupported shape type: {type(shape)}")
+        for body in frame.bodies:
+            if not body.static:
+                self._draw_body(self.screen, body)
 
         pygame.display.flip()
         pygame.event.pump()
-        self.clock.tick(self.fps)
+        if self.fps:
+            self.clock.tick(self.fps)
 
         # Exit if the window is closed
         for event in pygame.event.get():
@@ -0,0 +1,67 @@
+import queue
+import threading
+from typing import Optional
+from interphyre.render.base import Renderer, FrameSnapshot
+
+
+class ThreadedRenderer(Renderer):
+    """
+    Draw frames on a background thread so the simulation never waits for drawing.
+
+    render() only captures a snapshot of the body states and puts it on a bounded
+    queue. When the queue is full, the oldest pending frame is dropped. Some platforms (e.g. macOS) only
+    allow windows to be drawn from the main thread, use a headless renderer there.
+    """
+
+    def __init__(self, renderer: Renderer, max_queue: int = 2):
+        """
+        Parameters:
+            renderer (Renderer): Renderer that draws the frames.
+            max_queue (int): Maximum number of frames waiting to be drawn.
+        """
+        super().__init__()
+        self.renderer = renderer
+        self.frames: "queue.Queue[Optional[FrameSnapshot]]" = queue.Queue(max_queue)
+        self.dropped_frames = 0
+        self.thread = threading.Thread(target=self._draw_frames, daemon=True)
+        self.thread.start()
+
+    def _draw_frames(self):
+        while True:
+            frame = self.frames.get()
+            if frame is None:
+                return
+            self.renderer.render_snapshot(frame)
+
+    def _put(self, frame: Optional[FrameSnapshot]):
+        while True:
+            try:
+                self.frames.put_nowait(frame)
+                return
+            except queue.Full:
+                try:
+                    self.frames.get_nowait()
+                    self.dropped_frames += 1
+                except queue.Empty:
+                    pass
+
+    def render_snapshot(self, frame: FrameSnapshot) -> None:
+        """
+        Queue a captured frame for drawing.
+        """
+        self._put(frame)
+
+    def render(self, engine) -> None:
+        """
+        Queue the current state of the simulation for drawing.
+        """
+        self.render_snapshot(self.renderer.capture(engine))
+
+    def close(self) -> None:
+        """
+        Draw the remaining frames, then stop the thread and close the wrapped renderer.
+        """
+        if self.thread.is_alive():
+            self.frames.put(None)
+            self.thread.join()
+        self.renderer.close()
@@ -0,0 +1,175 @@
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+from Box2D import b2_staticBody
+
+from interphyre.engine import Box2DEngine
+from interphyre.evaluate import STATUS_NAMES, STATUS_RUNNING
+
+# Per-body features stored in Trajectory.states, in order
+BODY_FEATURES = ("x", "y", "angle", "vx", "vy", "angular_velocity")
+
+
+@dataclass
+class Trajectory:
+    """
+    Columnar record of a rollout, one row per simulated step.
+
+    Attributes:
+        body_names: Names of the recorded bodies, in column order.
+        states: (T, n_bodies, 6) array of the features in BODY_FEATURES.
+        status: (T,) int8 status codes (see interphyre.evaluate.STATUS_NAMES).
+        contact_pairs: Contact pairs tracked by the engine, in column order.
+        contacts: (T, n_pairs) bool, whether each pair was touching.
+        time_step: Duration of a step.
+        overlap_pairs: (sensor body, other body) pairs, in column order. Sensor
+            overlaps are not contacts, e.g. a ball inside a basket's sensor.
+        overlaps: (T, n_overlap_pairs) bool, whether each body overlapped the
+            sensor fixture.
+    """
+
+    body_names: List[str]
+    states: np.ndarray
+    status: np.ndarray
+    contact_pairs: List[Tuple[str, str]]
+    contacts: np.ndarray
+    time_step: float
+    overlap_pairs: List[Tuple[str, str]] = field(default_factory=list)
+    overlaps: np.ndarray = field(default_factory=lambda: np.zeros((0, 0), dtype=bool))
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    @property
+    def times(self) -> np.ndarray:
+        """Simulated time at the end of each recorded step."""
+        return np.arange(1, len(self) + 1) * self.time_step
+
+    def body(self, name: str) -> np.ndarray:
+        """Return the (T, 6) states of one body."""
+        return self.states[:, self.body_names.index(name)]
+
+    def status_names(self) -> List[str]:
+        return [STATUS_NAMES[code] for code in self.status]
+
+    def save(self, path: str):
+        """Save the trajectory to a compressed .npz file."""
+        np.savez_compressed(
+            path,
+            body_names=np.array(self.body_names),
+            states=self.states,
+            status=self.status,
+            contact_pairs=np.array(self.contact_pairs, dtype=str).reshape(-1, 2),
+            contacts=self.contacts,
+            time_step=self.time_step,
+            overlap_pairs=np.array(self.overlap_pairs, dtype=str).reshape(-1, 2),
+            overlaps=self.overlaps,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "Trajectory":
+        with np.load(path) as data:
+            return cls(
+                body_names=data["body_names"].tolist(),
+                states=data["states"],
+                status=data["status"],
+                contact_pairs=[tuple(pair) for pair in data["contact_pairs"].tolist()],
+                contacts=data["contacts"],
+                time_step=float(data["time_step"]),
+                # Files saved before overlaps were recorded have no overlap columns
+                overlap_pairs=[
+                    tuple(pair) for pair in data["overlap_pairs"].tolist()
+                ]
+                if "overlap_pairs" in data
+                else [],
+                overlaps=data["overlaps"]
+                if "overlaps" in data
+                else np.zeros((len(data["states"]), 0), dtype=bool),
+            )
+
+
+class TrajectoryRecorder:
+    """
+    Record body states into preallocated arrays while an engine is stepped.
+
+    Create the recorder after the action objects are placed, then call record()
+    once after every step and finish() at the end of the rollout.
+    """
+
+    def __init__(
+        self,
+        engine: Box2DEngine,
+        max_steps: int,
+        time_step: float,
+        bodies: Optional[Sequence[str]] = None,
+        dtype=np.float32,
+    ):
+        """
+        Parameters:
+            engine (Box2DEngine): Engine to record.
+            max_steps (int): Maximum number of steps that will be recorded.
+            time_step (float): Duration of a step.
+            bodies (Optional[Sequence[str]]): Names of the bodies to record.
+                Defaults to every body that is not static. Overlaps of these
+                bodies with every sensor fixture (e.g. basket interiors) are
+                recorded as well.
+            dtype: Floating point type of the states array.
+        """
+        if bodies is None:
+            bodies = [
+                name
+                for name, body in engine.bodies.items()
+                if body.type != b2_staticBody
+            ]
+        self.engine = engine
+        self.body_names = list(bodies)
+        self._bodies = [engine.bodies[name] for name in self.body_names]
+        self.contact_pairs = list(engine.contact_listener.pairs)
+        self.time_step = time_step
+        self.states = np.zeros(
+            (max_steps, len(self.body_names), len(BODY_FEATURES)), dtype=dtype
+        )
+        self.status = np.full(max_steps, STATUS_RUNNING, dtype=np.int8)
+        self.contacts = np.zeros((max_steps, len(self.contact_pairs)), dtype=bool)
+        self.overlap_pairs = [
+            (sensor_body, name)
+            for sensor_body in engine.sensor_fixtures
+            for name in self.body_names
+            if name != sensor_body
+        ]
+        self.overlaps = np.zeros((max_steps, len(self.overlap_pairs)), dtype=bool)
+        self.num_steps = 0
+
+    def record(self, status: int = STATUS_RUNNING):
+        """Record the current state of the engine as the next step."""
+        t = self.num_steps
+        if t >= len(self.states):
+            raise ValueError(f"Recorder is full after {t} steps.")
+        row = self.states[t]
+        for j, body in enumerate(self._bodies):
+            x, y = body.position
+            vx, vy = body.linearVelocity
+            row[j] = (x, y, body.angle, vx, vy, body.angularVelocity)
+        self.status[t] = status
+        n_pairs = len(self.contact_pairs)
+        if n_pairs:
+            self.contacts[t] = self.engine.contact_listener.touching[:n_pairs]
+        if self.overlap_pairs:
+            overlaps = self.engine.contact_listener.overlaps
+            if overlaps:
+                self.overlaps[t] = [pair in overlaps for pair in self.overlap_pairs]
+        self.num_steps = t + 1
+
+    def finish(self) -> Trajectory:
+        """Return the recorded steps as a Trajectory."""
+        t = self.num_steps
+        return Trajectory(
+            body_names=self.body_names,
+            states=self.states[:t],
+            status=self.status[:t],
+            contact_pairs=self.contact_pairs,
+            contacts=self.contacts[:t],
+            time_step=self.time_step,
+            overlap_pairs=self.overlap_pairs,
+            overlaps=self.overlaps[:t],
+        )
@@ -0,0 +1,230 @@
+"""
+Vectorized validity checks of level layouts stored in an ObjectTable.
+
+Objects are decomposed into circles and oriented boxes. Candidate pairs come
+from a sweep-and-prune over the x extents of the shapes' bounding boxes, sorted
+per level variant, and are then tested exactly. This checks all variants of a
+table at once, so batches of generated seeds can be screened quickly.
+"""
+
+import numpy as np
+
+from interphyre.geometry import BASKET_WALL_ANGLE, to_local
+from interphyre.objects import OBJECT_TYPES, Ball, Bar, Basket, ObjectTable
+
+# Objects must lie within [-WORLD_BOUND, WORLD_BOUND] on both axes
+WORLD_BOUND = 5.0
+
+_BALL = OBJECT_TYPES.index(Ball)
+_BAR = OBJECT_TYPES.index(Bar)
+_BASKET = OBJECT_TYPES.index(Basket)
+
+
+def table_shapes(table: ObjectTable, rows: np.ndarray):
+    """
+    Decompose the given rows of a table into primitive shapes.
+
+    Returns:
+        owner: (S,) table row of each shape.
+        kind: (S,) bool, True for circles and False for boxes.
+        shapes: (S, 5) array of (x, y, half width, half height, angle in radians).
+            Circles store their radius as the half width and half height.
+    """
+    rows = np.asarray(rows)
+    types = table.type[rows]
+    parts = []
+
+    balls = rows[types == _BALL]
+    r = table.radius[balls]
+    parts.append((balls, np.stack([table.x[balls], table.y[balls], r, r, 0 * r], -1)))
+
+    bars = rows[types == _BAR]
+    parts.append(
+        (
+            bars,
+            np.stack(
+                [
+                    table.x[bars],
+                    table.y[bars],
+                    table.length[bars] / 2,
+                    table.thickness[bars] / 2,
+                    np.radians(table.angle[bars]),
+                ],
+                -1,
+            ),
+        )
+    )
+
+    baskets = rows[types == _BASKET]
+    if len(baskets):
+        # Same geometry as create_basket and geometry.basket_boxes, for many scales
+        scale = table.scale[baskets]
+        width = np.round(1.083 * scale, 2)
+        height = np.round(1.67 * scale, 2)
+        thickness = np.round(0.05 + 0.1 * np.sqrt(scale), 2)
+        theta = BASKET_WALL_ANGLE
+        wall_x = width / 2 - thickness / 2 + np.cos(theta) * thickness
+        wall_half_height = height / 2 + thickness / 2
+        zero = np.zeros_like(scale)
+        local = np.stack(
+            [
+                np.stack([zero, zero, width / 2, thickness / 2, zero], -1),
+                np.stack(
+                    [-wall_x, height / 2, thickness / 2, wall_half_height, zero + theta],
+                    -1,
+                ),
+                np.stack(
+                    [wall_x, height / 2, thickness / 2, wall_half_height, zero - theta],
+                    -1,
+                ),
+            ],
+            1,
+        )
+        angle = np.radians(table.angle[baskets])[:, None]
+        c, s = np.cos(angle), np.sin(angle)
+        boxes = local.copy()
+        boxes[..., 0] = table.x[baskets, None] + c * local[..., 0] - s * local[..., 1]
+        boxes[..., 1] = table.y[baskets, None] + s * local[..., 0] + c * local[..., 1]
+        boxes[..., 4] += angle
+        parts.append((np.repeat(baskets, 3), boxes.reshape(-1, 5)))
+
+    owner = np.concatenate([p[0] for p in parts])
+    shapes = np.concatenate([p[1] for p in parts]).reshape(-1, 5)
+    kind = np.concatenate(
+        [np.ones(len(balls), dtype=bool), np.zeros(len(owner) - len(balls), dtype=bool)]
+    )
+    return owner, kind, shapes
+
+
+def shape_aabbs(kind: np.ndarray, shapes: np.ndarray) -> np.ndarray:
+    """(S, 4) bounding boxes (xmin, ymin, xmax, ymax) of the shapes."""
+    c = np.abs(np.cos(shapes[:, 4]))
+    s = np.abs(np.sin(shapes[:, 4]))
+    ex = np.where(kind, shapes[:, 2], c * shapes[:, 2] + s * shapes[:, 3])
+    ey = np.where(kind, shapes[:, 3], s * shapes[:, 2] + c * shapes[:, 3])
+    x, y = shapes[:, 0], shapes[:, 1]
+    return np.stack([x - ex, y - ey, x + ex, y + ey], -1)
+
+
+def _sweep_and_prune(level: np.ndarray, aabbs: np.ndarray) -> np.ndarray:
+    """Pairs of shapes of the same level whose bounding boxes overlap, as (P, 2) indices."""
+    # Sort by level, then xmin. Levels are separated by more than any x extent.
+    span = float(np.ptp(aabbs[:, [0, 2]])) + 1 if len(aabbs) else 1
+    key = level * span + (aabbs[:, 0] - aabbs[:, 0].min(initial=0))
+    order = np.argsort(key, kind="stable")
+    sorted_key = key[order]
+    end_key = level[order] * span + (aabbs[order, 2] - aabbs[:, 0].min(initial=0))
+    # Every shape is paired with the following shapes that start before it ends
+    stop = np.searchsorted(sorted_key, end_key, side="right")
+    start = np.arange(len(order)) + 1
+    counts = np.maximum(stop - start, 0)
+    first = np.repeat(np.arange(len(order)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    second = np.repeat(start, counts) + offsets
+    a, b = order[first], order[second]
+    y_overlap = (aabbs[a, 1] <= aabbs[b, 3]) & (aabbs[b, 1] <= aabbs[a, 3])
+    return np.stack([a[y_overlap], b[y_overlap]], -1)
+
+
+def _penetration(kind_a, kind_b, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Penetration depth of pairs of shapes, positive when they overlap."""
+    depth = np.empty(len(a))
+
+    both_circles = kind_a & kind_b
+    d = np.hypot(a[:, 0] - b[:, 0], a[:, 1] - b[:, 1])
+    depth[both_circles] = (a[:, 2] + b[:, 2] - d)[both_circles]
+
+    # Circle against box: radius minus the signed distance to the box
+    mixed = kind_a != kind_b
+    circle = np.where(kind_a[:, None], a, b)[mixed]
+    box = np.where(kind_a[:, None], b, a)[mixed]
+    q = np.abs(to_local(circle[:, :2], box[:, :2], box[:, 4])) - box[:, 2:4]
+    distance = np.hypot(np.maximum(q[:, 0], 0), np.maximum(q[:, 1], 0)) + np.minimum(
+        q.max(-1), 0
+    )
+    depth[mixed] = circle[:, 2] - distance
+
+    # Box against box: separating axis test over the four face normals
+    boxes = ~(kind_a | kind_b)
+    ba, bb = a[boxes], b[boxes]
+    axes = np.stack(
+        [
+            np.stack([np.cos(ba[:, 4]), np.sin(ba[:, 4])], -1),
+            np.stack([-np.sin(ba[:, 4]), np.cos(ba[:, 4])], -1),
+            np.stack([np.cos(bb[:, 4]), np.sin(bb[:, 4])], -1),
+            np.stack([-np.sin(bb[:, 4]), np.cos(bb[:, 4])], -1),
+        ],
+        1,
+    )  # (P, 4, 2)
+
+    def radius(box, axes_of_box):
+        return box[:, None, 2] * np.abs(
+            np.einsum("pk,pak->pa", axes_of_box[:, 0], axes)
+        ) + box[:, None, 3] * np.abs(np.einsum("pk,pak->pa", axes_of_box[:, 1], axes))
+
+    offset = np.abs(np.einsum("pk,pak->pa", bb[:, :2] - ba[:, :2], axes))
+    overlap = radius(ba, axes[:, :2]) + radius(bb, axes[:, 2:]) - offset
+    depth[boxes] = overlap.min(-1)
+    return depth
+
+
+def find_overlaps(
+    table: ObjectTable, tolerance: float = 1e-3, include_static: bool = False
+) -> np.ndarray:
+    """
+    Find pairs of objects that interpenetrate by more than tolerance.
+
+    Action objects are skipped, their positions are chosen by the action. Pairs
+    of static objects are skipped unless include_static is set, since Box2D never
+    resolves contacts between them.
+
+    Returns:
+        np.ndarray: (P, 2) table rows of the overlapping pairs, each pair once.
+    """
+    rows = np.flatnonzero(~table.action)
+    owner, kind, shapes = table_shapes(table, rows)
+    pairs = _sweep_and_prune(table.level[owner], shape_aabbs(kind, shapes))
+    a, b = pairs[:, 0], pairs[:, 1]
+    keep = owner[a] != owner[b]
+    if not include_static:
+        keep &= table.dynamic[owner[a]] | table.dynamic[owner[b]]
+    a, b = a[keep], b[keep]
+    depth = _penetration(kind[a], kind[b], shapes[a], shapes[b])
+    hit = depth > tolerance
+    found = np.sort(np.stack([owner[a[hit]], owner[b[hit]]], -1), axis=1)
+    return np.unique(found, axis=0) if len(found) else found.reshape(0, 2)
+
+
+def find_out_of_bounds(table: ObjectTable) -> np.ndarray:
+    """
+    Find objects outside the world.
+
+    Dynamic objects must lie entirely within the walls. Static objects may extend
+    past them, which levels use to hide parts of the geometry, but must not lie
+    entirely outside.
+
+    Returns:
+        np.ndarray: Table rows of the offending objects.
+    """
+    rows = np.flatnonzero(~table.action)
+    owner, kind, shapes = table_shapes(table, rows)
+    aabbs = shape_aabbs(kind, shapes)
+    # Bounds of each object, as the union of the bounds of its shapes
+    lo = np.full((len(table), 2), np.inf)
+    hi = np.full((len(table), 2), -np.inf)
+    np.minimum.at(lo, owner, aabbs[:, :2])
+    np.maximum.at(hi, owner, aabbs[:, 2:])
+    lo, hi = lo[rows], hi[rows]
+    partly_outside = np.any((lo < -WORLD_BOUND) | (hi > WORLD_BOUND), axis=1)
+    fully_outside = np.any((hi < -WORLD_BOUND) | (lo > WORLD_BOUND), axis=1)
+    bad = np.where(table.dynamic[rows], partly_outside, fully_outside)
+    return rows[bad]
+
+
+def validate_table(table: ObjectTable, tolerance: float = 1e-3) -> np.ndarray:
+    """Return a (num_levels,) bool array, True for the valid level variants."""
+    valid = np.ones(table.num_levels, dtype=bool)
+    overlaps = find_overlaps(table, tolerance)
+    valid[table.level[overlaps[:, 0]]] = False
+    valid[table.level[find_out_of_bounds(table)]] = False
+    return valid
@@ -0,0 +1,33 @@
+import importlib.util
+import os
+
+import pytest
+
+BENCHMARKS = os.path.join(os.path.dirname(os.path.dirname(__file__)), "benchmarks")
+
+
+def load_benchmark(name: str):
+    spec = importlib.util.spec_from_file_location(
+        name, os.path.join(BENCHMARKS, f"{name}.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_import_time(capsys):
+    benchmark = load_benchmark("import_time")
+    with pytest.raises(SystemExit) as exit_info:
+        benchmark.main(["--repeats", "1", "--budget-ms", "60000"])
+    assert exit_info.value.code == 0, capsys.readouterr().out
+
+
+def test_level_generation(tmp_path, capsys):
+    benchmark = load_benchmark("level_generation")
+    report = tmp_path / "report.json"
+    with pytest.raises(SystemExit) as exit_info:
+        benchmark.main(
+            ["--levels", "seesaw", "zebra_gate", "--seeds", "2", "--json", str(report)]
+        )
+    assert exit_info.value.code == 0, capsys.readouterr().out
+    assert report.exists()
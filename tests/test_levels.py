@@ -0,0 +1,70 @@
+import warnings
+
+import pytest
+
+from interphyre.level import Level
+from interphyre.levels import (
+    BATCH_BLOCK_SIZE,
+    _level_modules,
+    _level_registry,
+    generate_levels,
+    is_vectorized,
+    levels_from_table,
+    list_levels,
+    load_level,
+    load_variant,
+    register_level,
+)
+
+
+@pytest.fixture
+def custom_level():
+    yield "custom_level"
+    _level_registry.pop("custom_level", None)
+    _level_modules.pop("custom_level", None)
+
+
+def build_custom(seed=None):
+    return Level(
+        name="custom_level",
+        objects={},
+        action_objects=[],
+        success_condition=lambda engine: False,
+    )
+
+
+def test_register_level_uses_the_given_name(custom_level):
+    register_level(custom_level)(build_custom)
+    assert custom_level in list_levels()
+    assert load_level(custom_level, 0, use_cache=False).name == custom_level
+
+
+def test_register_level_rejects_duplicates(custom_level):
+    register_level(custom_level)(build_custom)
+    with pytest.raises(ValueError):
+        register_level(custom_level)(build_custom)
+
+
+def test_register_level_rejects_builtin_names():
+    load_level("seesaw", 0)
+    with pytest.raises(ValueError):
+        register_level("seesaw")(build_custom)
+    with pytest.raises(ValueError):
+        register_level("catapult")(build_custom)
+
+
+def test_generate_levels_rows_match_load_variant():
+    table = generate_levels("flagpole_sitta", 5, seed=3, start=BATCH_BLOCK_SIZE - 2)
+    for i, level in enumerate(levels_from_table("flagpole_sitta", table)):
+        variant = load_variant("flagpole_sitta", 3, BATCH_BLOCK_SIZE - 2 + i)
+        assert level.to_dict() == variant.to_dict()
+
+
+def test_generate_levels_warns_for_scalar_families():
+    assert not is_vectorized("zebra_gate")
+    with pytest.warns(RuntimeWarning):
+        table = generate_levels("zebra_gate", 2, seed=0)
+    assert table.num_levels == 2
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        generate_levels("the_funnel", 2, seed=0)